@@ -1,12 +1,20 @@
 # -*- mode: python ; coding: utf-8 -*-
 
+import os
+import sys
+
+# The games are imported by name when first played (source/game_registry.py), which PyInstaller cannot follow:
+# their modules are listed from the registry, and PyInstaller follows their own imports
+sys.path.insert(0, os.path.join(SPECPATH, 'source'))
+from game_registry import playable_games  # noqa: E402
+
 
 a = Analysis(
     ['source\\__main__.py'],
-    pathex=[],
+    pathex=[os.path.join(SPECPATH, 'source')],
     binaries=[],
     datas=[('source/assets','assets')],
-    hiddenimports=[],
+    hiddenimports=[game.module for game in playable_games()],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
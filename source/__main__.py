@@ -5,24 +5,56 @@
 Application Entry Point
 """
 
-# Import your tkinter window class
-from main_application import MainApplication
-
-
-def main():
+import importlib
+import os
+import sys
+from typing import List, Optional
+
+# Allow running the application with `python -m source` as well as `python source/__main__.py`
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Command line tools, imported only when called
+COMMANDS = {
+    "analytics": "tools.analytics",
+    "benchmark": "tools.benchmark",
+    "build-atlas": "tools.build_atlas",
+    "build-voice": "tools.build_voice",
+    "check-french-numbers": "tools.check_french_numbers",
+    "prerender": "tools.prerender",
+    "startup-report": "tools.startup_report",
+}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
     """
-    Runs the main application.
+    Runs the main application, or the command line tool given as first argument.
+
+    Args:
+        argv (Optional[List[str]]): The command line arguments. Defaults to sys.argv.
 
     Returns:
-        None
+        int: The exit code.
 
     Examples:
         >>> main()
+        >>> main(["build-voice"])
+        >>> main(["startup-report", "--budget", "1.5"])
     """
 
+    argv = sys.argv[1:] if argv is None else argv
+
+    if argv and argv[0] in COMMANDS:
+        return importlib.import_module(COMMANDS[argv[0]]).main(argv[1:])
+
+    from main_application import MainApplication
+
     app = MainApplication()
+    app.update()  # Show the subject menu right away, then warm up the games while it is shown
+    app.start_warmup()
+    app.watchdog.start()
     app.mainloop()
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -3,6 +3,7 @@ Project Constants
 """
 
 import os
+from typing import List, Tuple
 
 dirname = os.path.dirname(__file__)
 
@@ -47,8 +48,104 @@ EQUAL_IMAGE_PTH: str = image_path("equal.png")
 GREATER_IMAGE_PTH: str = image_path("greater.png")
 LOWER_IMAGE_PTH: str = image_path("lower.png")
 
-# Created file paths
-RANDOM_NUMBER_SOUND_PATH = "random_number.mp3"
+# Image atlas (every variant shown by the components, packed at build time by `build-atlas`)
+ATLAS_PATH: str = image_path("atlas.png")
+ATLAS_INDEX_PATH: str = image_path("atlas.json")
+ATLAS_VARIANTS: List[Tuple[str, Tuple[int, int], int]] = [  # (path, size, rotation)
+    (MATHEMATICS_IMAGE_PATH, (80, 80), 0),
+    (SPELLING_IMAGE_PATH, (80, 80), 0),
+    (TRAFFIC_CONE_IMAGE_PATH, (80, 80), 0),
+    (SOUND_IMAGE_PATH, (70, 70), 0),
+    (QUESTION_MARK_IMAGE_PATH, (70, 70), 0),
+    (LOWER_IMAGE_PTH, (70, 70), 0),
+    (EQUAL_IMAGE_PTH, (70, 70), 0),
+    (GREATER_IMAGE_PTH, (70, 70), 0),
+    (MAGNIFYING_GLASS_IMAGE_PATH, (50, 50), 0),
+    (CHECK_IMAGE_PATH, (50, 50), 0),
+    (REFRESH_IMAGE_PATH, (50, 50), 0),
+    (WARNING_IMAGE_PATH, (50, 50), 0),
+    (ARROW_IMAGE_PATH, (40, 40), 180),
+    (SOUND_IMAGE_PATH, (20, 20), 0),
+    (GREATER_EQUAL_IMAGE_PATH, (20, 20), 0),
+]
+ATLAS_WIDTH: int = 256  # Width of the atlas (px), the height grows with the variants
+
+# Per-user directories
+APP_DIR_NAME: str = "Apprends_et_Joue"
+TTS_CACHE_DIR_NAME: str = "tts"
+ATTEMPT_LOG_NAME: str = "attempts.sqlite3"  # In the per-user data directory
+ANALYTICS_CACHE_DIR_NAME: str = "analytics"  # Column snapshots of the attempt logs, in the cache directory
+
+# Speech settings
+SPEECH_POLL_INTERVAL: int = 50  # Delay (ms) between two checks of the speech results
+SPEECH_LANG: str = "fr"
+SPEECH_SLOW: bool = True
+TTS_CACHE_MAX_BYTES: int = 50 * 1024 * 1024  # Budget of the on-disk clip cache (~10 000 short clips)
+TTS_CACHE_INDEX_NAME: str = "index.sqlite3"  # Index of the clip cache, shared by the running instances
+TTS_CLAIM_TIMEOUT: float = 15.0  # Longest time (s) an instance waits for a clip synthesized by another one
+TTS_CLAIM_POLL_INTERVAL: float = 0.05  # Delay (s) between two checks of a clip synthesized by another instance
+TTS_TOUCH_INTERVAL: float = 30.0  # Delay (s) between two writes of the last uses of the clips read
+TTS_TOUCH_TIMEOUT: float = 0.1  # Longest wait (s) for the shared index when writing the last uses
+ROUND_PREFETCH_DEPTH: int = 2  # Number of rounds synthesized ahead of the current one
+TTS_BACKEND: str = "auto"  # "gtts", "concatenative", "pack", "silent", or "auto" (pack, offline voice, then gTTS)
+
+# Number words
+FRENCH_WORDS_CACHE_SIZE: int = 4096  # Number of recent number-to-words conversions kept in memory
+
+# Startup
+STARTUP_BUDGET: float = 1.5  # Largest time (s) from the process start to the first paint of the subject menu
+
+# Warm-up (while the subject menu is shown)
+WARMUP_POLL_INTERVAL: int = 50  # Delay (ms) between two checks of the background warm-up steps
+WARMUP_CLIP_COUNT: int = 21  # Numbers synthesized and decoded ahead (0 to 20, asked at every level)
+
+# Attempt log
+ATTEMPT_BATCH_SIZE: int = 256  # Largest number of attempts written in one transaction
+ATTEMPT_FLUSH_INTERVAL: float = 1.0  # Longest delay (s) before a recorded attempt is written (lost on a crash)
+
+# Learning analytics
+ANALYTICS_RANGES: List[Tuple[str, int]] = [  # Label and first value of the last two digits of the numbers
+    ("0-16", 0),  # Single words (zéro to seize)
+    ("17-69", 17),  # Tens and units (dix-sept, vingt-et-un...)
+    ("70-79", 70),  # Soixante-dix...
+    ("80-99", 80),  # Quatre-vingt...
+]
+ANALYTICS_PERCENTILES: List[int] = [50, 90, 99]  # Percentiles of the response times
+ANALYTICS_HARDEST_COUNT: int = 10  # Numbers listed as the hardest
+ANALYTICS_MIN_ATTEMPTS: int = 3  # Attempts needed for a number to be ranked among the hardest
+
+# Tracing
+TRACE_ENV_VAR: str = "APPRENDS_ET_JOUE_TRACE"  # Path of the trace file (Chrome trace format), tracing is off if unset
+TRACE_OWNER_ENV_VAR: str = "APPRENDS_ET_JOUE_TRACE_OWNER"  # Process writing the trace file, set by the tracer
+
+# Event loop watchdog
+WATCHDOG_INTERVAL: int = 100  # Delay (ms) between two heartbeats of the event loop
+WATCHDOG_THRESHOLD: int = 250  # Lag (ms) of the heartbeat from which the window is reported frozen
+
+# Screens
+SCREEN_CACHE_SIZE: int = 8  # Number of visited screens kept alive (the games are always built again)
+
+# Games
+DIFFICULTY_LEVELS: List[int] = [10, 20, 50, 100, 1000, 10000, 100000, 1000000]  # Largest number of each level
+DIGITS: str = "0123456789"  # Characters expected in the answers written in digits
+
+# Review scheduler (spaced repetition of the numbers)
+REVIEW_BASE_INTERVAL: float = 30.0  # Delay (s) before the review of a number answered wrong
+REVIEW_MAX_STREAK: int = 10  # Correct answers in a row after which the review interval stops doubling
+REVIEW_ERROR_WEIGHT: float = 4.0  # How much the error rate of a number shortens its review interval
+SCHEDULER_DENSE_LIMIT: int = 10_001  # Largest level whose statistics are allocated for every number
+
+# Audio output
+AUDIO_BUFFER_SIZE: int = 512  # Mixer buffer (samples): ~23 ms of latency at VOICE_SAMPLE_RATE
+AUDIO_CACHE_SIZE: int = 64  # Number of decoded clips kept in memory
+
+# Clip pack (clips prerendered with `prerender --pack`, read through a memory map)
+CLIP_PACK_PATH: str = os.path.join(dirname, "assets", "clips.pack")
+
+# Offline voice (morpheme clips, 16-bit mono PCM)
+VOICE_DIR: str = os.path.join(dirname, "assets", "voice")
+VOICE_SAMPLE_RATE: int = 22050
+VOICE_GAP_MS: int = 30  # Silence between two morphemes
 
 # Application titles
 APP_TITLE: str = "Apprends & Joue"
@@ -57,6 +154,8 @@ MATHEMATICS_TITLE: str = "Mathématiques"
 SPELLING_TITLE: str = "Français"
 DIFFICULTY_TITLE: str = "Choix du niveau"
 WORK_IN_PROGRESS_TITLE: str = "Travaux en cours..."
+REPORT_TITLE: str = "Mes progrès"
+WARMUP_STATUS_TEXT: str = "Préparation des jeux…"  # Followed by the progress of the warm-up
 
 # Theme Colors (try http://colormind.io/bootstrap/)
 LIGHT_SHADE_COLOR: str = "#F4F5F5"
@@ -79,4 +178,5 @@ HEADER_BACKGROUND: str = LIGHT_ACCENT_COLOR
 FONT_NAME: str = "Roboto"
 TITLE_FONT_SIZE: int = 24
 TEXT_FONT_SIZE: int = 18
+SMALL_FONT_SIZE: int = 14
 FONT_COLOR: str = DARK_SHADE_COLOR
@@ -0,0 +1,197 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Audio Engine
+"""
+
+import io
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from _constants import AUDIO_BUFFER_SIZE, AUDIO_CACHE_SIZE, VOICE_SAMPLE_RATE
+from utils import tracing
+
+if TYPE_CHECKING:
+    import pygame
+
+
+class AudioEngine:
+    """
+    Represents the audio output of the application.
+
+    The AudioEngine class initializes the pygame mixer once, decodes the clips into PCM sounds once,
+    and keeps the most recently played sounds in a bounded cache, so that a replayed clip starts
+    without any initialization or decoding cost. pygame is only imported when the mixer is started.
+    """
+
+    def __init__(self, capacity: int = AUDIO_CACHE_SIZE):
+        """
+        Initialize the AudioEngine.
+
+        Args:
+            capacity: The maximum number of decoded sounds kept in memory.
+        """
+
+        self.capacity = capacity
+        self.sounds = OrderedDict()  # key -> pygame.mixer.Sound, from the least to the most recently played
+        self.channel = None
+        self.lock = threading.Lock()
+
+        self.plays = 0
+        self.decodes = 0
+        self.last_latency = None  # Time to first sample of the last playback, in milliseconds
+        self.max_latency = 0.0
+
+    def start(self) -> bool:
+        """
+        Initialize the mixer, if it is not initialized yet.
+
+        Returns:
+            bool: True if the mixer is initialized, False if no audio device is available.
+        """
+
+        import pygame
+
+        with self.lock:
+            if not pygame.mixer.get_init():
+                try:
+                    pygame.mixer.init(frequency=VOICE_SAMPLE_RATE, size=-16,
+                                      channels=1, buffer=AUDIO_BUFFER_SIZE)
+                except pygame.error as error:
+                    tracing.error(f"Audio engine not started: {error!r}", "audio")
+                    return False
+            return True
+
+    def stop(self) -> None:
+        """
+        Stop the sound being played, if any.
+
+        Returns:
+            None
+        """
+
+        with self.lock:
+            if self.channel:
+                self.channel.stop()
+                self.channel = None
+
+    def quit(self) -> None:
+        """
+        Stop the playback, release the decoded sounds and close the mixer.
+
+        Returns:
+            None
+        """
+
+        self.stop()
+        with self.lock:
+            self.sounds.clear()
+            pygame = sys.modules.get("pygame")  # Not imported if no sound was played
+            if pygame and pygame.mixer.get_init():
+                pygame.mixer.quit()
+
+    def is_busy(self) -> bool:
+        """
+        Check whether a sound is being played.
+
+        Returns:
+            bool: True if a sound is being played, False otherwise.
+        """
+
+        with self.lock:
+            return bool(self.channel and self.channel.get_busy())
+
+    def load(self, key: str, clip: bytes) -> "pygame.mixer.Sound":
+        """
+        Get the decoded sound of a clip, decoding it only if it is not cached.
+
+        Args:
+            key: The key of the clip (the spoken text).
+            clip: The MP3 or WAV clip (bytes, or a view of a clip pack).
+
+        Returns:
+            pygame.mixer.Sound: The decoded sound.
+        """
+
+        import pygame
+
+        sound = self.sounds.get(key)
+        if sound is None:
+            sound = pygame.mixer.Sound(file=io.BytesIO(clip))
+            self.decodes += 1
+            self.sounds[key] = sound
+            if len(self.sounds) > self.capacity:
+                self.sounds.popitem(last=False)
+        else:
+            self.sounds.move_to_end(key)
+        return sound
+
+    def preload(self, key: str, clip: bytes) -> None:
+        """
+        Decode a clip ahead of its first playback.
+
+        Args:
+            key: The key of the clip (the spoken text).
+            clip: The MP3 or WAV clip (bytes, or a view of a clip pack).
+
+        Returns:
+            None
+        """
+
+        with self.lock:
+            self.load(key, clip)
+
+    def play(self, key: str, clip: bytes) -> float:
+        """
+        Play a clip, interrupting the sound being played.
+
+        The time to first sample is measured from the call to the start of the playback,
+        plus the length of the mixer buffer that is filled before the sound reaches the device.
+
+        Args:
+            key: The key of the clip (the spoken text).
+            clip: The MP3 or WAV clip (bytes, or a view of a clip pack).
+
+        Returns:
+            float: The time to first sample, in milliseconds.
+        """
+
+        import pygame
+
+        start = time.perf_counter()
+        if not self.start():
+            raise RuntimeError("No audio device available.")
+
+        with self.lock, tracing.span("play", "audio", key=key) as play_span:
+            if self.channel:
+                self.channel.stop()
+            self.channel = self.load(key, clip).play()
+
+            frequency, _, _ = pygame.mixer.get_init()
+            self.last_latency = (time.perf_counter() - start) * 1000 + \
+                AUDIO_BUFFER_SIZE * 1000 / frequency
+            self.max_latency = max(self.max_latency, self.last_latency)
+            self.plays += 1
+            play_span.set(latency_ms=self.last_latency)
+            return self.last_latency
+
+    def stats(self) -> dict:
+        """
+        Returns the statistics of the engine.
+
+        Returns:
+            dict: The number of playbacks, decodes and cached sounds, and the last and maximum times to first sample.
+        """
+
+        with self.lock:
+            return {
+                "plays": self.plays,
+                "decodes": self.decodes,
+                "sounds": len(self.sounds),
+                "last_latency_ms": self.last_latency,
+                "max_latency_ms": self.max_latency,
+            }
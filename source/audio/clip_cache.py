@@ -0,0 +1,458 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Clip Cache
+"""
+
+import hashlib
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple
+
+from _constants import (
+    TTS_CACHE_MAX_BYTES,
+    TTS_CACHE_DIR_NAME,
+    TTS_CACHE_INDEX_NAME,
+    TTS_CLAIM_TIMEOUT,
+    TTS_CLAIM_POLL_INTERVAL,
+    TTS_TOUCH_INTERVAL,
+    TTS_TOUCH_TIMEOUT,
+)
+from utils.user_dirs import user_cache_dir
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS clips (
+    key TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS clips_last_used ON clips (last_used);
+CREATE TABLE IF NOT EXISTS totals (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    bytes INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO totals (id, bytes) SELECT 0, IFNULL(SUM(size), 0) FROM clips;
+CREATE TRIGGER IF NOT EXISTS clips_inserted AFTER INSERT ON clips
+    BEGIN UPDATE totals SET bytes = bytes + new.size; END;
+CREATE TRIGGER IF NOT EXISTS clips_deleted AFTER DELETE ON clips
+    BEGIN UPDATE totals SET bytes = bytes - old.size; END;
+CREATE TRIGGER IF NOT EXISTS clips_resized AFTER UPDATE OF size ON clips
+    BEGIN UPDATE totals SET bytes = bytes - old.size + new.size; END;
+CREATE TABLE IF NOT EXISTS claims (
+    key TEXT PRIMARY KEY,
+    owner TEXT NOT NULL,
+    expires REAL NOT NULL
+);
+"""
+
+
+class ClipCache:
+    """
+    Represents a persistent cache of text-to-speech audio clips, shared by the instances of the application.
+
+    The ClipCache class stores the synthesized clips in a per-user cache directory, one file per clip,
+    named after a hash of (text, lang, slow) so that a clip is synthesized only once.
+    A clip file is written under a temporary name and published by an atomic rename, so that no instance
+    ever reads a truncated clip. The sizes and last uses of the clips are kept in a SQLite index shared by
+    the instances (several sessions on a classroom machine), which bounds the total size of the clips:
+    the least recently used clips are evicted first. An instance about to synthesize a clip claims it in the index,
+    so that the other instances wait for the clip instead of synthesizing it again.
+    Reading a clip never waits for the index: the last uses are kept in memory, and written with the next clip put,
+    or at most every TTS_TOUCH_INTERVAL if the index is free.
+    """
+
+    extension = ".mp3"
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        max_bytes: int = TTS_CACHE_MAX_BYTES,
+        claim_timeout: float = TTS_CLAIM_TIMEOUT,
+    ):
+        """
+        Initialize the ClipCache.
+
+        Args:
+            directory: The directory of the cache. Defaults to the per-user cache directory.
+            max_bytes: The maximum total size of the cached clips, in bytes.
+            claim_timeout: The time after which the claim of a clip expires (its owner may have crashed), in seconds.
+        """
+
+        self.directory = directory or user_cache_dir(TTS_CACHE_DIR_NAME)
+        os.makedirs(self.directory, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.claim_timeout = claim_timeout
+        self.owner = f"{os.getpid()}"
+
+        self.hits = 0
+        self.misses = 0
+
+        self.touched: Dict[str, Tuple[int, float]] = {}  # Size and last use of the clips read, not written yet
+        self.touched_at = time.monotonic()  # Last write of the last uses
+
+        self.lock = threading.Lock()  # The connection is shared by the threads of this instance
+        try:
+            self.connection = sqlite3.connect(
+                os.path.join(self.directory, TTS_CACHE_INDEX_NAME), timeout=claim_timeout,
+                isolation_level=None, check_same_thread=False)
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+            self.connection.executescript(SCHEMA)
+        except sqlite3.Error as error:
+            raise OSError(f"Clip cache index unavailable: {error}") from error
+        self.load_index()
+
+    @staticmethod
+    def key(text: str, lang: str, slow: bool) -> str:
+        """
+        Returns the key of a clip.
+
+        Args:
+            text: The spoken text.
+            lang: The language of the speech.
+            slow: Whether the speech is slow.
+
+        Returns:
+            str: The hexadecimal SHA-256 digest of the clip parameters.
+        """
+
+        return hashlib.sha256(f"{lang}\0{int(slow)}\0{text}".encode("utf-8")).hexdigest()
+
+    def path(self, key: str) -> str:
+        """
+        Returns the path of the file of a clip.
+
+        Args:
+            key: The key of the clip.
+
+        Returns:
+            str: The path of the clip file.
+        """
+
+        return os.path.join(self.directory, key + self.extension)
+
+    def load_index(self) -> None:
+        """
+        Add the clip files missing from the shared index (clips cached before the index existed),
+        and remove the temporary files left over by interrupted writes.
+
+        Returns:
+            None
+        """
+
+        entries = []
+        stale = time.time() - self.claim_timeout  # Older temporary files are not being written anymore
+        with os.scandir(self.directory) as scan:
+            for entry in scan:
+                if entry.name.endswith(".tmp"):
+                    try:
+                        if entry.stat().st_mtime < stale:
+                            os.remove(entry.path)
+                    except OSError:
+                        pass
+                elif entry.is_file() and entry.name.endswith(self.extension):
+                    stat = entry.stat()
+                    entries.append((entry.name[:-len(self.extension)], stat.st_size, stat.st_mtime))
+
+        with self.lock, self.transaction():
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO clips (key, size, last_used) VALUES (?, ?, ?)", entries)
+            self.evict()
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Run a write transaction on the shared index, committed when the context exits without error.
+
+        The transaction takes the write lock of the index at once, so that two instances never evict
+        or claim from the same snapshot.
+
+        Returns:
+            Iterator[sqlite3.Connection]: The connection, in the transaction.
+        """
+
+        self.connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield self.connection
+        except BaseException:
+            self.connection.execute("ROLLBACK")
+            raise
+        self.connection.execute("COMMIT")
+
+    def get(self, text: str, lang: str, slow: bool) -> Optional[bytes]:
+        """
+        Look up a clip in the cache.
+
+        Args:
+            text: The spoken text.
+            lang: The language of the speech.
+            slow: Whether the speech is slow.
+
+        Returns:
+            Optional[bytes]: The content of the cached clip, or None if the clip is not cached.
+        """
+
+        key = self.key(text, lang, slow)
+        data = self.read(key)
+
+        with self.lock:
+            if data is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return data
+
+    def read(self, key: str) -> Optional[bytes]:
+        """
+        Read a clip, and mark it as recently used.
+
+        Args:
+            key: The key of the clip.
+
+        Returns:
+            Optional[bytes]: The content of the clip, or None if it is not cached.
+        """
+
+        try:
+            with open(self.path(key), "rb") as file:
+                data = file.read()
+        except OSError:  # Not cached, or evicted by another instance
+            return None
+
+        with self.lock:
+            self.touched[key] = (len(data), time.time())
+            due = time.monotonic() - self.touched_at >= TTS_TOUCH_INTERVAL
+        if due:
+            self.write_touches()
+        return data
+
+    def write_touches(self) -> None:
+        """
+        Write the last uses of the clips read, if the shared index is free within TTS_TOUCH_TIMEOUT.
+
+        Returns:
+            None
+        """
+
+        with self.lock:
+            self.touched_at = time.monotonic()
+            self.connection.execute(f"PRAGMA busy_timeout = {int(TTS_TOUCH_TIMEOUT * 1000)}")
+            try:
+                with self.transaction():
+                    self.upsert_touches()
+            except sqlite3.Error:  # Index busy: the last uses are written the next time
+                pass
+            finally:
+                self.connection.execute(f"PRAGMA busy_timeout = {int(self.claim_timeout * 1000)}")
+
+    def upsert_touches(self) -> None:
+        """
+        Write the last uses of the clips read (in a write transaction), indexing the clips missing from the index.
+
+        Returns:
+            None
+        """
+
+        self.connection.executemany(
+            "INSERT INTO clips (key, size, last_used) VALUES (?, ?, ?) "
+            "ON CONFLICT (key) DO UPDATE SET last_used = MAX(last_used, excluded.last_used)",
+            [(key, size, last_used) for key, (size, last_used) in self.touched.items()])
+        self.touched.clear()
+
+    def put(self, text: str, lang: str, slow: bool, data: bytes) -> None:
+        """
+        Store a clip in the cache, evicting the least recently used clips if needed, and release its claim.
+
+        Args:
+            text: The spoken text.
+            lang: The language of the speech.
+            slow: Whether the speech is slow.
+            data: The content of the clip.
+
+        Returns:
+            None
+
+        Raises:
+            OSError: If the clip file cannot be written.
+        """
+
+        key = self.key(text, lang, slow)
+        path = self.path(key)
+
+        # Write to a temporary file first, then publish it with an atomic rename,
+        # so that no instance ever reads a truncated clip
+        descriptor, temporary_path = tempfile.mkstemp(
+            dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(data)
+            os.replace(temporary_path, path)
+        except OSError:
+            os.remove(temporary_path)
+            if not os.path.exists(path):  # Already published by another instance (locked on Windows)
+                raise
+
+        try:
+            with self.lock, self.transaction():
+                self.connection.execute(
+                    "INSERT INTO clips (key, size, last_used) VALUES (?, ?, ?) "
+                    "ON CONFLICT (key) DO UPDATE SET size = excluded.size, last_used = excluded.last_used",
+                    (key, len(data), time.time()))
+                self.connection.execute("DELETE FROM claims WHERE key = ?", (key,))
+                self.upsert_touches()  # The recency of the clips read decides which ones are evicted
+                self.evict(keep=key)
+        except sqlite3.Error:  # Index busy for too long: the published clip is indexed on the next start,
+            pass  # and the waiting instances read it before its claim expires
+
+    def claim(self, text: str, lang: str, slow: bool) -> bool:
+        """
+        Claim the synthesis of a clip, unless another instance is synthesizing it.
+
+        Args:
+            text: The spoken text.
+            lang: The language of the speech.
+            slow: Whether the speech is slow.
+
+        Returns:
+            bool: True if this instance must synthesize the clip (and put or release it), False if another one does.
+        """
+
+        key = self.key(text, lang, slow)
+        now = time.time()
+
+        try:
+            with self.lock, self.transaction():
+                self.connection.execute("DELETE FROM claims WHERE key = ? AND expires < ?", (key, now))
+                inserted = self.connection.execute(
+                    "INSERT OR IGNORE INTO claims (key, owner, expires) VALUES (?, ?, ?)",
+                    (key, self.owner, now + self.claim_timeout)).rowcount
+        except sqlite3.Error:  # Index busy for too long: synthesize the clip rather than wait
+            return True
+        return inserted == 1
+
+    def release(self, text: str, lang: str, slow: bool) -> None:
+        """
+        Release the claim of a clip that could not be synthesized.
+
+        Args:
+            text: The spoken text.
+            lang: The language of the speech.
+            slow: Whether the speech is slow.
+
+        Returns:
+            None
+        """
+
+        try:
+            with self.lock, self.transaction():
+                self.connection.execute(
+                    "DELETE FROM claims WHERE key = ? AND owner = ?", (self.key(text, lang, slow), self.owner))
+        except sqlite3.Error:  # Index busy for too long: the claim expires after its timeout
+            pass
+
+    def wait(self, text: str, lang: str, slow: bool) -> Optional[bytes]:
+        """
+        Wait for a clip claimed by another instance.
+
+        Args:
+            text: The spoken text.
+            lang: The language of the speech.
+            slow: Whether the speech is slow.
+
+        Returns:
+            Optional[bytes]: The content of the clip, or None if its claim was released or expired without it.
+        """
+
+        key = self.key(text, lang, slow)
+        deadline = time.monotonic() + self.claim_timeout
+
+        while time.monotonic() < deadline:
+            data = self.read(key)
+            if data is not None:
+                with self.lock:
+                    self.hits += 1
+                return data
+
+            with self.lock:
+                claimed = self.connection.execute(
+                    "SELECT 1 FROM claims WHERE key = ? AND expires >= ?", (key, time.time())).fetchone()
+            if not claimed:
+                return self.read(key)
+            time.sleep(TTS_CLAIM_POLL_INTERVAL)
+
+        return None
+
+    def evict(self, keep: Optional[str] = None) -> None:
+        """
+        Remove the least recently used clips until the cache fits in its byte budget (in a write transaction).
+
+        Args:
+            keep: The key of a clip that must not be evicted.
+
+        Returns:
+            None
+        """
+
+        (total_bytes,) = self.connection.execute("SELECT bytes FROM totals").fetchone()
+        if total_bytes <= self.max_bytes:
+            return
+
+        evicted = []
+        for key, size in self.connection.execute("SELECT key, size FROM clips ORDER BY last_used"):
+            if total_bytes <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            try:
+                os.remove(self.path(key))
+            except OSError:  # Already removed, or still being played on Windows
+                pass
+            evicted.append((key,))
+            total_bytes -= size
+
+        self.connection.executemany("DELETE FROM clips WHERE key = ?", evicted)
+
+    def clear(self) -> None:
+        """
+        Remove all the clips and the claims from the cache, and reset the counters.
+
+        Returns:
+            None
+        """
+
+        with self.lock, self.transaction():
+            for (key,) in self.connection.execute("SELECT key FROM clips").fetchall():
+                try:
+                    os.remove(self.path(key))
+                except OSError:
+                    pass
+            self.connection.execute("DELETE FROM clips")
+            self.connection.execute("DELETE FROM claims")
+            self.touched.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """
+        Returns the statistics of the cache.
+
+        Returns:
+            dict: The number of hits and misses of this instance, the number of clips and the total size in bytes
+                shared by every instance, and the maximum size in bytes.
+        """
+
+        with self.lock:
+            (clips,) = self.connection.execute("SELECT COUNT(*) FROM clips").fetchone()
+            (total_bytes,) = self.connection.execute("SELECT bytes FROM totals").fetchone()
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "clips": clips,
+                "bytes": total_bytes,
+                "max_bytes": self.max_bytes,
+            }
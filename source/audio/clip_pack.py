@@ -0,0 +1,181 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Clip Pack
+"""
+
+import bisect
+import mmap
+import os
+import struct
+from typing import Dict, Optional
+
+# Layout of a pack: a header, the index sorted by digest, then the clips one after the other
+MAGIC = b"AEJCLIP1"
+HEADER = struct.Struct("<8sI4x")  # Magic, number of clips
+ENTRY = struct.Struct("<16sQQ")  # Digest of the clip key, offset of the clip in the pack, length of the clip
+DIGEST_SIZE = 16  # Leading bytes of the SHA-256 digest of a clip key
+
+
+def digest(key: str) -> bytes:
+    """
+    Returns the digest of a clip key, as stored in the index of a pack.
+
+    Args:
+        key (str): The hexadecimal key of the clip (see ClipCache.key).
+
+    Returns:
+        bytes: The leading bytes of the key.
+
+    Examples:
+        >>> digest(ClipCache.key("12", "fr", True)).hex()
+        '48ef87ed7e97579823358eee6a5cf33f'
+    """
+
+    return bytes.fromhex(key)[:DIGEST_SIZE]
+
+
+def build_pack(path: str, clip_files: Dict[str, str]) -> int:
+    """
+    Write a pack from clip files, atomically.
+
+    The clips are copied one at a time, so that a pack of a million clips is built without holding them in memory.
+
+    Args:
+        path (str): The path of the pack.
+        clip_files (Dict[str, str]): The path of the file of each clip, by clip key.
+
+    Returns:
+        int: The size of the pack, in bytes.
+
+    Examples:
+        >>> build_pack(CLIP_PACK_PATH, {ClipCache.key("12", "fr", True): "12.mp3"})
+        6328
+    """
+
+    entries = sorted((digest(key), file_path, os.path.getsize(file_path)) for key, file_path in clip_files.items())
+
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    offset = HEADER.size + ENTRY.size * len(entries)
+    try:
+        with open(temporary_path, "wb") as pack:
+            pack.write(HEADER.pack(MAGIC, len(entries)))
+            for key_digest, _, length in entries:
+                pack.write(ENTRY.pack(key_digest, offset, length))
+                offset += length
+            for _, file_path, _ in entries:
+                with open(file_path, "rb") as clip:
+                    pack.write(clip.read())
+        os.replace(temporary_path, path)
+    except BaseException:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        raise
+
+    return offset
+
+
+class _Digests:
+    """
+    Represents the digests of the index of a pack, as a sequence searched in place by `bisect`.
+    """
+
+    def __init__(self, buffer: mmap.mmap, count: int):
+        """
+        Initialize the _Digests.
+
+        Args:
+            buffer: The mapped pack.
+            count: The number of clips in the pack.
+        """
+
+        self.buffer = buffer
+        self.count = count
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> bytes:
+        start = HEADER.size + index * ENTRY.size
+        return self.buffer[start:start + DIGEST_SIZE]
+
+
+class ClipPack:
+    """
+    Represents a pack of clips, read through a memory map.
+
+    The ClipPack class opens the pack once and maps it in memory: a lookup is a binary search in the index
+    and returns a view of the clip in the map, so that getting a clip costs no file open and no copy,
+    only the page faults of the pages read.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the ClipPack.
+
+        Args:
+            path: The path of the pack.
+
+        Raises:
+            OSError: If the pack cannot be opened.
+            ValueError: If the file is not a pack, or is truncated.
+        """
+
+        self.path = path
+        with open(path, "rb") as file:
+            self.buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self.count = HEADER.unpack_from(self.buffer) if len(self.buffer) >= HEADER.size else (None, 0)
+        self.index_end = HEADER.size + self.count * ENTRY.size  # Start of the clips
+        if magic != MAGIC or self.index_end > len(self.buffer):
+            self.buffer.close()
+            raise ValueError(f"{path} is not a clip pack, or is truncated.")
+
+        self.view = memoryview(self.buffer)
+        self.digests = _Digests(self.buffer, self.count)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of clips in the pack.
+
+        Returns:
+            int: The number of clips.
+        """
+
+        return self.count
+
+    def get(self, key: str) -> Optional[memoryview]:
+        """
+        Look up a clip in the pack.
+
+        Args:
+            key: The hexadecimal key of the clip (see ClipCache.key).
+
+        Returns:
+            Optional[memoryview]: A read-only view of the clip in the pack, or None if the clip is not in the pack.
+
+        Raises:
+            ValueError: If the entry of the clip points outside of the pack (corrupt index).
+        """
+
+        key_digest = digest(key)
+        index = bisect.bisect_left(self.digests, key_digest)
+        if index == self.count or self.digests[index] != key_digest:
+            return None
+
+        _, offset, length = ENTRY.unpack_from(self.buffer, HEADER.size + index * ENTRY.size)
+        if offset < self.index_end or offset + length > len(self.buffer):
+            raise ValueError(f"{self.path} is corrupt: the clip {key} is outside of the pack.")
+        return self.view[offset:offset + length]
+
+    def close(self) -> None:
+        """
+        Release the views and close the memory map.
+
+        Returns:
+            None
+        """
+
+        self.view.release()
+        self.buffer.close()
@@ -0,0 +1,72 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Round Prefetcher
+"""
+
+from collections import deque
+from typing import Callable, Optional, Tuple
+
+from _constants import ROUND_PREFETCH_DEPTH
+from audio.speech_service import SpeechService
+
+
+class RoundPrefetcher:
+    """
+    Represents a queue of the next rounds of a game, prepared ahead of time.
+
+    The RoundPrefetcher class picks the numbers of the next rounds in advance and asks the speech service
+    to synthesize them in the background, so that the clip of a round is ready when the round starts.
+    """
+
+    def __init__(
+        self,
+        speech_service: SpeechService,
+        generate: Callable[[], int],
+        depth: int = ROUND_PREFETCH_DEPTH,
+    ):
+        """
+        Initialize the RoundPrefetcher.
+
+        Args:
+            speech_service: The service used to synthesize the numbers.
+            generate: A callback function returning the number of a new round.
+            depth: The number of rounds prepared ahead of the current one.
+        """
+
+        self.speech_service = speech_service
+        self.generate = generate
+        self.depth = depth
+
+        self.rounds = deque()  # The next rounds, as {"number": int, "clip": Optional[bytes]}
+
+    def fill(self) -> None:
+        """
+        Pick the numbers of the next rounds and request their synthesis until the queue is full.
+
+        Returns:
+            None
+        """
+
+        while len(self.rounds) < self.depth:
+            upcoming = {"number": self.generate(), "clip": None}
+            self.rounds.append(upcoming)
+            self.speech_service.prefetch(
+                str(upcoming["number"]), lambda _, clip, r=upcoming: r.update(clip=clip))
+
+    def next_round(self) -> Tuple[int, Optional[bytes]]:
+        """
+        Get the next round and prepare the following ones.
+
+        Returns:
+            Tuple[int, Optional[bytes]]: The number of the round and its clip (None if not synthesized yet).
+        """
+
+        if self.rounds:
+            upcoming = self.rounds.popleft()
+        else:
+            upcoming = {"number": self.generate(), "clip": None}
+
+        self.fill()
+        return upcoming["number"], upcoming["clip"]
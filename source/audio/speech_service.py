@@ -0,0 +1,186 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Speech Service
+"""
+
+import itertools
+import queue
+import threading
+import tkinter as tk
+from typing import Callable, Optional
+
+from _constants import SPEECH_POLL_INTERVAL
+from audio.audio_engine import AudioEngine
+from audio.tts_backends import TTSBackend, create_backend
+from utils import tracing
+
+
+class SpeechService:
+    """
+    Represents a text-to-speech service running on a worker thread.
+
+    The SpeechService class owns a worker thread that synthesizes the requested texts one after the other,
+    and hands the clips to the audio engine.
+    Requests are pushed to a queue from the Tk main thread, and the results are posted back to the Tk main thread
+    through `after`, so the window stays responsive while the audio is being fetched or played.
+    The clips are synthesized and played in memory: no audio file is written outside of the clip cache.
+    Playback requests are always served before prefetch requests.
+    """
+
+    STOP_PRIORITY = 0
+    SPEAK_PRIORITY = 1
+    PREFETCH_PRIORITY = 2
+
+    def __init__(self, master: tk.Misc, audio_engine: AudioEngine, backend: Optional[TTSBackend] = None):
+        """
+        Initialize the SpeechService.
+
+        Args:
+            master: The widget used to schedule the result callbacks on the Tk main thread.
+            audio_engine: The audio engine playing the clips.
+            backend: The text-to-speech backend. Defaults to the configured backend.
+        """
+
+        self.master = master
+        self.audio_engine = audio_engine
+        self.backend = backend or create_backend()
+
+        self.requests = queue.PriorityQueue()
+        self.results = queue.Queue()
+        self.counter = itertools.count()  # Keeps the requests of a same priority in order
+
+        self.worker = None
+        self.poll_id = None
+
+    def start(self) -> None:
+        """
+        Start the worker thread and the polling of the results.
+
+        Returns:
+            None
+        """
+
+        if self.worker and self.worker.is_alive():
+            return
+
+        self.worker = threading.Thread(
+            target=self.run, name="speech-service", daemon=True)
+        self.worker.start()
+        self.poll_id = self.master.after(SPEECH_POLL_INTERVAL, self.poll)
+
+    def stop(self) -> None:
+        """
+        Stop the worker thread and the polling of the results.
+
+        The request being processed is finished, the pending ones are dropped.
+
+        Returns:
+            None
+        """
+
+        if self.poll_id:
+            self.master.after_cancel(self.poll_id)
+            self.poll_id = None
+
+        if self.worker and self.worker.is_alive():
+            self.put(self.STOP_PRIORITY, None)
+
+        tracing.instant("speech backend statistics", "tts", **self.backend.stats())
+
+    def speak(
+        self,
+        text: str,
+        callback: Optional[Callable[[str, Optional[bytes]], None]] = None,
+        clip: Optional[bytes] = None,
+    ) -> None:
+        """
+        Request the playback of a text, synthesizing it first if its clip is not given.
+
+        Args:
+            text: The text to speak.
+            callback: A callback function called on the Tk main thread once the playback of the text has started,
+                with the text and its clip (None if the synthesis failed).
+            clip: The clip of the text, if it has already been synthesized.
+
+        Returns:
+            None
+        """
+
+        self.put(self.SPEAK_PRIORITY, (text, clip, callback, True))
+
+    def prefetch(self, text: str, callback: Optional[Callable[[str, Optional[bytes]], None]] = None) -> None:
+        """
+        Request the synthesis of a text without playing it, once no playback request is pending.
+
+        Args:
+            text: The text to synthesize.
+            callback: A callback function called on the Tk main thread once the text has been synthesized,
+                with the text and its clip (None if the synthesis failed).
+
+        Returns:
+            None
+        """
+
+        self.put(self.PREFETCH_PRIORITY, (text, None, callback, False))
+
+    def put(self, priority: int, request: Optional[tuple]) -> None:
+        """
+        Push a request to the queue of the worker thread.
+
+        Args:
+            priority: The priority of the request (the lowest is served first).
+            request: The request, or None to stop the worker thread.
+
+        Returns:
+            None
+        """
+
+        self.requests.put((priority, next(self.counter), request))
+
+    def run(self) -> None:
+        """
+        Process the requests until the service is stopped (worker thread).
+
+        Returns:
+            None
+        """
+
+        while True:
+            _, _, request = self.requests.get()
+            if request is None:
+                return
+
+            text, clip, callback, play = request
+            try:
+                if not clip:
+                    with tracing.span("synthesize", "tts", text=text, backend=self.backend.name):
+                        clip = self.backend.synthesize(text)
+                if play:
+                    self.audio_engine.play(text, clip)
+            except Exception as error:  # gTTS raises on network errors, pygame on audio device errors
+                tracing.error(f'Speech of "{text}" failed: {error!r}', "tts", text=text)
+
+            if callback:
+                self.results.put((callback, (text, clip)))
+
+    def poll(self) -> None:
+        """
+        Call the callbacks of the processed requests on the Tk main thread.
+
+        Returns:
+            None
+        """
+
+        while True:
+            try:
+                callback, result = self.results.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback(*result)
+            except Exception as error:  # A failing callback must not stop the delivery of the next results
+                tracing.error(f'Speech callback of "{result[0]}" failed: {error!r}', "tts", text=result[0])
+
+        self.poll_id = self.master.after(SPEECH_POLL_INTERVAL, self.poll)
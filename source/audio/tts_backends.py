@@ -0,0 +1,448 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Text-To-Speech Backends
+"""
+
+import io
+import os
+import wave
+from typing import Dict, List, Optional
+
+from _constants import (
+    CLIP_PACK_PATH,
+    SPEECH_LANG,
+    SPEECH_SLOW,
+    TTS_BACKEND,
+    VOICE_DIR,
+    VOICE_SAMPLE_RATE,
+    VOICE_GAP_MS,
+)
+from audio.clip_cache import ClipCache
+from audio.clip_pack import ClipPack
+from utils.french_numbers import MORPHEMES, number_to_morphemes
+from utils import tracing
+
+
+class ClipNotFound(LookupError):
+    """
+    Raised by a backend that does not have the clip of a text, the next backend of a chain being asked instead.
+    """
+
+
+class TTSBackend:
+    """
+    Represents a text-to-speech backend.
+
+    A backend turns a text into an audio clip (MP3 or WAV bytes) that can be played from memory.
+    Subclasses implement `synthesize`, and raise an exception when they cannot speak a text.
+    """
+
+    name = "none"
+
+    def synthesize(self, text: str) -> bytes:
+        """
+        Synthesize a text.
+
+        Args:
+            text: The text to synthesize.
+
+        Returns:
+            bytes: The audio clip of the text.
+        """
+
+        raise NotImplementedError
+
+    def stats(self) -> dict:
+        """
+        Returns the statistics of the backend.
+
+        Returns:
+            dict: The statistics of the backend, empty by default.
+        """
+
+        return {}
+
+
+class GTTSBackend(TTSBackend):
+    """
+    Represents the Google text-to-speech backend.
+
+    The GTTSBackend class synthesizes any text with gTTS (internet access is required),
+    and keeps the synthesized clips in the clip cache. A clip claimed by another instance of the application
+    is waited for rather than requested twice.
+    """
+
+    name = "gtts"
+
+    def __init__(self, clip_cache: Optional[ClipCache] = None, lang: str = SPEECH_LANG, slow: bool = SPEECH_SLOW):
+        """
+        Initialize the GTTSBackend.
+
+        Args:
+            clip_cache: The cache of the synthesized clips. Defaults to the per-user clip cache.
+            lang: The language of the speech.
+            slow: Whether the speech is slow.
+        """
+
+        self.lang = lang
+        self.slow = slow
+
+        try:
+            self.clip_cache = clip_cache or ClipCache()
+        except OSError as error:
+            tracing.error(f"Clip cache disabled: {error!r}", "tts")
+            self.clip_cache = None
+
+    def synthesize(self, text: str) -> bytes:
+        """
+        Get the MP3 clip of a text from the clip cache, or synthesize it with gTTS.
+
+        Args:
+            text: The text to synthesize.
+
+        Returns:
+            bytes: The MP3 clip of the text.
+        """
+
+        if not self.clip_cache:
+            return self.request(text)
+
+        clip = self.clip_cache.get(text, self.lang, self.slow)
+        if clip:
+            return clip
+
+        # Another instance of the application may be synthesizing the same clip: wait for it instead
+        if not self.clip_cache.claim(text, self.lang, self.slow):
+            with tracing.span("wait for clip", "tts", text=text) as wait_span:
+                clip = self.clip_cache.wait(text, self.lang, self.slow)
+                wait_span.set(found=clip is not None)
+            if clip:
+                return clip
+
+        try:
+            clip = self.request(text)
+        except BaseException:
+            self.clip_cache.release(text, self.lang, self.slow)
+            raise
+
+        try:
+            self.clip_cache.put(text, self.lang, self.slow, clip)
+        except OSError as error:
+            self.clip_cache.release(text, self.lang, self.slow)
+            tracing.error(f"Clip cache not writable: {error!r}", "tts")
+
+        return clip
+
+    def request(self, text: str) -> bytes:
+        """
+        Synthesize a text with gTTS.
+
+        Args:
+            text: The text to synthesize.
+
+        Returns:
+            bytes: The MP3 clip of the text.
+        """
+
+        from gtts import gTTS  # Imported on the first synthesis only
+
+        # Generate a text-to-speech audio from the text
+        buffer = io.BytesIO()
+        gTTS(text=text, lang=self.lang, slow=self.slow).write_to_fp(buffer)
+        return buffer.getvalue()
+
+    def stats(self) -> dict:
+        """
+        Returns the statistics of the clip cache.
+
+        Returns:
+            dict: The statistics of the clip cache, empty if it is disabled.
+        """
+
+        return self.clip_cache.stats() if self.clip_cache else {}
+
+
+class ConcatenativeBackend(TTSBackend):
+    """
+    Represents an offline backend speaking French numbers.
+
+    The ConcatenativeBackend class loads a small bank of recorded morphemes (un, deux, ..., vingt, cent, mille, et)
+    as 16-bit mono PCM, and speaks a number by joining the PCM of its morphemes into a single WAV clip.
+    """
+
+    name = "concatenative"
+
+    def __init__(self, voice_dir: str = VOICE_DIR, gap_ms: int = VOICE_GAP_MS):
+        """
+        Initialize the ConcatenativeBackend.
+
+        Args:
+            voice_dir: The directory of the morpheme clips, one `<morpheme>.wav` file per morpheme.
+            gap_ms: The silence inserted between two morphemes, in milliseconds.
+
+        Raises:
+            OSError: If a morpheme clip is missing.
+            ValueError: If a morpheme clip is not 16-bit mono PCM at VOICE_SAMPLE_RATE.
+        """
+
+        self.morphemes: Dict[str, bytes] = {}
+        for morpheme in MORPHEMES:
+            with wave.open(os.path.join(voice_dir, f"{morpheme}.wav"), "rb") as clip:
+                if (clip.getnchannels(), clip.getsampwidth(), clip.getframerate()) != (1, 2, VOICE_SAMPLE_RATE):
+                    raise ValueError(
+                        f'Morpheme "{morpheme}" is not 16-bit mono PCM at {VOICE_SAMPLE_RATE} Hz.')
+                self.morphemes[morpheme] = clip.readframes(clip.getnframes())
+
+        self.gap = bytes(2 * VOICE_SAMPLE_RATE * gap_ms // 1000)
+
+    @staticmethod
+    def available(voice_dir: str = VOICE_DIR) -> bool:
+        """
+        Check whether the morpheme clips are bundled.
+
+        Args:
+            voice_dir: The directory of the morpheme clips.
+
+        Returns:
+            bool: True if every morpheme clip exists, False otherwise.
+        """
+
+        return all(os.path.isfile(os.path.join(voice_dir, f"{morpheme}.wav")) for morpheme in MORPHEMES)
+
+    def synthesize(self, text: str) -> bytes:
+        """
+        Speak a number by joining the clips of its morphemes.
+
+        Args:
+            text: The number to speak, written in digits.
+
+        Returns:
+            bytes: The WAV clip of the number.
+
+        Raises:
+            ValueError: If the text is not a number that can be spoken with the morphemes.
+        """
+
+        pcm = self.gap.join(self.morphemes[morpheme]
+                            for morpheme in number_to_morphemes(int(text)))
+
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as clip:
+            clip.setnchannels(1)
+            clip.setsampwidth(2)
+            clip.setframerate(VOICE_SAMPLE_RATE)
+            clip.writeframes(pcm)
+        return buffer.getvalue()
+
+
+class PackBackend(TTSBackend):
+    """
+    Represents a backend serving prerendered clips from a clip pack.
+
+    The PackBackend class looks the clips up in a pack mapped in memory, without opening any file per clip,
+    and hands out views of the pack rather than copies. It only knows the prerendered texts,
+    so it comes first in a chain of backends.
+    """
+
+    name = "pack"
+
+    def __init__(self, path: str = CLIP_PACK_PATH, lang: str = SPEECH_LANG, slow: bool = SPEECH_SLOW):
+        """
+        Initialize the PackBackend.
+
+        Args:
+            path: The path of the clip pack.
+            lang: The language of the speech of the prerendered clips.
+            slow: Whether the speech of the prerendered clips is slow.
+
+        Raises:
+            OSError: If the pack cannot be opened.
+            ValueError: If the file is not a pack, or is truncated.
+        """
+
+        self.pack = ClipPack(path)
+        self.lang = lang
+        self.slow = slow
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def available(path: str = CLIP_PACK_PATH) -> bool:
+        """
+        Check whether a clip pack is bundled.
+
+        Args:
+            path: The path of the clip pack.
+
+        Returns:
+            bool: True if the pack exists, False otherwise.
+        """
+
+        return os.path.isfile(path)
+
+    def synthesize(self, text: str) -> bytes:
+        """
+        Get the prerendered clip of a text.
+
+        Args:
+            text: The text to speak.
+
+        Returns:
+            bytes: A read-only view of the clip in the pack (bytes-like).
+
+        Raises:
+            ClipNotFound: If the text is not prerendered.
+            ValueError: If the pack is corrupt.
+        """
+
+        clip = self.pack.get(ClipCache.key(text, self.lang, self.slow))
+        if clip is None:
+            self.misses += 1
+            raise ClipNotFound(text)
+
+        self.hits += 1
+        return clip
+
+    def stats(self) -> dict:
+        """
+        Returns the statistics of the pack.
+
+        Returns:
+            dict: The number of clips in the pack, of hits and of misses.
+        """
+
+        return {"clips": len(self.pack), "hits": self.hits, "misses": self.misses}
+
+
+class SilentBackend(TTSBackend):
+    """
+    Represents a local backend speaking every text as a short silence.
+
+    The SilentBackend class stands in for the real voices where no voice is available or wanted
+    (benchmarks, machines without audio output).
+    """
+
+    name = "silent"
+
+    def __init__(self, duration_ms: int = 100):
+        """
+        Initialize the SilentBackend.
+
+        Args:
+            duration_ms: The duration of the silence.
+        """
+
+        self.silence = b"\0\0" * (VOICE_SAMPLE_RATE * duration_ms // 1000)
+
+    def synthesize(self, text: str) -> bytes:
+        """
+        Returns the same silent clip for any text.
+
+        Args:
+            text: The text to synthesize.
+
+        Returns:
+            bytes: The WAV clip of the silence.
+        """
+
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as clip:
+            clip.setnchannels(1)
+            clip.setsampwidth(2)
+            clip.setframerate(VOICE_SAMPLE_RATE)
+            clip.writeframes(self.silence)
+        return buffer.getvalue()
+
+
+class FallbackBackend(TTSBackend):
+    """
+    Represents a chain of backends.
+
+    The FallbackBackend class asks each of its backends in turn, until one of them can speak the text.
+    """
+
+    name = "fallback"
+
+    def __init__(self, backends: List[TTSBackend]):
+        """
+        Initialize the FallbackBackend.
+
+        Args:
+            backends: The backends, from the preferred to the last resort.
+        """
+
+        self.backends = backends
+
+    def synthesize(self, text: str) -> bytes:
+        """
+        Synthesize a text with the first backend able to speak it.
+
+        Args:
+            text: The text to synthesize.
+
+        Returns:
+            bytes: The audio clip of the text.
+
+        Raises:
+            Exception: The error of the last backend, if none of them can speak the text.
+        """
+
+        for backend in self.backends[:-1]:
+            try:
+                return backend.synthesize(text)
+            except ClipNotFound:  # Expected, not every text is prerendered
+                continue
+            except Exception as error:
+                tracing.error(f'Speech of "{text}" not synthesized with {backend.name}: {error!r}', "tts",
+                              text=text, backend=backend.name)
+        return self.backends[-1].synthesize(text)
+
+    def stats(self) -> dict:
+        """
+        Returns the statistics of the backends.
+
+        Returns:
+            dict: The statistics of each backend, by name.
+        """
+
+        return {backend.name: backend.stats() for backend in self.backends}
+
+
+def create_backend(name: str = TTS_BACKEND) -> TTSBackend:
+    """
+    Create a text-to-speech backend.
+
+    Args:
+        name (str, optional): The backend, "gtts", "concatenative", "pack", "silent" or "auto" (the prerendered
+            clips if a pack is bundled, then the offline backend if the morpheme clips are bundled, then gTTS).
+            Defaults to TTS_BACKEND.
+
+    Returns:
+        TTSBackend: The backend.
+
+    Examples:
+        >>> create_backend("gtts").name
+        'gtts'
+    """
+
+    if name == "gtts":
+        return GTTSBackend()
+    if name == "concatenative":
+        return ConcatenativeBackend()
+    if name == "pack":
+        return PackBackend()
+    if name == "silent":
+        return SilentBackend()
+
+    backends = []
+    if PackBackend.available():
+        try:
+            backends.append(PackBackend())
+        except (OSError, ValueError) as error:
+            tracing.error(f"Clip pack unavailable: {error!r}", "tts")
+    if ConcatenativeBackend.available():
+        backends.append(ConcatenativeBackend())
+    backends.append(GTTSBackend())
+    return FallbackBackend(backends) if len(backends) > 1 else backends[0]
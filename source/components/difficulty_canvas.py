@@ -6,10 +6,10 @@ Difficulty Canvas
 """
 
 import tkinter as tk
-from typing import Callable
+from typing import Callable, List, Optional
 
 from utils.my_widgets import MyFrame, MyButton
-from _constants import PRIMARY_COLOR, WHITE_COLOR
+from _constants import PRIMARY_COLOR, WHITE_COLOR, DIFFICULTY_LEVELS
 
 
 class DifficultyCanvas(MyFrame):
@@ -25,6 +25,7 @@ class DifficultyCanvas(MyFrame):
         master: MyFrame,
         game_type: str,
         show_game_canvas: Callable[[str, int], None],
+        levels: Optional[List[int]] = None,
     ):
         """
         Initialize the DifficultyCanvas.
@@ -33,6 +34,7 @@ class DifficultyCanvas(MyFrame):
             master: The master widget.
             game_type: The type of the game.
             show_game_canvas: A callback function to show the game canvas with the selected game type and difficulty level.
+            levels: The difficulty levels of the game (largest number of each level). Defaults to DIFFICULTY_LEVELS.
         """
 
         super().__init__(master)
@@ -42,7 +44,7 @@ class DifficultyCanvas(MyFrame):
         self.grid_columnconfigure(1, weight=1)
         self.grid_columnconfigure(2, weight=1)
 
-        self.difficulties = [10, 20, 50, 100, 1000, 10000, 100000, 1000000]
+        self.difficulties = levels or DIFFICULTY_LEVELS
 
         row = 0
         column = 0
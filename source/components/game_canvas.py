@@ -6,20 +6,13 @@ Game Canvas
 """
 
 import tkinter as tk
-import random
-import os
-from typing import Callable, Tuple
-from PIL import ImageTk, Image
-from gtts import gTTS
-import playsound
-import pygame
+from typing import Tuple
 
 
 from _constants import (
     FONT_NAME,
     TEXT_FONT_SIZE,
     TITLE_FONT_SIZE,
-    RANDOM_NUMBER_SOUND_PATH,
     SOUND_IMAGE_PATH,
     MAGNIFYING_GLASS_IMAGE_PATH,
     CHECK_IMAGE_PATH,
@@ -34,7 +27,12 @@ from _constants import (
     GREATER_IMAGE_PTH,
     LOWER_IMAGE_PTH,
 )
+from audio.speech_service import SpeechService
+from audio.round_prefetcher import RoundPrefetcher
 from utils.my_widgets import MyFrame, MyButton, MyLabel
+from utils.image_cache import get_image
+from engine.input_game import InputGame
+from engine.compare_game import CompareGame
 
 
 class InputCanvas(MyFrame):
@@ -43,18 +41,22 @@ class InputCanvas(MyFrame):
 
     The InputCanvas class extends the MyFrame class and provides a canvas for inputting numbers.
     It includes features such as listening to the number, checking the input, and displaying the result.
+    The rounds and the answers are handled by an InputGame, the canvas only shows them.
     """
 
     def __init__(
-        self, master: MyFrame, difficulty: int, validate: Callable[[int, int], bool]
+        self,
+        master: MyFrame,
+        game: InputGame,
+        speech_service: SpeechService,
     ):
         """
         Initialize the InputCanvas.
 
         Args:
             master: The master widget.
-            difficulty: The difficulty level of the game.
-            validate: A callback function to validate the user input against the generated number.
+            game: The state of the game.
+            speech_service: The service used to speak the generated number without blocking the window.
         """
 
         super().__init__(master)
@@ -63,29 +65,20 @@ class InputCanvas(MyFrame):
         self.grid_columnconfigure(0, weight=4)
         self.grid_columnconfigure(1, weight=1)
 
-        self.difficulty = difficulty
-        self.validate = validate
+        self.game = game
+        self.speech_service = speech_service
+        self.speaking = False
 
-        self.number = None
-        self.generate_random_number()
+        # Pick and synthesize the next numbers while the current one is being answered
+        self.prefetcher = RoundPrefetcher(speech_service, game.draw)
+        self.clip = None  # Clip of the current number, kept to replay it without synthesis
+        self.next_round()
 
-        self.sound_path = RANDOM_NUMBER_SOUND_PATH
-
-        self.listen_image = ImageTk.PhotoImage(
-            Image.open(SOUND_IMAGE_PATH).resize((70, 70))
-        )
-        self.magnifying_glass_image = ImageTk.PhotoImage(
-            Image.open(MAGNIFYING_GLASS_IMAGE_PATH).resize((50, 50))
-        )
-        self.check_image = ImageTk.PhotoImage(
-            Image.open(CHECK_IMAGE_PATH).resize((50, 50))
-        )
-        self.refresh_image = ImageTk.PhotoImage(
-            Image.open(REFRESH_IMAGE_PATH).resize((50, 50))
-        )
-        self.warning_image = ImageTk.PhotoImage(
-            Image.open(WARNING_IMAGE_PATH).resize((50, 50))
-        )
+        self.listen_image = get_image(SOUND_IMAGE_PATH, (70, 70))
+        self.magnifying_glass_image = get_image(MAGNIFYING_GLASS_IMAGE_PATH, (50, 50))
+        self.check_image = get_image(CHECK_IMAGE_PATH, (50, 50))
+        self.refresh_image = get_image(REFRESH_IMAGE_PATH, (50, 50))
+        self.warning_image = get_image(WARNING_IMAGE_PATH, (50, 50))
 
         # Create a label with centered text
         self.listen_button = MyButton(
@@ -104,6 +97,7 @@ class InputCanvas(MyFrame):
         )
         self.input_entry.grid(row=1, column=0, padx=10,
                               pady=10, sticky=tk.NSEW)
+        self.input_var.trace_add("write", self.on_input_change)
 
         self.check_button = MyButton(
             self,
@@ -126,80 +120,77 @@ class InputCanvas(MyFrame):
 
         self.after(100, self.listen_number)
 
-    def generate_random_number(self):
+    def next_round(self):
         """
-        Generate a random number within the specified difficulty level.
-
-        Returns:
-            int: The generated random number.
+        Start the next round with the prefetched number and its clip.
         """
 
-        self.number = random.choice(
-            [i for i in range(self.difficulty + 1) if i != self.number])
+        number, self.clip = self.prefetcher.next_round()
+        self.game.next_round(number)
 
-    def listen_number(self):
-        """
-        Generate and play the text-to-speech audio for the random number.
+    def listen_number(self, _event: tk.Event = None):
         """
+        Request the text-to-speech audio of the random number to the speech service.
 
-        # Generate a text-to-speech audio from the random number
-        tts = gTTS(text=str(self.number), lang="fr", slow=True)
-        # Save the audio as filename
-        tts.save(self.sound_path)
-        # Play the audio
-        self.play()
-        # Remove the audio when played (fixed a permission bug on Windows)
-        os.remove(self.sound_path)
-
-    def play(self):
-        """
-        Play the audio of the generated number using the available audio player libraries.
+        The clip of the current number is replayed from memory once it has been synthesized.
+        The request is ignored while the previous one is still being fetched,
+        so that repeated clicks on the listen button do not pile up.
         """
 
-        for play in [self.playsound, self.pygame]:
-            try:
-                print(f"Sound played with {self.playsound.__name__}.")
-                return play()
-            except Exception:
-                print(Exception)
-                continue
-        return
+        if self.speaking:
+            return
 
-    def playsound(self):
-        """
-        Play the audio file using the playsound library.
+        self.speaking = True
+        self.speech_service.speak(
+            str(self.game.number), self.on_number_spoken, clip=self.clip)
 
-        This function plays the audio file specified by the sound path using the playsound library.
-        It blocks the program execution until the audio finishes playing.
+    def on_number_spoken(self, text: str, clip: bytes):
         """
+        Keep the clip of the current number and allow it to be listened again.
 
-        playsound.playsound(sound=self.sound_path, block=True)
-
-    def pygame(self):
-        """
-        Play the audio file using the pygame library.
-
-        This function initializes the pygame mixer, loads the audio file specified by the sound path,
-        and plays the audio using the pygame mixer.
+        Args:
+            text: The spoken text.
+            clip: The clip of the spoken text, or None if the synthesis failed.
         """
 
-        pygame.mixer.init()
-        pygame.mixer.music.load(self.sound_path)
-        pygame.mixer.music.play()
+        self.speaking = False
+        if text == str(self.game.number):
+            self.clip = clip
+        else:  # The round changed while the previous number was spoken
+            self.listen_number()
 
     def check_number(self):
         """
         Check the user input against the generated number and update the result accordingly.
         """
 
-        user_input = self.input_var.get()
+        if self.game.result == "okay":  # The next round is about to start
+            return
 
-        if self.validate(user_input, self.number):
-            self.update_canvas(result="okay")
+        result = self.game.submit(self.input_var.get())
+        self.update_canvas(result=result)
+
+        if result == "okay":
             self.after(1500, self.reset_canvas)
-            self.after(2000, self.listen_number)
-        else:
-            self.update_canvas(result="wrong")
+
+    def on_input_change(self, *_args):
+        """
+        Advance the answer automaton with the edited input and show whether the answer is still on track.
+
+        Typing or erasing the last character costs a single step of the automaton.
+        """
+
+        status = self.game.type(self.input_var.get())
+
+        if status == "wrong":
+            color, message = "red", "Attention, il y a une erreur."
+        elif status == "complete":
+            color, message = "green", ""
+        else:  # status in ("empty", "on-track")
+            color, message = "black", ""
+
+        self.input_entry.config(highlightcolor=color, fg=color)
+        self.result_label.config(text=message, fg=color)
 
     def get_result(self, result):
         """
@@ -209,7 +200,7 @@ class InputCanvas(MyFrame):
             result: The result of the user input validation.
 
         Returns:
-            Tuple[str, str, ImageTk.PhotoImage]: The color, message, and icon for the result.
+            Tuple[str, str, tk.PhotoImage]: The color, message, and icon for the result.
         """
 
         if result == "okay":
@@ -251,12 +242,13 @@ class InputCanvas(MyFrame):
 
     def reset_canvas(self):
         """
-        Reset the input entry and update the result label to its initial state.
+        Reset the input entry and update the result label to its initial state, then start the next round.
         """
 
         self.update_canvas("reset")
         self.input_entry.delete(0, tk.END)
-        self.generate_random_number()
+        self.next_round()
+        self.listen_number()
 
 
 class CompareCanvas(MyFrame):
@@ -265,14 +257,16 @@ class CompareCanvas(MyFrame):
 
     The CompareCanvas class extends the tk.Widget class and provides a canvas for comparing elements.
     It can be used to visually compare and analyze different elements or objects.
+    The rounds and the answers are handled by a CompareGame, the canvas only shows them.
     """
 
-    def __init__(self, master: MyFrame, difficulty: int):
+    def __init__(self, master: MyFrame, game: CompareGame):
         """
         Initialize the CompareCanvas.
 
         Args:
             master: The master widget.
+            game: The state of the game.
         """
 
         super().__init__(master)
@@ -282,14 +276,11 @@ class CompareCanvas(MyFrame):
         self.grid_columnconfigure(1, weight=1)
         self.grid_columnconfigure(2, weight=1)
 
-        self.difficulty = difficulty
-
-        self.first_number = None
-        self.second_number = None
-        self.generate_random_numbers()
+        self.game = game
+        self.game.next_round()
 
         self.first_number_label = MyLabel(
-            self, text=self.first_number, font=(FONT_NAME, TITLE_FONT_SIZE))
+            self, text=self.game.first_number, font=(FONT_NAME, TITLE_FONT_SIZE))
         self.first_number_label.grid(row=0, column=0, padx=10,
                                      pady=100, sticky=tk.NSEW)
 
@@ -299,28 +290,16 @@ class CompareCanvas(MyFrame):
                                 pady=100, sticky=tk.NSEW)
 
         self.second_number_label = MyLabel(
-            self, text=self.second_number, font=(FONT_NAME, TITLE_FONT_SIZE))
+            self, text=self.game.second_number, font=(FONT_NAME, TITLE_FONT_SIZE))
         self.second_number_label.grid(row=0, column=2, padx=10,
                                       pady=100, sticky=tk.NSEW)
 
-        self.question_mark_image = ImageTk.PhotoImage(
-            Image.open(QUESTION_MARK_IMAGE_PATH).resize((70, 70))
-        )
-        self.lower_image = ImageTk.PhotoImage(
-            Image.open(LOWER_IMAGE_PTH).resize((70, 70))
-        )
-        self.equal_image = ImageTk.PhotoImage(
-            Image.open(EQUAL_IMAGE_PTH).resize((70, 70))
-        )
-        self.greater_image = ImageTk.PhotoImage(
-            Image.open(GREATER_IMAGE_PTH).resize((70, 70))
-        )
-        self.check_image = ImageTk.PhotoImage(
-            Image.open(CHECK_IMAGE_PATH).resize((50, 50))
-        )
-        self.warning_image = ImageTk.PhotoImage(
-            Image.open(WARNING_IMAGE_PATH).resize((50, 50))
-        )
+        self.question_mark_image = get_image(QUESTION_MARK_IMAGE_PATH, (70, 70))
+        self.lower_image = get_image(LOWER_IMAGE_PTH, (70, 70))
+        self.equal_image = get_image(EQUAL_IMAGE_PTH, (70, 70))
+        self.greater_image = get_image(GREATER_IMAGE_PTH, (70, 70))
+        self.check_image = get_image(CHECK_IMAGE_PATH, (50, 50))
+        self.warning_image = get_image(WARNING_IMAGE_PATH, (50, 50))
 
         self.lower_button = MyButton(
             self, text="est plus petit que", image=self.lower_image,
@@ -345,31 +324,6 @@ class CompareCanvas(MyFrame):
             self, text="", font=(FONT_NAME, TEXT_FONT_SIZE))
         self.result_label.grid(row=2, column=0, columnspan=3)
 
-    def generate_random_number(self):
-        """
-        Generate a random number within the specified difficulty level.
-
-        Returns:
-            int: The generated random number.
-        """
-
-        return random.randint(0, self.difficulty)
-
-    def generate_random_numbers(self) -> None:
-        """
-        Generate two random numbers.
-
-        Generates two random numbers and assigns them to the instance variables `first_number` and `second_number`.
-
-        Args:
-            self: The instance of the class.
-
-        Returns:
-            None
-        """
-        self.first_number = self.generate_random_number()
-        self.second_number = self.generate_random_number()
-
     def update_canvas(self, tryout, button_compare):
         """
         Update the canvas based on the tryout result and button compare value.
@@ -402,7 +356,7 @@ class CompareCanvas(MyFrame):
         """
         Reset the canvas to its initial state.
 
-        Generates new random numbers, updates the number labels, resets the button images and highlights,
+        Starts the next round of the game, updates the number labels, resets the button images and highlights,
         and clears the result label.
 
         Args:
@@ -411,9 +365,9 @@ class CompareCanvas(MyFrame):
         Returns:
             None
         """
-        self.generate_random_numbers()
-        self.first_number_label.config(text=self.first_number)
-        self.second_number_label.config(text=self.second_number)
+        first_number, second_number = self.game.next_round()
+        self.first_number_label.config(text=first_number)
+        self.second_number_label.config(text=second_number)
         self.lower_button.config(
             highlightbackground=PRIMARY_COLOR, image=self.lower_image)
         self.equal_button.config(
@@ -422,7 +376,7 @@ class CompareCanvas(MyFrame):
             highlightbackground=PRIMARY_COLOR, image=self.greater_image)
         self.result_label.config(text="")
 
-    def get_result(self, tryout: bool) -> Tuple[str, str, ImageTk.PhotoImage]:
+    def get_result(self, tryout: bool) -> Tuple[str, str, tk.PhotoImage]:
         """
         Get the result information based on the tryout.
 
@@ -432,7 +386,7 @@ class CompareCanvas(MyFrame):
             tryout: The result of the tryout.
 
         Returns:
-            Tuple[str, str, ImageTk.PhotoImage]: The color, message, and icon for the result.
+            Tuple[str, str, tk.PhotoImage]: The color, message, and icon for the result.
         """
         if tryout:
             color = "green"
@@ -449,7 +403,7 @@ class CompareCanvas(MyFrame):
         """
         Check the result of the comparison and update the canvas.
 
-        Compares the numbers based on the given button_compare value ("<", "=", or ">").
+        Submits the comparison operator ("<", "=", or ">") to the game.
         Updates the canvas based on the tryout result.
         If the tryout is True, it schedules a reset of the canvas after 1500 milliseconds.
 
@@ -459,15 +413,10 @@ class CompareCanvas(MyFrame):
         Returns:
             None
         """
-        if button_compare == "<":
-            tryout = self.first_number < self.second_number
-        elif button_compare == "=":
-            tryout = self.first_number == self.second_number
-        elif button_compare == ">":
-            tryout = self.first_number > self.second_number
-        else:
-            tryout = False
+        if self.game.result == "okay":  # The next round is about to start
+            return
 
+        tryout = self.game.submit(button_compare) == "okay"
         self.update_canvas(tryout, button_compare)
 
         if tryout:
@@ -7,7 +7,6 @@ Header
 
 import tkinter as tk
 from typing import Callable
-from PIL import ImageTk, Image
 
 from _constants import (
     MAIN_COLOR,
@@ -16,9 +15,11 @@ from _constants import (
     ARROW_IMAGE_PATH,
     FONT_NAME,
     TITLE_FONT_SIZE,
+    SMALL_FONT_SIZE,
     INFO_COLOR
 )
 from utils.my_widgets import MyButton, MyLabel
+from utils.image_cache import get_image
 
 
 class BackButton(MyButton):
@@ -41,9 +42,7 @@ class BackButton(MyButton):
         super().__init__(master, bg=INFO_COLOR, fg=WHITE_COLOR, width=50)
 
         self.callback = callback
-        self.back_image = ImageTk.PhotoImage(
-            Image.open(ARROW_IMAGE_PATH).resize((40, 40)).rotate(180)
-        )
+        self.back_image = get_image(ARROW_IMAGE_PATH, (40, 40), rotation=180)
         # TODO change image colors and rotate the arrow image
 
         self.update_callback()
@@ -98,6 +97,9 @@ class NavigationBar(tk.Frame):
         # Create a button for the callback button
         self.back_button = BackButton(self, None)
 
+        # Create a label for the status of the background tasks, shown only while they run
+        self.status_label = MyLabel(self, text="", font=(FONT_NAME, SMALL_FONT_SIZE), bg=MAIN_COLOR, fg=WHITE_COLOR)
+
     def update_nav_bar(self, title: str, callback: Callable) -> None:
         """
         Update the navigation bar.
@@ -112,3 +114,19 @@ class NavigationBar(tk.Frame):
         self.title_label["text"] = title
         self.back_button.callback = callback
         self.back_button.update_callback()
+
+    def set_status(self, status: str) -> None:
+        """
+        Show a status under the title, or hide it.
+
+        Args:
+            status: The status to show, or an empty string to hide it.
+
+        Returns:
+            None
+        """
+        if status:
+            self.status_label["text"] = status
+            self.status_label.grid(row=1, column=0, columnspan=2, padx=10, pady=(0, 10))
+        else:
+            self.status_label.grid_remove()
@@ -6,8 +6,7 @@ Main Canvas
 """
 
 import tkinter as tk
-from typing import Callable
-from PIL import ImageTk, Image
+from typing import Callable, Optional
 
 from _constants import (
     LIGHT_SHADE_COLOR,
@@ -15,10 +14,12 @@ from _constants import (
     WHITE_COLOR,
     MATHEMATICS_TITLE,
     SPELLING_TITLE,
+    REPORT_TITLE,
     MATHEMATICS_IMAGE_PATH,
     SPELLING_IMAGE_PATH,
 )
 from utils.my_widgets import MyFrame, MyButton
+from utils.image_cache import get_image
 
 
 class MainCanvas(MyFrame):
@@ -28,18 +29,25 @@ class MainCanvas(MyFrame):
     Args:
         master: The parent widget where the canvas will be placed.
         show_subject_canvas: A callback function that takes a string argument and does not return anything.
+        show_report_canvas: A callback function showing the report of the progress.
 
     Returns:
         None
     """
 
-    def __init__(self, master: MyFrame, show_subject_canvas: Callable[[str], None]):
+    def __init__(
+        self,
+        master: MyFrame,
+        show_subject_canvas: Callable[[str], None],
+        show_report_canvas: Optional[Callable[[], None]] = None,
+    ):
         """
         Initialize the MainCanvas.
 
         Args:
             master (tk.Widget): The parent widget where the canvas will be placed.
             show_subject_canvas (Callable): The callback for showing the subject.
+            show_report_canvas (Callable, optional): The callback for showing the report, if any.
         """
 
         super().__init__(master)
@@ -48,9 +56,7 @@ class MainCanvas(MyFrame):
 
         self.config(bg=LIGHT_SHADE_COLOR)
 
-        self.maths_image = ImageTk.PhotoImage(
-            Image.open(MATHEMATICS_IMAGE_PATH).resize((80, 80))
-        )
+        self.maths_image = get_image(MATHEMATICS_IMAGE_PATH, (80, 80))
 
         self.maths_button = MyButton(
             self,
@@ -65,9 +71,7 @@ class MainCanvas(MyFrame):
         self.maths_button.grid(
             row=0, column=0, padx=10, pady=20, sticky=tk.NS)
 
-        self.spelling_image = ImageTk.PhotoImage(
-            Image.open(SPELLING_IMAGE_PATH).resize((80, 80))
-        )
+        self.spelling_image = get_image(SPELLING_IMAGE_PATH, (80, 80))
 
         self.spelling_button = MyButton(
             self,
@@ -81,3 +85,13 @@ class MainCanvas(MyFrame):
         )
         self.spelling_button.grid(
             row=1, column=0, padx=10, pady=20, sticky=tk.NS)
+
+        if show_report_canvas:
+            self.report_button = MyButton(
+                self,
+                bg=WHITE_COLOR,
+                text=REPORT_TITLE,
+                command=show_report_canvas,
+            )
+            self.report_button.grid(
+                row=2, column=0, padx=10, pady=10, sticky=tk.NS)
@@ -0,0 +1,137 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Report Canvas
+"""
+
+import tkinter as tk
+from typing import List, Optional
+
+from _constants import FONT_NAME, SMALL_FONT_SIZE, TEXT_FONT_SIZE
+from game_registry import get_game
+from utils.my_widgets import MyFrame, MyLabel
+
+PROGRESS_DAYS = 7  # Last days shown in the progress section
+
+
+def percent(value: Optional[float]) -> str:
+    """
+    Returns a rate as a French percentage.
+
+    Args:
+        value (Optional[float]): The rate, between 0 and 1, or None.
+
+    Returns:
+        str: The percentage, or "-" for None.
+
+    Examples:
+        >>> percent(0.126)
+        '13 %'
+    """
+
+    return "-" if value is None else f"{value * 100:.0f} %"
+
+
+def game_title(game_type: str) -> str:
+    """
+    Returns the name of a game in the report.
+
+    Args:
+        game_type (str): The identifier of the game, as written in the attempt log.
+
+    Returns:
+        str: The title of the game, or its identifier if the game is no longer declared.
+
+    Examples:
+        >>> game_title("compare")
+        'Compare les nombres'
+    """
+
+    game = get_game(game_type)
+    return game.title if game else game_type
+
+
+class ReportSection(MyFrame):
+    """
+    Represents a section of the report.
+
+    The ReportSection class extends the MyFrame class and displays a title above lines of text.
+    """
+
+    def __init__(self, master: MyFrame, title: str, lines: List[str]):
+        """
+        Initialize the ReportSection.
+
+        Args:
+            master: The master widget.
+            title: The title of the section.
+            lines: The lines of the section.
+        """
+
+        super().__init__(master)
+
+        self.grid_columnconfigure(0, weight=1)
+
+        self.title_label = MyLabel(self, text=title, font=(FONT_NAME, TEXT_FONT_SIZE), anchor="w")
+        self.title_label.grid(row=0, column=0, padx=10, pady=(10, 5), sticky=tk.EW)
+
+        self.lines_label = MyLabel(
+            self, text="\n".join(lines), font=(FONT_NAME, SMALL_FONT_SIZE), anchor="w", justify=tk.LEFT)
+        self.lines_label.grid(row=1, column=0, padx=20, sticky=tk.EW)
+
+
+class ReportCanvas(MyFrame):
+    """
+    Represents the report of the progress of the player.
+
+    The ReportCanvas class extends the MyFrame class and displays the statistics of the attempt log:
+    the accuracy, the error rates by range of numbers, the hardest numbers, the response times and the last days.
+    """
+
+    def __init__(self, master: MyFrame, report: dict):
+        """
+        Initialize the ReportCanvas.
+
+        Args:
+            master: The master widget.
+            report: The report, as returned by AttemptHistory.report.
+        """
+
+        super().__init__(master)
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_columnconfigure(1, weight=1)
+
+        if not report["attempts"]:
+            self.empty_label = MyLabel(self, text="Joue à un jeu pour voir tes progrès ici !")
+            self.empty_label.grid(row=0, column=0, columnspan=2, padx=10, pady=20, sticky=tk.NSEW)
+            return
+
+        self.summary_label = MyLabel(
+            self, text=f"{report['attempts']} réponses, {percent(report['accuracy'])} de bonnes réponses")
+        self.summary_label.grid(row=0, column=0, columnspan=2, padx=10, pady=10, sticky=tk.NSEW)
+
+        sections = [
+            ("Erreurs selon la fin du nombre", [
+                f"{label} : {percent(stats['error_rate'])} d'erreurs ({stats['attempts']})"
+                for label, stats in report["ranges"].items()
+            ]),
+            ("Nombres à revoir", [
+                f"{stats['number']} : {percent(stats['error_rate'])} d'erreurs"
+                for stats in report["hardest"] if stats["error_rate"] > 0
+            ] or ["Aucun, bravo !"]),
+            ("Temps de réponse (médiane)", [
+                f"{game_title(game_type)} : {percentiles['p50'] / 1000:.1f} s".replace(".", ",")
+                for game_type, percentiles in report["response_ms"].items() if "p50" in percentiles
+            ]),
+            ("Derniers jours", [
+                f"{stats['day']} : {percent(stats['accuracy'])} ({stats['attempts']} réponses)"
+                for stats in report["progress"][-PROGRESS_DAYS:]
+            ]),
+        ]
+
+        for index, (title, lines) in enumerate(sections):
+            row, column = divmod(index, 2)
+            section = ReportSection(self, title, lines)
+            section.grid(row=row + 1, column=column, padx=10, pady=5, sticky=tk.NSEW)
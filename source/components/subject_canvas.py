@@ -7,17 +7,16 @@ Subject Canvas
 
 import tkinter as tk
 from typing import Callable
-from PIL import ImageTk, Image
 
 from _constants import (
-    GREATER_EQUAL_IMAGE_PATH,
-    SOUND_IMAGE_PATH,
     FONT_NAME,
     TITLE_FONT_SIZE,
     PRIMARY_COLOR,
     WHITE_COLOR,
 )
 from utils.my_widgets import MyFrame, MyLabel, MyButton
+from utils.image_cache import get_image
+from game_registry import subject_sections
 
 
 class SubjectSectionCanvas(MyFrame):
@@ -25,7 +24,7 @@ class SubjectSectionCanvas(MyFrame):
     Represents a canvas for displaying a section of subjects.
 
     The SubjectSectionCanvas class extends the MyFrame class and provides a canvas for displaying a section of subjects.
-    It displays a title label and buttons for each subject, allowing the user to select a subject and trigger a callback function.
+    It displays a title label and buttons for each game, allowing the user to select a game and trigger a callback function.
     """
 
     def __init__(
@@ -41,8 +40,8 @@ class SubjectSectionCanvas(MyFrame):
         Args:
             master: The master widget.
             column_number: The number of columns to display the buttons.
-            section: A dictionary containing the section details, including the title and buttons.
-            show_difficulty_callback: A callback function to show the difficulty canvas for the selected subject.
+            section: A dictionary containing the section details, including the title and games.
+            show_difficulty_callback: A callback function to show the difficulty canvas for the selected game.
         """
 
         super().__init__(master)
@@ -54,49 +53,30 @@ class SubjectSectionCanvas(MyFrame):
         self.show_difficulty_callback = show_difficulty_callback
 
         self.title = section.get("title", "")
-        self.buttons = section.get("buttons", [])
+        self.games = section.get("games", [])
 
         self.create_title_label()
 
-        row = 1
-        column = 0
-
-        for button in self.buttons:
-            button_label = button.get("label", "")
-            game_type = button.get("game_type", None)
-            image_name = button.get("image", None)
-
-            if button_label:
-                button = MyButton(
-                    self,
-                    text=f"{button_label} ",
-                    command=lambda g=game_type: self.show_difficulty_callback(
-                        game_type=g
-                    ),
-                    bg=PRIMARY_COLOR,
-                    fg=WHITE_COLOR
-                )
-
-                if image_name:
-                    if image_name == "sound":
-                        image = SOUND_IMAGE_PATH
-                    elif image_name == "greater-equal":
-                        image = GREATER_EQUAL_IMAGE_PATH
-
-                    if image:
-                        button_image = ImageTk.PhotoImage(
-                            Image.open(image).resize((20, 20))
-                        )
-                        button.image = button_image
-                        button.config(image=button_image, compound=tk.RIGHT)
-
-                button.grid(row=row, column=column, padx=10,
-                            pady=10, sticky=tk.NSEW)
-
-                column += 1
-                if column >= self.column_number:
-                    column = 0
-                    row += 1
+        for index, game in enumerate(self.games):
+            row, column = divmod(index, self.column_number)
+
+            button = MyButton(
+                self,
+                text=f"{game.label} ",
+                command=lambda g=game.game_type: self.show_difficulty_callback(
+                    game_type=g
+                ),
+                bg=PRIMARY_COLOR,
+                fg=WHITE_COLOR
+            )
+
+            if game.icon:
+                button_image = get_image(game.icon, (20, 20))
+                button.image = button_image
+                button.config(image=button_image, compound=tk.RIGHT)
+
+            button.grid(row=row + 1, column=column, padx=10,
+                        pady=10, sticky=tk.NSEW)
 
     def create_title_label(self) -> None:
         """
@@ -116,17 +96,19 @@ class SubjectSectionCanvas(MyFrame):
 
 class SubjectCanvas(MyFrame):
     """
-    A customizable canvas for subject-specific content.
+    A canvas listing the games of a subject.
+
+    The sections and their games are read from the game registry, so that declaring a game is enough to show it.
 
     Attributes:
         master (tk.Widget): The parent widget where the canvas will be placed.
-        sections (list[dict]): A list of dictionaries representing sections with buttons.
+        subject (str): The subject of the games, a key of SUBJECTS.
     """
 
     def __init__(
         self,
         master: MyFrame,
-        sections: list[dict],
+        subject: str,
         show_difficulty_callback: Callable[[str], None],
     ):
         """
@@ -134,7 +116,8 @@ class SubjectCanvas(MyFrame):
 
         Args:
             master (tk.Widget): The parent widget where the canvas will be placed.
-            sections (list[dict]): A list of dictionaries representing sections with buttons.
+            subject (str): The subject of the games, a key of SUBJECTS.
+            show_difficulty_callback (Callable): The callback for showing the difficulty canvas of a game.
         """
 
         super().__init__(master)
@@ -142,9 +125,10 @@ class SubjectCanvas(MyFrame):
 
         self.grid_columnconfigure(0, weight=1)
 
+        self.subject = subject
         self.show_difficulty_callback = show_difficulty_callback
 
-        for row_number, section in enumerate(sections):
+        for row_number, section in enumerate(subject_sections(subject)):
             self.add_section(row_number, section)
 
     def add_section(self, row_number: int, section: dict) -> None:
@@ -152,11 +136,11 @@ class SubjectCanvas(MyFrame):
         Add a section with buttons to the canvas.
 
         Args:
-            section (dict): A dictionary representing a section with buttons.
-            row (int): The current row in the grid.
+            row_number (int): The row of the section in the grid.
+            section (dict): A dictionary representing a section with its games.
 
         Returns:
-            int: The updated row number after adding the section.
+            None
         """
 
         self.section = SubjectSectionCanvas(
@@ -167,122 +151,3 @@ class SubjectCanvas(MyFrame):
         )
         self.section.grid(row=row_number, column=0,
                           padx=10, pady=10, sticky=tk.NSEW)
-
-
-class MathsCanvas(SubjectCanvas):
-    """
-    A canvas for math exercises.
-
-    Args:
-        master: The master SubjectCanvas object.
-        show_difficulty_callback: A callback function that takes a string argument and does not return anything.
-
-    Returns:
-        None
-    """
-
-    def __init__(
-        self, master: SubjectCanvas, show_difficulty_callback: Callable[[str], None]
-    ):
-        """
-        Initializes a SubjectCanvas object.
-
-        Args:
-            master: The master SubjectCanvas object.
-            show_difficulty_callback: A callback function that takes a string argument and does not return anything.
-
-        Returns:
-            None
-        """
-
-        self.sections = [
-            {
-                "title": "Écriture du nombre",
-                "buttons": [
-                    {
-                        "label": "Son vers Nombre",
-                        "game_type": "sound-to-number",
-                        "image": "sound",
-                    },
-                    {
-                        "label": "Son vers Mot",
-                        "game_type": "sound-to-word",
-                        "image": "sound",
-                    },
-                ],
-            },
-            {
-                "title": "Comparaison",
-                "buttons": [
-                    {
-                        "label": "Comparer",
-                        "game_type": "compare",
-                        "image": "greater-equal",
-                    },
-                ],
-            },
-            {
-                "title": "Dénombrement",
-                "buttons": [
-                    {"label": "Compter", "game_type": "count"},
-                ],
-            },
-        ]
-
-        super().__init__(master, self.sections, show_difficulty_callback)
-
-
-class SpellingCanvas(SubjectCanvas):
-    """
-    A canvas for spelling exercises.
-
-    Args:
-        master: The master SubjectCanvas object.
-        show_difficulty_callback: A callback function that takes a string argument and does not return anything.
-
-    Returns:
-        None
-    """
-
-    def __init__(
-        self, master: SubjectCanvas, show_difficulty_callback: Callable[[str], None]
-    ):
-        """
-        Initializes a SpellingCanvas object.
-
-        Args:
-            master: The master SubjectCanvas object.
-            show_difficulty_callback: A callback function that takes a string argument and does not return anything.
-
-        Returns:
-            None
-        """
-        self.sections = [
-            {
-                "title": "Encodage",
-                "buttons": [
-                    {
-                        "label": "Son Simple : Syllabe",
-                        "game_type": "simple-syllable",
-                        "image": "sound",
-                    },
-                    {
-                        "label": "Son Simple : Mot",
-                        "game_type": "simple-word",
-                        "image": "sound",
-                    },
-                    {
-                        "label": "Son Complexe : Syllabe",
-                        "game_type": "complex-syllable",
-                        "image": "sound",
-                    },
-                    {
-                        "label": "Son Complexe : Mot",
-                        "game_type": "complex-word",
-                        "image": "sound",
-                    },
-                ],
-            }
-        ]
-
-        super().__init__(master, self.sections, show_difficulty_callback)
@@ -6,10 +6,10 @@ Work In Progress Canvas
 """
 
 import tkinter as tk
-from PIL import ImageTk, Image
 
 from _constants import TRAFFIC_CONE_IMAGE_PATH, FONT_NAME, TEXT_FONT_SIZE
 from utils.my_widgets import MyFrame, MyLabel
+from utils.image_cache import get_image
 
 
 class WorkInProgress(MyFrame):
@@ -31,9 +31,7 @@ class WorkInProgress(MyFrame):
 
         self.grid_columnconfigure(0, weight=1)
 
-        self.traffic_cone_image = ImageTk.PhotoImage(
-            Image.open(TRAFFIC_CONE_IMAGE_PATH).resize((80, 80))
-        )
+        self.traffic_cone_image = get_image(TRAFFIC_CONE_IMAGE_PATH, (80, 80))
 
         self.traffic_cone_label = MyLabel(
             self, image=self.traffic_cone_image, font=(FONT_NAME, TEXT_FONT_SIZE))
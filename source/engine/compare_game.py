@@ -0,0 +1,108 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Compare Game
+"""
+
+import random
+import time
+from typing import Callable, Optional, Tuple
+
+from utils.attempt_log import AttemptLog
+from utils.scheduler import ReviewScheduler
+from utils import tracing
+
+# Comparison operators of the answers
+OPERATORS = {
+    "<": lambda first, second: first < second,
+    "=": lambda first, second: first == second,
+    ">": lambda first, second: first > second,
+}
+
+
+class CompareGame:
+    """
+    Represents the state of a game where the player compares two numbers.
+
+    The CompareGame class holds the rounds of the game without any widget: the first number is given
+    by the review scheduler (numbers compared wrong come back sooner), the second one is drawn independently
+    so that both numbers can be equal, and an answer is an operator classified as "okay" or "wrong".
+    A round is over once it is answered "okay": submitting it again does not record a new answer.
+    The recorded answers are also appended to the attempt log, if any, with their response time.
+    """
+
+    def __init__(
+        self,
+        difficulty: int,
+        scheduler: Optional[ReviewScheduler] = None,
+        rng: Optional[random.Random] = None,
+        attempt_log: Optional[AttemptLog] = None,
+        game_type: str = "",
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        """
+        Initialize the CompareGame.
+
+        Args:
+            difficulty: The largest number of the game (included).
+            scheduler: The scheduler of the first numbers. Defaults to a new ReviewScheduler.
+            rng: The random generator of the second numbers. Defaults to the random module.
+            attempt_log: The log of the answers. Defaults to None (answers not logged).
+            game_type: The type of the game, written in the attempt log.
+            clock: The clock measuring the response times, in seconds.
+        """
+
+        self.difficulty = difficulty
+        self.scheduler = scheduler or ReviewScheduler(difficulty)
+        self.rng = rng or random
+        self.attempt_log = attempt_log
+        self.game_type = game_type
+        self.clock = clock
+
+        self.first_number: Optional[int] = None
+        self.second_number: Optional[int] = None
+        self.result: Optional[str] = None  # Result of the last answer of the round
+        self.started = 0.0  # Start of the round, on the clock
+
+    def next_round(self) -> Tuple[int, int]:
+        """
+        Start a new round.
+
+        Returns:
+            Tuple[int, int]: The two numbers to compare.
+        """
+
+        self.first_number = self.scheduler.next_item()
+        self.second_number = self.rng.randint(0, self.difficulty)
+        self.result = None
+        self.started = self.clock()
+        return self.first_number, self.second_number
+
+    def submit(self, operator: str) -> str:
+        """
+        Submit an answer, and record it for the review of the first number.
+
+        Args:
+            operator: The comparison operator ("<", "=", or ">").
+
+        Returns:
+            str: The result, "okay" or "wrong".
+        """
+
+        if self.result == "okay":
+            return self.result
+
+        with tracing.span("submit answer", "game", first=self.first_number, second=self.second_number,
+                          operator=operator) as submit_span:
+            compare = OPERATORS.get(operator)
+            correct = bool(compare and compare(self.first_number, self.second_number))
+            self.result = "okay" if correct else "wrong"
+
+            self.scheduler.record(self.first_number, correct)
+            if self.attempt_log is not None:
+                self.attempt_log.record(self.game_type, self.difficulty, self.first_number,
+                                        f"{operator} {self.second_number}", correct,
+                                        (self.clock() - self.started) * 1000)
+            submit_span.set(result=self.result)
+        return self.result
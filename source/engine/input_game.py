@@ -0,0 +1,136 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Input Game
+"""
+
+import time
+from typing import Callable, Iterable, Optional
+
+from utils.answer_automaton import AnswerAutomaton, AnswerTracker
+from utils.attempt_log import AttemptLog
+from utils.scheduler import ReviewScheduler
+from utils import tracing
+
+
+class InputGame:
+    """
+    Represents the state of a game where the player writes the number they hear.
+
+    The InputGame class holds the rounds of the game without any widget: the numbers are given by the review
+    scheduler, each round compiles its accepted answers into an automaton fed at each keystroke, and a submitted
+    answer is classified as "okay", "wrong", or "bug" when it contains characters the game does not expect.
+    A round is over once it is answered "okay": submitting it again does not record a new answer.
+    The recorded answers are also appended to the attempt log, if any, with their response time.
+    """
+
+    def __init__(
+        self,
+        difficulty: int,
+        answers: Callable[[int], Iterable[str]],
+        alphabet: Optional[str] = None,
+        scheduler: Optional[ReviewScheduler] = None,
+        attempt_log: Optional[AttemptLog] = None,
+        game_type: str = "",
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        """
+        Initialize the InputGame.
+
+        Args:
+            difficulty: The largest number of the game (included).
+            answers: A function returning the accepted answers of a number.
+            alphabet: The characters expected in an answer (besides spaces), or None to accept any character.
+            scheduler: The scheduler of the numbers. Defaults to a new ReviewScheduler.
+            attempt_log: The log of the answers. Defaults to None (answers not logged).
+            game_type: The type of the game, written in the attempt log.
+            clock: The clock measuring the response times, in seconds.
+        """
+
+        self.difficulty = difficulty
+        self.answers = answers
+        self.alphabet = set(alphabet) if alphabet else None
+        self.scheduler = scheduler or ReviewScheduler(difficulty)
+        self.attempt_log = attempt_log
+        self.game_type = game_type
+        self.clock = clock
+
+        self.number: Optional[int] = None
+        self.tracker: Optional[AnswerTracker] = None
+        self.result: Optional[str] = None  # Result of the last submitted answer of the round
+        self.started = 0.0  # Start of the round, on the clock
+
+    def draw(self) -> int:
+        """
+        Returns the number of an upcoming round (the scheduler avoids repeating the previous one).
+
+        Returns:
+            int: The number.
+        """
+
+        return self.scheduler.next_item()
+
+    def next_round(self, number: Optional[int] = None) -> int:
+        """
+        Start a new round.
+
+        Args:
+            number: The number of the round, drawn ahead with `draw`. Defaults to a newly drawn number.
+
+        Returns:
+            int: The number of the round.
+        """
+
+        self.number = self.draw() if number is None else number
+        self.tracker = AnswerTracker(AnswerAutomaton(self.answers(self.number)))
+        self.result = None
+        self.started = self.clock()
+        return self.number
+
+    def type(self, text: str) -> str:
+        """
+        Follow the answer being typed.
+
+        Args:
+            text: The current answer.
+
+        Returns:
+            str: The status of the answer, "empty", "on-track", "wrong" or "complete".
+        """
+
+        with tracing.span("type answer", "game", length=len(text)) as type_span:
+            status = self.tracker.update(text)
+            type_span.set(status=status)
+        return status
+
+    def submit(self, text: str) -> str:
+        """
+        Submit an answer, and record it for the review of the number.
+
+        Args:
+            text: The answer.
+
+        Returns:
+            str: The result, "okay", "wrong", or "bug" if the answer has unexpected characters (not recorded).
+        """
+
+        if self.result == "okay":
+            return self.result
+
+        with tracing.span("submit answer", "game", number=self.number) as submit_span:
+            self.tracker.update(text)
+            if self.tracker.accepts():
+                self.result = "okay"
+            elif self.alphabet is not None and not set(text.replace(" ", "")) <= self.alphabet:
+                self.result = "bug"
+            else:
+                self.result = "wrong"
+
+            if self.result != "bug":
+                self.scheduler.record(self.number, self.result == "okay")
+                if self.attempt_log is not None:
+                    self.attempt_log.record(self.game_type, self.difficulty, self.number, text,
+                                            self.result == "okay", (self.clock() - self.started) * 1000)
+            submit_span.set(result=self.result)
+        return self.result
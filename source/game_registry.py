@@ -0,0 +1,188 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Game Registry
+"""
+
+import importlib
+from types import ModuleType
+from typing import Dict, List, Optional
+
+from _constants import (
+    DIFFICULTY_LEVELS,
+    MATHEMATICS_TITLE,
+    SPELLING_TITLE,
+    WORK_IN_PROGRESS_TITLE,
+    SOUND_IMAGE_PATH,
+    GREATER_EQUAL_IMAGE_PATH,
+)
+from utils import tracing
+
+# Subjects of the games, with their titles
+SUBJECTS: Dict[str, str] = {
+    "mathematics": MATHEMATICS_TITLE,
+    "spelling": SPELLING_TITLE,
+}
+
+
+class Game:
+    """
+    Represents the declaration of a game.
+
+    The Game class describes where a game appears in the menus (subject, section, label and icon),
+    its difficulty levels, and the module building its canvas. The module is only imported the first time
+    the game is played, so that declaring more games does not slow down the startup.
+    A game without a module is shown in the menus as a work in progress.
+    """
+
+    def __init__(
+        self,
+        game_type: str,
+        subject: str,
+        section: str,
+        label: str,
+        title: str = WORK_IN_PROGRESS_TITLE,
+        icon: Optional[str] = None,
+        levels: Optional[List[int]] = None,
+        module: Optional[str] = None,
+        listening: bool = False,
+    ):
+        """
+        Initialize the Game.
+
+        Args:
+            game_type: The identifier of the game, also written in the attempt log.
+            subject: The subject of the game, a key of SUBJECTS.
+            section: The title of the section of the subject menu listing the game.
+            label: The label of the button of the game.
+            title: The title of the navigation bar during the game.
+            icon: The path of the icon of the button, if any.
+            levels: The difficulty levels (largest number of each level). Defaults to DIFFICULTY_LEVELS.
+            module: The module building the canvas of a session with a `build(app, game_type, difficulty)`
+                function, or None if the game is not available yet.
+            listening: Whether the target of a round is a number heard by the player, so that the errors
+                of the game are counted in the statistics of the numbers.
+        """
+
+        self.game_type = game_type
+        self.subject = subject
+        self.section = section
+        self.label = label
+        self.title = title
+        self.icon = icon
+        self.levels = levels or DIFFICULTY_LEVELS
+        self.module = module
+        self.listening = listening
+
+    @property
+    def playable(self) -> bool:
+        """
+        Check whether the game is available.
+
+        Returns:
+            bool: True if the game has a module, False otherwise.
+        """
+
+        return self.module is not None
+
+    def load(self) -> ModuleType:
+        """
+        Returns the module of the game, importing it on first use.
+
+        Returns:
+            ModuleType: The module of the game.
+        """
+
+        with tracing.span("load game", "navigation", game_type=self.game_type, module=self.module):
+            return importlib.import_module(self.module)
+
+
+# The games, in the order of the menus
+GAMES: List[Game] = [
+    Game("sound-to-number", "mathematics", "Écriture du nombre", "Son vers Nombre",
+         title="Écoute et écris en chiffres", icon=SOUND_IMAGE_PATH, module="games.sound_to_number",
+         listening=True),
+    Game("sound-to-word", "mathematics", "Écriture du nombre", "Son vers Mot",
+         title="Écoute et écris en mots", icon=SOUND_IMAGE_PATH, module="games.sound_to_word",
+         listening=True),
+    Game("compare", "mathematics", "Comparaison", "Comparer",
+         title="Compare les nombres", icon=GREATER_EQUAL_IMAGE_PATH, module="games.compare"),
+    Game("count", "mathematics", "Dénombrement", "Compter"),
+    Game("simple-syllable", "spelling", "Encodage", "Son Simple : Syllabe", icon=SOUND_IMAGE_PATH),
+    Game("simple-word", "spelling", "Encodage", "Son Simple : Mot", icon=SOUND_IMAGE_PATH),
+    Game("complex-syllable", "spelling", "Encodage", "Son Complexe : Syllabe", icon=SOUND_IMAGE_PATH),
+    Game("complex-word", "spelling", "Encodage", "Son Complexe : Mot", icon=SOUND_IMAGE_PATH),
+]
+
+_GAMES_BY_TYPE: Dict[str, Game] = {game.game_type: game for game in GAMES}
+
+
+def get_game(game_type: str) -> Optional[Game]:
+    """
+    Returns the declaration of a game.
+
+    Args:
+        game_type (str): The identifier of the game.
+
+    Returns:
+        Optional[Game]: The game, or None if no game has this identifier.
+
+    Examples:
+        >>> get_game("compare").title
+        'Compare les nombres'
+    """
+
+    return _GAMES_BY_TYPE.get(game_type)
+
+
+def playable_games() -> List[Game]:
+    """
+    Returns the games that are available.
+
+    Returns:
+        List[Game]: The games with a module, in the order of the menus.
+
+    Examples:
+        >>> [game.game_type for game in playable_games()]
+        ['sound-to-number', 'sound-to-word', 'compare']
+    """
+
+    return [game for game in GAMES if game.playable]
+
+
+def listening_game_types() -> List[str]:
+    """
+    Returns the games whose target is a number heard by the player.
+
+    Returns:
+        List[str]: The identifiers of the games.
+
+    Examples:
+        >>> listening_game_types()
+        ['sound-to-number', 'sound-to-word']
+    """
+
+    return [game.game_type for game in GAMES if game.listening]
+
+
+def subject_sections(subject: str) -> List[dict]:
+    """
+    Returns the sections of the menu of a subject.
+
+    Args:
+        subject (str): The subject, a key of SUBJECTS.
+
+    Returns:
+        List[dict]: The title of each section and its games, in the order of the registry.
+
+    Examples:
+        >>> [section["title"] for section in subject_sections("mathematics")]
+        ['Écriture du nombre', 'Comparaison', 'Dénombrement']
+    """
+
+    sections: Dict[str, dict] = {}
+    for game in GAMES:
+        if game.subject == subject:
+            sections.setdefault(game.section, {"title": game.section, "games": []})["games"].append(game)
+    return list(sections.values())
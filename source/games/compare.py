@@ -0,0 +1,32 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Compare Game
+"""
+
+import tkinter as tk
+
+from components.game_canvas import CompareCanvas
+from engine.compare_game import CompareGame
+
+
+def build(app: tk.Tk, game_type: str, difficulty: int) -> tk.Frame:
+    """
+    Build the canvas of a session of the game: the player compares two numbers.
+
+    Args:
+        app (tk.Tk): The main application.
+        game_type (str): The identifier of the game, written in the attempt log.
+        difficulty (int): The largest number of the session.
+
+    Returns:
+        tk.Frame: The canvas of the game.
+
+    Examples:
+        >>> build(app, "compare", 100)
+        <CompareCanvas object .!comparecanvas>
+    """
+
+    game = CompareGame(difficulty, attempt_log=app.get_attempt_log(), game_type=game_type)
+    return CompareCanvas(app, game)
@@ -0,0 +1,35 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Sound To Number Game
+"""
+
+import tkinter as tk
+
+from _constants import DIGITS
+from components.game_canvas import InputCanvas
+from engine.input_game import InputGame
+from utils.answer_automaton import digit_answers
+
+
+def build(app: tk.Tk, game_type: str, difficulty: int) -> tk.Frame:
+    """
+    Build the canvas of a session of the game: a number is spoken, the player writes it in digits.
+
+    Args:
+        app (tk.Tk): The main application.
+        game_type (str): The identifier of the game, written in the attempt log.
+        difficulty (int): The largest number of the session.
+
+    Returns:
+        tk.Frame: The canvas of the game.
+
+    Examples:
+        >>> build(app, "sound-to-number", 100)
+        <InputCanvas object .!inputcanvas>
+    """
+
+    game = InputGame(difficulty, digit_answers, alphabet=DIGITS, attempt_log=app.get_attempt_log(),
+                     game_type=game_type)
+    return InputCanvas(app, game, app.get_speech_service())
@@ -5,8 +5,11 @@
 Main Application
 """
 
+import os
+import threading
 import tkinter as tk
-import num2words
+from functools import partial
+from typing import Callable, Tuple
 
 from _constants import (
     APP_TITLE,
@@ -14,18 +17,24 @@ from _constants import (
     WINDOW_HEIGHT,
     FAVICON_PATH,
     SUBJECT_TITLE,
-    MATHEMATICS_TITLE,
-    SPELLING_TITLE,
     DIFFICULTY_TITLE,
     WORK_IN_PROGRESS_TITLE,
+    REPORT_TITLE,
+    ATLAS_VARIANTS,
+    WARMUP_CLIP_COUNT,
+    WARMUP_STATUS_TEXT,
 )
 from components.header import NavigationBar
 from components.main_canvas import MainCanvas
-from components.subject_canvas import MathsCanvas, SpellingCanvas
+from components.subject_canvas import SubjectCanvas
 from components.work_in_progress import WorkInProgress
 from components.difficulty_canvas import DifficultyCanvas
-from components.game_canvas import InputCanvas, CompareCanvas
-from utils.my_widgets import MyFrame
+from game_registry import SUBJECTS, get_game
+from utils.screen_manager import ScreenManager
+from utils.image_cache import image_cache, get_image
+from utils.warmup import Warmup
+from utils.watchdog import Watchdog
+from utils import tracing
 
 
 class MainApplication(tk.Tk):
@@ -62,35 +71,205 @@ class MainApplication(tk.Tk):
         self.nav_bar = NavigationBar(self, APP_TITLE)
         self.nav_bar.grid(row=0, column=0, sticky=tk.NSEW)
 
-        # Create a main frame to hold content
-        self.main_frame = MyFrame(self)
-        self.main_frame.grid(row=1, column=0, sticky=tk.NSEW)
+        # Keep the visited screens alive in the main row to show them again instantly
+        self.screen_manager = ScreenManager(self, row=1, column=0)
 
         # Initialise the global variables
         self.subject = ""
         self.game_type = ""
         self.difficulty = ""
 
+        # The audio subsystems are loaded when a game first needs them, to show the menu sooner
+        self.audio_engine = None
+        self.speech_backend = None
+        self.speech_backend_lock = threading.Lock()  # The backend is created by the warm-up or a game, once
+        self.speech_service = None
+        self.warmup = None
+        self.attempt_log = None
+
+        # Report the freezes of the event loop, started with the event loop
+        self.watchdog = Watchdog(self)
+        self.protocol("WM_DELETE_WINDOW", self.close)
+
         # Initialize with
         self.show_main_canvas()
 
-    def replace_canvas(self, canvas: tk.Frame, title: str, callback: callable) -> None:
+    def close(self) -> None:
+        """
+        Close the application.
+
+        Stops the speech service and the audio engine, and writes the pending attempts, before destroying the window.
+
+        Returns:
+            None
+        """
+
+        self.watchdog.stop()
+        tracing.instant("watchdog statistics", "watchdog", **self.watchdog.stats())
+        if self.warmup:
+            self.warmup.cancel()
+        if self.speech_service:
+            self.speech_service.stop()
+        if self.audio_engine:
+            tracing.instant("audio engine statistics", "audio", **self.audio_engine.stats())
+            self.audio_engine.quit()
+        if self.attempt_log:
+            self.attempt_log.stop()
+            tracing.instant("attempt log statistics", "attempts", **self.attempt_log.stats())
+        tracing.instant("image cache statistics", "image", **image_cache.stats())
+        tracing.instant("screen manager statistics", "screen", **self.screen_manager.stats())
+        self.destroy()
+
+    def get_audio_engine(self):
+        """
+        Returns the audio engine, creating it on first use (Tk thread).
+
+        The audio output itself is initialized once for the whole application, off the Tk thread:
+        by the warm-up, or else by the speech service before the first playback.
+
+        Returns:
+            AudioEngine: The audio output of the application.
+        """
+
+        if self.audio_engine is None:
+            from audio.audio_engine import AudioEngine
+
+            self.audio_engine = AudioEngine()
+
+        return self.audio_engine
+
+    def get_speech_backend(self):
+        """
+        Returns the text-to-speech backend, creating it on first use (from any thread).
+
+        Creating the backend opens the clip cache (and its shared index) and loads the offline voice,
+        so the warm-up creates it on its worker thread, before a game needs it.
+
+        Returns:
+            TTSBackend: The configured text-to-speech backend.
+        """
+
+        with self.speech_backend_lock:
+            if self.speech_backend is None:
+                from audio.tts_backends import create_backend
+
+                self.speech_backend = create_backend()
+
+        return self.speech_backend
+
+    def get_speech_service(self):
+        """
+        Returns the speech service, starting it and the audio output on first use.
+
+        Returns:
+            SpeechService: The service speaking the numbers on a worker thread.
+        """
+
+        if self.speech_service is None:
+            from audio.speech_service import SpeechService
+
+            # Speak the numbers on a worker thread to keep the window responsive
+            self.speech_service = SpeechService(self, self.get_audio_engine(), backend=self.get_speech_backend())
+            self.speech_service.start()
+
+        return self.speech_service
+
+    def get_attempt_log(self):
+        """
+        Returns the log of the answers, starting its writer thread on first use.
+
+        Returns:
+            AttemptLog: The log appending the answers of the player to the per-user data directory.
+        """
+
+        if self.attempt_log is None:
+            from utils.attempt_log import AttemptLog
+
+            self.attempt_log = AttemptLog()
+            self.attempt_log.start()
+
+        return self.attempt_log
+
+    def start_warmup(self) -> None:
+        """
+        Warm up the subsystems of the games in the background, once the window is shown.
+
+        Primes the image cache with every image variant, creates the speech backend, initializes the audio output,
+        then synthesizes and decodes the most common clips, so that the first round starts as fast as the next ones.
+        The modules of the games are not imported: a game is only imported the first time it is played.
+        The progress is shown in the navigation bar.
+
+        Returns:
+            None
+        """
+
+        self.warmup = Warmup(self, on_progress=self.show_warmup_progress)
+
+        for path, size, rotation in ATLAS_VARIANTS:
+            self.warmup.add(f"image {os.path.basename(path)} {size[0]}x{size[1]}",
+                            partial(get_image, path, size, rotation))
+
+        audio_engine = self.get_audio_engine()
+        self.warmup.add("speech backend", self.get_speech_backend, background=True)
+        self.warmup.add("audio", audio_engine.start, background=True)
+        for number in range(WARMUP_CLIP_COUNT):
+            self.warmup.add(f"clip {number}", partial(self.preload_clip, str(number)), background=True)
+
+        self.nav_bar.set_status(f"{WARMUP_STATUS_TEXT} 0 %")
+        self.warmup.start()
+
+    def show_warmup_progress(self, done: int, total: int, label: str) -> None:
+        """
+        Show the progress of the warm-up in the navigation bar, and hide it once the warm-up is finished.
+
+        Args:
+            done: The number of finished steps.
+            total: The total number of steps.
+            label: The label of the finished step.
+
+        Returns:
+            None
+        """
+
+        tracing.instant("warm-up progress", "warmup", done=done, total=total, step=label)
+        self.nav_bar.set_status(f"{WARMUP_STATUS_TEXT} {done * 100 // total} %" if done < total else "")
+
+    def preload_clip(self, text: str) -> None:
+        """
+        Synthesize the clip of a text and decode it, ahead of its first playback.
+
+        Args:
+            text: The text to speak.
+
+        Returns:
+            None
+        """
+
+        self.audio_engine.preload(text, self.get_speech_backend().synthesize(text))
+
+    def replace_canvas(
+        self, key: tuple, build: Callable[[], tk.Frame], title: str, callback: callable, cache: bool = True
+    ) -> None:
         """
         Replace the main canvas.
 
         Args:
-            canvas: The new canvas to replace the current main canvas.
+            key: The identifier of the new canvas, under which it is kept alive.
+            build: The function building the new canvas, called only if it is not alive yet.
             title: The new title for the navigation bar.
             callback: The new callback function for the navigation bar.
+            cache: Whether the canvas is kept alive once another canvas is shown.
 
         Returns:
             None
         """
 
-        self.main_frame.destroy()
-        self.main_frame = canvas
-        self.main_frame.grid(row=1, column=0, sticky=tk.NSEW)
-        self.nav_bar.update_nav_bar(title, callback)
+        with tracing.span("show screen", "screen", key=key, cache=cache) as screen_span:
+            builds = self.screen_manager.builds
+            self.screen_manager.show(key, build, cache=cache)
+            self.nav_bar.update_nav_bar(title, callback)
+            self.update_idletasks()  # Include the layout of the screen
+            screen_span.set(built=self.screen_manager.builds > builds)
 
     def show_main_canvas(self) -> None:
         """
@@ -102,63 +281,96 @@ class MainApplication(tk.Tk):
             None
         """
 
-        self.replace_canvas(MainCanvas(
-            self, show_subject_canvas=self.show_subject_canvas), SUBJECT_TITLE, None)
+        self.replace_canvas(("main",), lambda: MainCanvas(
+            self, show_subject_canvas=self.show_subject_canvas, show_report_canvas=self.show_report_canvas),
+            SUBJECT_TITLE, None)
+
+        # The subjects are likely to be opened next
+        for subject in SUBJECTS:
+            self.screen_manager.prebuild(("subject", subject), lambda s=subject: self.build_subject_canvas(s)[0])
+
+    def show_report_canvas(self) -> None:
+        """
+        Show the report of the progress of the player.
+
+        The attempts are loaded when the report is shown, so that it includes the last answers.
+
+        Returns:
+            None
+        """
+
+        from components.report_canvas import ReportCanvas
+        from utils.analytics import load_history
+
+        tracing.instant("report selected", "navigation")
+        if self.attempt_log:
+            self.attempt_log.flush(timeout=1.0)
+
+        self.replace_canvas(("report",), lambda: ReportCanvas(self, load_history().report()), REPORT_TITLE,
+                            self.show_main_canvas, cache=False)
+
+    def build_subject_canvas(self, subject: str) -> Tuple[tk.Frame, str]:
+        """
+        Build the canvas of a subject.
+
+        Args:
+            subject: The subject, a key of SUBJECTS.
+
+        Returns:
+            Tuple[tk.Frame, str]: The canvas and its title.
+        """
+
+        if subject in SUBJECTS:
+            return SubjectCanvas(self, subject, show_difficulty_callback=self.show_difficulty_canvas), SUBJECTS[subject]
+
+        tracing.instant("subject not supported", "navigation", subject=subject)
+        return WorkInProgress(self), WORK_IN_PROGRESS_TITLE
 
     def show_subject_canvas(self, subject: str = None) -> None:
         """
         Show the subject canvas.
 
         Args:
-            subject: The subject to show. Can be "mathematics" or "spelling".
+            subject: The subject to show, a key of SUBJECTS.
 
         Returns:
             None
         """
 
         if subject:
-            print(f'Subject "{subject}" selected.')
+            tracing.instant("subject selected", "navigation", subject=subject)
             self.subject = subject
 
-        if self.subject == "mathematics":
-            canvas = MathsCanvas(
-                self, show_difficulty_callback=self.show_difficulty_canvas)
-            header_title = MATHEMATICS_TITLE
-        elif self.subject == "spelling":
-            canvas = SpellingCanvas(
-                self, show_difficulty_callback=self.show_difficulty_canvas)
-            header_title = SPELLING_TITLE
-        else:
-            print(f'Subject "{subject}" not yet supported...')
-            canvas = WorkInProgress(self)
-            header_title = WORK_IN_PROGRESS_TITLE
+        header_title = SUBJECTS.get(self.subject, WORK_IN_PROGRESS_TITLE)
 
-        self.replace_canvas(canvas, header_title, self.show_main_canvas)
+        self.replace_canvas(("subject", self.subject), lambda: self.build_subject_canvas(self.subject)[0],
+                            header_title, self.show_main_canvas)
 
     def show_difficulty_canvas(self, game_type: str = None) -> None:
         """
         Show the difficulty canvas.
 
         Args:
-            game_type: The game type to show. Can be "sound-to-number", "sound-to-word", or "compare".
+            game_type: The game type to show, declared in the game registry.
 
         Returns:
             None
         """
         if game_type:
-            print(f'Subject "{game_type}" selected.')
+            tracing.instant("game type selected", "navigation", game_type=game_type)
             self.game_type = game_type
 
-        if game_type in {"sound-to-number", "sound-to-word", "compare"}:
-            canvas = DifficultyCanvas(
-                self, game_type=self.game_type, show_game_canvas=self.show_game_canvas)
+        game = get_game(game_type)
+        if game and game.playable:
+            build = partial(DifficultyCanvas, self, game_type=game_type,
+                            show_game_canvas=self.show_game_canvas, levels=game.levels)
             header_title = DIFFICULTY_TITLE
         else:
-            print(f'Game type "{game_type}" not yet supported...')
-            canvas = WorkInProgress(self)
+            tracing.instant("game type not supported", "navigation", game_type=game_type)
+            build = partial(WorkInProgress, self)
             header_title = WORK_IN_PROGRESS_TITLE
 
-        self.replace_canvas(canvas, header_title,
+        self.replace_canvas(("difficulty", game_type), build, header_title,
                             lambda: self.show_subject_canvas(self.subject))
 
     def show_game_canvas(self, game_type: str = None, difficulty: int = None) -> None:
@@ -168,7 +380,7 @@ class MainApplication(tk.Tk):
         Clears the main frame and shows the game canvas with the specified difficulty level.
 
         Args:
-            game_type: The game type to show. Can be "compare", "sound-to-number", or "sound-to-word".
+            game_type: The game type to show, declared in the game registry.
             difficulty: The selected difficulty level.
 
         Returns:
@@ -180,23 +392,17 @@ class MainApplication(tk.Tk):
         if game_type:
             self.game_type = game_type
 
-        print(
-            f'Game type "{game_type}" in difficulty "{difficulty}" is selected.')
-
-        if game_type == "sound-to-number":
-            canvas = InputCanvas(self, self.difficulty,
-                                 lambda input, number: int(input) == number)
-            header_title = "Écoute et écris en chiffres"
-        elif game_type == "sound-to-word":
-            canvas = InputCanvas(self, self.difficulty, lambda input,
-                                 number: input == num2words.num2words(number, lang="fr"))
-            header_title = "Écoute et écris en mots"
-        elif game_type == "compare":
-            canvas = CompareCanvas(self, self.difficulty)
-            header_title = "Compare les nombres"
+        tracing.instant("difficulty selected", "navigation", game_type=game_type, difficulty=difficulty)
+
+        # The module of a game and its subsystems are only imported once the game is started
+        game = get_game(game_type)
+        if game and game.playable:
+            build = partial(game.load().build, self, game_type, self.difficulty)
+            header_title = game.title
         else:
-            canvas = WorkInProgress(self)
+            build = partial(WorkInProgress, self)
             header_title = WORK_IN_PROGRESS_TITLE
 
-        self.replace_canvas(canvas, header_title,
-                            lambda: self.show_difficulty_canvas(game_type))
+        # A game is built fresh for every session
+        self.replace_canvas(("game", game_type, self.difficulty), build, header_title,
+                            lambda: self.show_difficulty_canvas(game_type), cache=False)
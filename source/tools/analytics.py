@@ -0,0 +1,106 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Analytics
+
+Reports the learning analytics of one or several attempt logs (for instance the logs of the players of a class):
+the accuracy, the error rates by range of numbers (the "soixante-dix" and "quatre-vingt" ranges),
+the hardest numbers, the response time percentiles and the progress by day.
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import List, Optional
+
+from utils.analytics import load_histories
+from utils.attempt_log import default_path
+
+
+def percent(value: Optional[float]) -> str:
+    """
+    Returns a rate as a percentage.
+
+    Args:
+        value (Optional[float]): The rate, between 0 and 1, or None.
+
+    Returns:
+        str: The percentage, or "-" for None.
+
+    Examples:
+        >>> percent(0.125)
+        '12.5 %'
+    """
+
+    return "-" if value is None else f"{value * 100:.1f} %"
+
+
+def print_report(report: dict) -> None:
+    """
+    Print a report as text.
+
+    Args:
+        report (dict): The report, as returned by AttemptHistory.report.
+
+    Returns:
+        None
+    """
+
+    print(f"Attempts: {report['attempts']}, accuracy: {percent(report['accuracy'])}")
+
+    print(f"Error rates by the last two digits ({report['listening_attempts']} attempts of the listening games):")
+    for label, stats in report["ranges"].items():
+        print(f"  {label:>6}: {percent(stats['error_rate']):>8}  ({stats['attempts']} attempts)")
+
+    print("Hardest numbers:")
+    for stats in report["hardest"]:
+        print(f"  {stats['number']:>8}: {percent(stats['error_rate']):>8}  ({stats['attempts']} attempts)")
+
+    print("Response times:")
+    for game_type, percentiles in report["response_ms"].items():
+        print(f"  {game_type}: " + ", ".join(f"{name} {value:.0f} ms" for name, value in percentiles.items()))
+
+    print("Progress by day:")
+    for stats in report["progress"]:
+        print(f"  {stats['day']}: {percent(stats['accuracy']):>8}  ({stats['attempts']} attempts)")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Load the attempt logs, and print their report.
+
+    Args:
+        argv (Optional[List[str]]): The command line arguments. Defaults to sys.argv.
+
+    Returns:
+        int: The exit code, 1 if an attempt log does not exist.
+
+    Examples:
+        >>> main(["--game-type", "sound-to-word"])
+        0
+        >>> main(["--json", "alice.sqlite3", "bob.sqlite3"])
+        0
+    """
+
+    parser = argparse.ArgumentParser(prog="analytics", description="Report the learning analytics of attempt logs.")
+    parser.add_argument("paths", nargs="*", help="attempt logs (default: the attempt log of the user)")
+    parser.add_argument("--game-type", help="only report the attempts of a game type")
+    parser.add_argument("--difficulty", type=int, help="only report the attempts of a difficulty")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    paths = args.paths or [default_path()]
+    missing = [path for path in paths if not os.path.exists(path)]
+    if missing:
+        print(f"Attempt log not found: {', '.join(missing)}", file=sys.stderr)
+        return 1
+
+    report = load_histories(paths).filter(args.game_type, args.difficulty).report()
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+    return 0
@@ -0,0 +1,345 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark
+
+Times the paths that make navigation and rounds feel slow, and writes the results as JSON to compare commits:
+round generation and answer validation at every level (headless engine), the learning analytics of a large
+synthetic attempt history, and, when a display is available,
+the startup of MainApplication, each screen transition and the construction of the game canvases.
+
+On Linux without a display, a virtual X server is started if `Xvfb` is installed (`apt install xvfb`).
+The audio goes to the SDL null sink and the numbers are spoken by the local silent backend,
+so that neither an audio device nor internet access is needed.
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+
+from _constants import DIFFICULTY_LEVELS, DIGITS
+from game_registry import SUBJECTS, playable_games
+
+VIRTUAL_DISPLAY = ":99"
+
+
+def measure(function: Callable[[], object], runs: int) -> dict:
+    """
+    Time the runs of a function.
+
+    Args:
+        function (Callable[[], object]): The function to time.
+        runs (int): The number of runs.
+
+    Returns:
+        dict: The first, median, minimum and mean times of a run, in milliseconds.
+    """
+
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        function()
+        times.append((time.perf_counter() - start) * 1000)
+
+    return {
+        "runs": runs,
+        "first_ms": times[0],
+        "median_ms": statistics.median(times),
+        "min_ms": min(times),
+        "mean_ms": statistics.fmean(times),
+    }
+
+
+def benchmark_engine(results: Dict[str, dict], rounds: int) -> None:
+    """
+    Time the round generation and the answer validation of the games at every level.
+
+    Args:
+        results (Dict[str, dict]): The results, completed by the benchmark.
+        rounds (int): The number of rounds of each measure.
+
+    Returns:
+        None
+    """
+
+    from engine.compare_game import CompareGame
+    from engine.input_game import InputGame
+    from utils.answer_automaton import digit_answers, word_answers
+
+    for level in DIFFICULTY_LEVELS:
+        results[f"engine.setup[{level}]"] = measure(lambda: InputGame(level, digit_answers), 5)
+
+        game = InputGame(level, digit_answers, alphabet=DIGITS)
+        results[f"engine.round[{level}]"] = measure(game.next_round, rounds)
+
+        for name, answers, alphabet in (("digits", digit_answers, DIGITS), ("words", word_answers, None)):
+            game = InputGame(level, answers, alphabet=alphabet)
+
+            def play_round():
+                number = game.next_round()
+                answer = answers(number)[-1]
+                for length in range(1, len(answer) + 1):  # Every keystroke
+                    game.type(answer[:length])
+                game.submit(answer)
+
+            results[f"engine.validate.{name}[{level}]"] = measure(play_round, rounds)
+
+        game = CompareGame(level)
+
+        def compare_round():
+            first, second = game.next_round()
+            game.submit("<" if first < second else "=" if first == second else ">")
+
+        results[f"engine.compare[{level}]"] = measure(compare_round, rounds)
+
+
+def benchmark_analytics(results: Dict[str, dict], attempts: int) -> None:
+    """
+    Time the loading of a snapshot and the computation of the report, over a synthetic attempt history.
+
+    Args:
+        results (Dict[str, dict]): The results, completed by the benchmark.
+        attempts (int): The number of attempts of the history.
+
+    Returns:
+        None
+    """
+
+    import numpy as np
+    from utils.analytics import AttemptHistory, read_snapshot, write_snapshot
+
+    rng = np.random.default_rng(0)
+    history = AttemptHistory(
+        [game.game_type for game in playable_games()],
+        time.time() - rng.random(attempts) * 90 * 86400,
+        rng.integers(0, len(playable_games()), attempts),
+        np.full(attempts, 100),
+        rng.integers(0, 101, attempts),
+        rng.random(attempts) < 0.8,
+        rng.gamma(2.0, 1500.0, attempts),
+    )
+
+    results[f"analytics.report[{attempts}]"] = measure(history.report, 5)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "snapshot.npz")
+        write_snapshot(path, history, attempts)
+        results[f"analytics.snapshot[{attempts}]"] = measure(lambda: read_snapshot(path), 5)
+
+
+def start_virtual_display() -> Optional[subprocess.Popen]:
+    """
+    Start a virtual X server if there is no display and Xvfb is installed.
+
+    Returns:
+        Optional[subprocess.Popen]: The X server process, or None if none was started.
+    """
+
+    if os.environ.get("DISPLAY") or sys.platform in ("win32", "darwin") or not shutil.which("Xvfb"):
+        return None
+
+    server = subprocess.Popen(["Xvfb", VIRTUAL_DISPLAY, "-screen", "0", "1280x1024x24", "-nolisten", "tcp"],
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    os.environ["DISPLAY"] = VIRTUAL_DISPLAY
+    time.sleep(1)  # Let the server accept connections
+    return server
+
+
+def display_error() -> Optional[str]:
+    """
+    Check whether a Tk window can be created.
+
+    Returns:
+        Optional[str]: The error raised when opening the display, or None if a window can be created.
+
+    Examples:
+        >>> display_error()
+        'no display name and no $DISPLAY environment variable'
+    """
+
+    import tkinter as tk
+
+    try:
+        tk.Tk().destroy()
+    except tk.TclError as error:
+        return str(error)
+    return None
+
+
+def benchmark_screens(results: Dict[str, dict], runs: int) -> None:
+    """
+    Time the startup of the application, the screen transitions and the construction of the game canvases.
+
+    Args:
+        results (Dict[str, dict]): The results, completed by the benchmark.
+        runs (int): The number of runs of each measure.
+
+    Returns:
+        None
+    """
+
+    from audio.audio_engine import AudioEngine
+    from audio.speech_service import SpeechService
+    from audio.tts_backends import SilentBackend
+    from components.game_canvas import InputCanvas, CompareCanvas
+    from engine.compare_game import CompareGame
+    from engine.input_game import InputGame
+    from main_application import MainApplication
+    from utils.answer_automaton import digit_answers
+
+    def startup():
+        app = MainApplication()
+        app.update()
+        app.destroy()
+
+    results["app.startup"] = measure(startup, runs)
+
+    app = MainApplication()
+    app.audio_engine = AudioEngine()
+    app.speech_service = SpeechService(app, app.audio_engine, backend=SilentBackend())
+    app.speech_service.start()
+    app.update()
+
+    def transition(show: Callable[[], None]) -> Callable[[], None]:
+        def run():
+            show()
+            app.update_idletasks()
+        return run
+
+    transitions = [("show_main_canvas", app.show_main_canvas)]
+    for subject in SUBJECTS:
+        transitions.append((f"show_subject_canvas[{subject}]", lambda s=subject: app.show_subject_canvas(s)))
+    for game_type in (game.game_type for game in playable_games()):
+        transitions.append((f"show_difficulty_canvas[{game_type}]",
+                            lambda g=game_type: app.show_difficulty_canvas(g)))
+        transitions.append((f"show_game_canvas[{game_type}]",
+                            lambda g=game_type: app.show_game_canvas(g, DIFFICULTY_LEVELS[0])))
+    for name, show in transitions:
+        results[f"screen.{name}"] = measure(transition(show), runs)
+    app.show_main_canvas()
+
+    for level in DIFFICULTY_LEVELS:
+        def build_input():
+            InputCanvas(app, InputGame(level, digit_answers, alphabet=DIGITS), app.speech_service).destroy()
+
+        def build_compare():
+            CompareCanvas(app, CompareGame(level)).destroy()
+
+        results[f"canvas.InputCanvas[{level}]"] = measure(build_input, runs)
+        results[f"canvas.CompareCanvas[{level}]"] = measure(build_compare, runs)
+
+    app.update()
+    app.close()
+
+
+def git_commit() -> Optional[str]:
+    """
+    Returns the commit of the working tree, if it is a git repository.
+
+    Returns:
+        Optional[str]: The hash of the commit, or None.
+    """
+
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict]) -> None:
+    """
+    Print the median times against the ones of a previous run.
+
+    Args:
+        results (Dict[str, dict]): The results of this run.
+        baseline (Dict[str, dict]): The results of the previous run.
+
+    Returns:
+        None
+    """
+
+    for name, result in results.items():
+        if name in baseline:
+            before, after = baseline[name]["median_ms"], result["median_ms"]
+            print(f"  {name:45} {before:10.3f} -> {after:10.3f} ms  (x{after / before if before else float('inf'):.2f})")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the benchmarks and write their results as JSON.
+
+    Args:
+        argv (Optional[List[str]]): The command line arguments. Defaults to sys.argv.
+
+    Returns:
+        int: The exit code.
+
+    Examples:
+        >>> main(["--output", "benchmark.json", "--compare", "previous-benchmark.json"])
+        0
+    """
+
+    parser = argparse.ArgumentParser(prog="benchmark", description="Time the screens and the rounds of the games.")
+    parser.add_argument("--output", help="path of the JSON results (default: printed)")
+    parser.add_argument("--compare", help="path of the JSON results of a previous run to compare with")
+    parser.add_argument("--rounds", type=int, default=2000, help="rounds of each engine measure (default: 2000)")
+    parser.add_argument("--attempts", type=int, default=1_000_000,
+                        help="attempts of the synthetic history of the analytics measures (default: 1000000)")
+    parser.add_argument("--runs", type=int, default=10, help="runs of each screen measure (default: 10)")
+    parser.add_argument("--headless", action="store_true", help="only run the benchmarks that need no display")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")  # Null audio sink
+
+    results: Dict[str, dict] = {}
+    report = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "skipped": None,
+        "results": results,
+    }
+
+    benchmark_engine(results, args.rounds)
+    benchmark_analytics(results, args.attempts)
+
+    if args.headless:
+        report["skipped"] = "screens (--headless)"
+    else:
+        server = start_virtual_display()
+        try:
+            error = display_error()
+            if error:  # No display, no Xvfb to start one: any other failure fails the run
+                report["skipped"] = f"screens ({error})"
+                print(f"Screen benchmarks skipped: {error}")
+            else:
+                benchmark_screens(results, args.runs)
+        finally:
+            if server:
+                server.terminate()
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output)
+    else:
+        print(output)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)
+        print(f"Median times, {baseline.get('commit')} -> {report['commit']}:")
+        compare(results, baseline["results"])
+
+    return 0
@@ -0,0 +1,103 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Build Atlas
+
+Packs every image variant listed in ATLAS_VARIANTS into a single PNG (`assets/atlas.png`) and its index
+(`assets/atlas.json`), so that the application loads its images with Tk alone. Pillow is only needed by this tool.
+"""
+
+import argparse
+import json
+from typing import Dict, List, Optional, Tuple
+
+from PIL import Image
+
+from _constants import ATLAS_PATH, ATLAS_INDEX_PATH, ATLAS_VARIANTS, ATLAS_WIDTH
+from utils.atlas import variant_name
+
+PADDING = 1  # Transparent pixels between two variants
+
+
+def render_variant(path: str, size: Tuple[int, int], rotation: int) -> Image.Image:
+    """
+    Render an image variant exactly as the components used to: resized, then rotated.
+
+    Args:
+        path (str): The path of the image file.
+        size (Tuple[int, int]): The size of the image (width, height), in pixels.
+        rotation (int): The counterclockwise rotation of the image, in degrees.
+
+    Returns:
+        Image.Image: The variant, in RGBA.
+    """
+
+    image = Image.open(path).resize(size)
+    if rotation:
+        image = image.rotate(rotation)
+    return image.convert("RGBA")
+
+
+def pack(sizes: List[Tuple[int, int]], width: int) -> Tuple[List[Tuple[int, int]], int]:
+    """
+    Place rectangles on shelves of a fixed width, the tallest first.
+
+    Args:
+        sizes (List[Tuple[int, int]]): The sizes of the rectangles (width, height).
+        width (int): The width of the shelves.
+
+    Returns:
+        Tuple[List[Tuple[int, int]], int]: The position of each rectangle (x, y), and the total height.
+
+    Examples:
+        >>> pack([(50, 50), (70, 70)], 128)
+        ([(71, 0), (0, 0)], 71)
+    """
+
+    positions: List[Tuple[int, int]] = [(0, 0)] * len(sizes)
+    x, y, shelf_height = 0, 0, 0
+    for index in sorted(range(len(sizes)), key=lambda i: -sizes[i][1]):
+        rectangle_width, rectangle_height = sizes[index]
+        if x and x + rectangle_width > width:
+            x, y, shelf_height = 0, y + shelf_height, 0
+        positions[index] = (x, y)
+        x += rectangle_width + PADDING
+        shelf_height = max(shelf_height, rectangle_height + PADDING)
+
+    return positions, y + shelf_height
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Build the image atlas and its index.
+
+    Args:
+        argv (Optional[List[str]]): The command line arguments. Defaults to sys.argv.
+
+    Returns:
+        int: The exit code.
+    """
+
+    parser = argparse.ArgumentParser(prog="build-atlas", description="Pack the image variants into an atlas.")
+    parser.add_argument("--output", default=ATLAS_PATH, help="path of the atlas PNG")
+    parser.add_argument("--index", default=ATLAS_INDEX_PATH, help="path of the atlas index")
+    parser.add_argument("--width", type=int, default=ATLAS_WIDTH, help="width of the atlas, in pixels")
+    args = parser.parse_args(argv)
+
+    variants = list(dict.fromkeys(ATLAS_VARIANTS))
+    images = [render_variant(*variant) for variant in variants]
+    positions, height = pack([image.size for image in images], args.width)
+
+    sheet = Image.new("RGBA", (args.width, height), (0, 0, 0, 0))
+    index: Dict[str, List[int]] = {}
+    for variant, image, position in zip(variants, images, positions):
+        sheet.paste(image, position)
+        index[variant_name(*variant)] = [*position, *image.size]
+
+    sheet.save(args.output, optimize=True)
+    with open(args.index, "w", encoding="utf-8") as file:
+        json.dump({"variants": index}, file, indent=2, sort_keys=True)
+
+    print(f"Packed {len(index)} variants into {args.output} ({args.width}x{height}).")
+    return 0
@@ -0,0 +1,127 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Build Voice
+
+Builds the morpheme clips of the offline voice (`assets/voice/<morpheme>.wav`) with gTTS.
+The clips can be replaced by real recordings, as long as they are 16-bit mono PCM at VOICE_SAMPLE_RATE.
+"""
+
+import argparse
+import io
+import os
+import wave
+from array import array
+from typing import List, Optional
+
+from gtts import gTTS
+
+from _constants import SPEECH_LANG, SPEECH_SLOW, VOICE_DIR, VOICE_SAMPLE_RATE
+from utils.french_numbers import MORPHEMES
+
+# The morphemes are named without accents (file names), their text is synthesized
+MORPHEME_TEXTS = {"zero": "zéro"}
+
+SILENCE_THRESHOLD = 500  # Amplitude (16-bit) under which a sample is considered silent
+SILENCE_MARGIN_MS = 10  # Silence kept around the trimmed morpheme
+
+
+def decode(clip: bytes) -> bytes:
+    """
+    Decode an MP3 clip into 16-bit mono PCM at VOICE_SAMPLE_RATE.
+
+    Args:
+        clip (bytes): The MP3 clip.
+
+    Returns:
+        bytes: The PCM samples.
+    """
+
+    # The decoding is done by the mixer, which does not need an audio device here
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import pygame
+
+    if pygame.mixer.get_init() != (VOICE_SAMPLE_RATE, -16, 1):
+        pygame.mixer.quit()
+        pygame.mixer.init(frequency=VOICE_SAMPLE_RATE, size=-16, channels=1)
+    return pygame.mixer.Sound(file=io.BytesIO(clip)).get_raw()
+
+
+def trim(pcm: bytes) -> bytes:
+    """
+    Remove the leading and trailing silence of PCM samples.
+
+    Args:
+        pcm (bytes): The 16-bit PCM samples.
+
+    Returns:
+        bytes: The trimmed PCM samples.
+    """
+
+    samples = array("h", pcm)
+    loud = [index for index, sample in enumerate(samples)
+            if abs(sample) > SILENCE_THRESHOLD]
+    if not loud:
+        return pcm
+
+    margin = VOICE_SAMPLE_RATE * SILENCE_MARGIN_MS // 1000
+    start = max(loud[0] - margin, 0)
+    end = min(loud[-1] + margin, len(samples))
+    return samples[start:end].tobytes()
+
+
+def build_morpheme(morpheme: str, voice_dir: str) -> str:
+    """
+    Synthesize a morpheme and save it as a WAV clip.
+
+    Args:
+        morpheme (str): The morpheme.
+        voice_dir (str): The directory of the morpheme clips.
+
+    Returns:
+        str: The path of the WAV clip.
+    """
+
+    buffer = io.BytesIO()
+    gTTS(text=MORPHEME_TEXTS.get(morpheme, morpheme),
+         lang=SPEECH_LANG, slow=SPEECH_SLOW).write_to_fp(buffer)
+
+    path = os.path.join(voice_dir, f"{morpheme}.wav")
+    with wave.open(path, "wb") as clip:
+        clip.setnchannels(1)
+        clip.setsampwidth(2)
+        clip.setframerate(VOICE_SAMPLE_RATE)
+        clip.writeframes(trim(decode(buffer.getvalue())))
+    return path
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Build the missing morpheme clips of the offline voice.
+
+    Args:
+        argv (Optional[List[str]]): The command line arguments. Defaults to sys.argv.
+
+    Returns:
+        int: The exit code.
+
+    Examples:
+        >>> main(["--force"])
+        0
+    """
+
+    parser = argparse.ArgumentParser(
+        prog="build-voice", description="Build the morpheme clips of the offline voice with gTTS.")
+    parser.add_argument("--voice-dir", default=VOICE_DIR,
+                        help="directory of the morpheme clips")
+    parser.add_argument("--force", action="store_true",
+                        help="rebuild the existing clips")
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.voice_dir, exist_ok=True)
+    for morpheme in MORPHEMES:
+        path = os.path.join(args.voice_dir, f"{morpheme}.wav")
+        if args.force or not os.path.exists(path):
+            print(f"Morpheme clip written to {build_morpheme(morpheme, args.voice_dir)}.")
+    return 0
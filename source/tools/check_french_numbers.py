@@ -0,0 +1,98 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Check French Numbers
+
+Checks that the French number converter writes every number exactly as num2words does,
+and compares the speed of both converters. num2words is only needed by this tool (`pip install num2words`).
+"""
+
+import argparse
+import random
+import time
+from typing import Callable, Iterable, List, Optional
+
+from utils.french_numbers import number_to_words
+
+BENCHMARK_SIZE = 100_000  # Numbers converted by each benchmark
+
+
+def find_mismatches(numbers: Iterable[int], reference: Callable[[int], str]) -> List[int]:
+    """
+    Returns the numbers written differently by the converter and by the reference.
+
+    Args:
+        numbers (Iterable[int]): The numbers to check.
+        reference (Callable[[int], str]): The reference converter.
+
+    Returns:
+        List[int]: The mismatching numbers.
+    """
+
+    return [number for number in numbers if number_to_words.__wrapped__(number) != reference(number)]
+
+
+def benchmark(convert: Callable[[int], str], numbers: List[int]) -> float:
+    """
+    Returns the mean time of a conversion.
+
+    Args:
+        convert (Callable[[int], str]): The converter.
+        numbers (List[int]): The numbers to convert.
+
+    Returns:
+        float: The mean time of a conversion, in microseconds.
+    """
+
+    start = time.perf_counter()
+    for number in numbers:
+        convert(number)
+    return (time.perf_counter() - start) / len(numbers) * 1e6
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Check the converter against num2words over a whole range, then benchmark both converters.
+
+    Args:
+        argv (Optional[List[str]]): The command line arguments. Defaults to sys.argv.
+
+    Returns:
+        int: The exit code, 1 if a number is written differently.
+
+    Examples:
+        >>> main(["--upper", "1000"])
+        0
+    """
+
+    parser = argparse.ArgumentParser(
+        prog="check-french-numbers", description="Check the French number converter against num2words.")
+    parser.add_argument("--upper", type=int, default=1_000_000,
+                        help="largest number of the exhaustive check (default: 1000000)")
+    parser.add_argument("--samples", type=int, default=10_000,
+                        help="random numbers checked up to the largest supported number (default: 10000)")
+    args = parser.parse_args(argv)
+
+    from num2words import num2words
+
+    def reference(number: int) -> str:
+        return num2words(number, lang="fr")
+
+    start = time.perf_counter()
+    mismatches = find_mismatches(range(args.upper + 1), reference)
+    mismatches += find_mismatches(
+        (random.randrange(10 ** 12) for _ in range(args.samples)), reference)
+    print(f"Checked 0 - {args.upper} and {args.samples} random numbers "
+          f"in {time.perf_counter() - start:.1f} s: {len(mismatches)} mismatches.")
+    for number in mismatches[:10]:
+        print(f"  {number}: {number_to_words.__wrapped__(number)!r} != {reference(number)!r}")
+
+    numbers = [random.randrange(args.upper + 1) for _ in range(BENCHMARK_SIZE)]
+    number_to_words.cache_clear()
+    print(f"num2words: {benchmark(reference, numbers):.2f} µs per number")
+    print(f"number_to_words (cold cache): {benchmark(number_to_words, numbers):.2f} µs per number")
+    recent = numbers[:1000] * (BENCHMARK_SIZE // 1000)  # Numbers asked again, as in a game session
+    print(f"number_to_words (warm cache): {benchmark(number_to_words, recent):.2f} µs per number")
+
+    return 1 if mismatches else 0
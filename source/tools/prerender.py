@@ -0,0 +1,299 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Prerender
+
+Synthesizes the clips of every number of chosen difficulty levels into a clip cache, in a pool of processes,
+so that the numbers are never synthesized at runtime. The clips already in the cache are skipped,
+so an interrupted run is resumed by running the command again.
+With the default gTTS backend, the clips go to the clip cache of the application (internet access is required),
+within its budget: the run stops once the cache is full, rather than having the application evict the clips.
+With `--cache-dir`, the clips go to a staging directory without budget, and `--pack` then writes the clips
+of the levels into a single clip pack, bundled with the application.
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Dict, Iterator, List, Optional, Set
+
+from _constants import CLIP_PACK_PATH, DIFFICULTY_LEVELS, SPEECH_LANG, SPEECH_SLOW, TTS_CACHE_MAX_BYTES
+from audio.clip_cache import ClipCache
+from audio.clip_pack import build_pack
+
+# A staging directory (`--cache-dir`) keeps every clip until it is packed: nothing is evicted while prerendering
+UNBOUNDED = sys.maxsize
+
+REPORT_INTERVAL = 5.0  # Delay (s) between two progress reports
+
+# Backend and clip cache of a worker process, created once by `init_worker`
+_worker: Dict[str, object] = {}
+
+
+def open_cache(cache_dir: Optional[str]) -> ClipCache:
+    """
+    Open the clip cache being filled.
+
+    Args:
+        cache_dir (Optional[str]): The staging directory, without budget, or None for the clip cache
+            of the application, within its budget.
+
+    Returns:
+        ClipCache: The clip cache.
+    """
+
+    return ClipCache(cache_dir, max_bytes=UNBOUNDED if cache_dir else TTS_CACHE_MAX_BYTES)
+
+
+def init_worker(backend_name: str, cache_dir: Optional[str]) -> None:
+    """
+    Create the backend and the clip cache of a worker process.
+
+    Args:
+        backend_name (str): The text-to-speech backend.
+        cache_dir (Optional[str]): The directory of the clip cache. Defaults to the clip cache of the application.
+
+    Returns:
+        None
+    """
+
+    from audio.tts_backends import GTTSBackend, create_backend
+
+    clip_cache = open_cache(cache_dir)
+    if backend_name == "gtts":  # The backend claims, caches and shares the clips itself
+        _worker["backend"] = GTTSBackend(clip_cache)
+        _worker["clip_cache"] = None
+    else:
+        _worker["backend"] = create_backend(backend_name)
+        _worker["clip_cache"] = clip_cache
+
+
+def render(text: str) -> int:
+    """
+    Synthesize the clip of a text into the clip cache (worker process).
+
+    Args:
+        text (str): The text to synthesize.
+
+    Returns:
+        int: The size of the clip, in bytes.
+    """
+
+    clip = _worker["backend"].synthesize(text)
+    if _worker["clip_cache"] is not None:
+        _worker["clip_cache"].put(text, SPEECH_LANG, SPEECH_SLOW, clip)
+    return len(clip)
+
+
+def pending_texts(levels: List[int], clip_cache: ClipCache) -> List[str]:
+    """
+    Returns the numbers of the levels whose clip is not cached yet.
+
+    Args:
+        levels (List[int]): The difficulty levels (largest number of each level).
+        clip_cache (ClipCache): The clip cache.
+
+    Returns:
+        List[str]: The numbers to synthesize, as spoken texts.
+
+    Examples:
+        >>> pending_texts([10, 20], open_cache(None))
+        ['0', '1', ..., '20']
+    """
+
+    return [
+        str(number) for number in range(max(levels) + 1)
+        if not os.path.exists(clip_cache.path(clip_cache.key(str(number), SPEECH_LANG, SPEECH_SLOW)))
+    ]
+
+
+def write_pack(path: str, levels: List[int], clip_cache: ClipCache) -> None:
+    """
+    Write the cached clips of the numbers of the levels into a clip pack.
+
+    Args:
+        path (str): The path of the pack.
+        levels (List[int]): The difficulty levels (largest number of each level).
+        clip_cache (ClipCache): The clip cache.
+
+    Returns:
+        None
+    """
+
+    keys = (clip_cache.key(str(number), SPEECH_LANG, SPEECH_SLOW) for number in range(max(levels) + 1))
+    clip_files = {key: clip_cache.path(key) for key in keys if os.path.exists(clip_cache.path(key))}
+
+    start = time.perf_counter()
+    size = build_pack(path, clip_files)
+    print(f"{len(clip_files)} clips packed into {path} ({size / 1024 / 1024:.1f} MiB) "
+          f"in {time.perf_counter() - start:.1f} s.")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse and check the command line arguments.
+
+    Args:
+        argv (Optional[List[str]]): The command line arguments. Defaults to sys.argv.
+
+    Returns:
+        argparse.Namespace: The arguments.
+    """
+
+    parser = argparse.ArgumentParser(prog="prerender", description="Synthesize the clips of the numbers ahead.")
+    parser.add_argument("--levels", type=int, nargs="+", choices=DIFFICULTY_LEVELS, default=[1000],
+                        metavar="LEVEL", help=f"difficulty levels to prerender, among {DIFFICULTY_LEVELS} (default: 1000)")
+    parser.add_argument("--backend", default="gtts", choices=["gtts", "concatenative", "silent"],
+                        help="text-to-speech backend (default: gtts)")
+    parser.add_argument("--cache-dir", help="staging directory of the clips, without budget "
+                        "(default: the clip cache of the application, within its budget, only for gtts)")
+    parser.add_argument("--pack", nargs="?", const=CLIP_PACK_PATH, help="write the clips of the levels into "
+                        f"a clip pack, requires --cache-dir (default path, only for gtts: {CLIP_PACK_PATH})")
+    parser.add_argument("--jobs", type=int, default=min(4, os.cpu_count() or 1),
+                        help="worker processes, also bounding the concurrent requests (default: up to 4)")
+    args = parser.parse_args(argv)
+
+    if args.backend != "gtts" and not args.cache_dir:
+        parser.error("--cache-dir is required with an offline backend, to keep its clips out of the gTTS cache")
+    if args.pack and not args.cache_dir:
+        parser.error("--pack requires --cache-dir: the clip cache of the application evicts clips beyond its budget")
+    if args.pack and args.backend != "gtts" and os.path.abspath(args.pack) == os.path.abspath(CLIP_PACK_PATH):
+        parser.error("--pack requires an explicit path with an offline backend, "
+                     "not to replace the bundled pack served before gTTS")
+    return args
+
+
+def submit(executor: ProcessPoolExecutor, queue: Iterator[str], running: Set[Future], limit: int) -> None:
+    """
+    Submit the next texts, until a number of texts are in flight.
+
+    Args:
+        executor (ProcessPoolExecutor): The worker processes.
+        queue (Iterator[str]): The texts not submitted yet.
+        running (Set[Future]): The texts in flight, completed with the submitted ones.
+        limit (int): The number of texts in flight.
+
+    Returns:
+        None
+    """
+
+    for text in queue:
+        future = executor.submit(render, text)
+        future.text = text
+        running.add(future)
+        if len(running) >= limit:
+            return
+
+
+def cache_full(clip_cache: ClipCache, counts: Dict[str, int], in_flight: int) -> bool:
+    """
+    Check whether the clips in flight would exceed the budget of the clip cache, and have clips evicted.
+
+    Args:
+        clip_cache (ClipCache): The clip cache.
+        counts (Dict[str, int]): The synthesized clips ("done") and their bytes ("size").
+        in_flight (int): The number of clips being synthesized.
+
+    Returns:
+        bool: True if the run must stop, False otherwise.
+    """
+
+    average_size = counts["size"] / counts["done"] if counts["done"] else 0
+    return clip_cache.stats()["bytes"] + in_flight * average_size >= clip_cache.max_bytes
+
+
+def run_pool(texts: List[str], args: argparse.Namespace, counts: Dict[str, int]) -> bool:
+    """
+    Synthesize texts in a pool of worker processes, reporting the progress.
+
+    Args:
+        texts (List[str]): The texts to synthesize.
+        args (argparse.Namespace): The arguments of the command.
+        counts (Dict[str, int]): The synthesized clips ("done"), the failures ("failed") and the bytes ("size"),
+            updated as the clips are synthesized.
+
+    Returns:
+        bool: True if every text was synthesized, False if the run stopped because the clip cache is full.
+    """
+
+    budget = None if args.cache_dir else open_cache(None)
+    start = last_report = time.perf_counter()
+    running: Set[Future] = set()
+    queue = iter(texts)
+
+    executor = ProcessPoolExecutor(args.jobs, initializer=init_worker, initargs=(args.backend, args.cache_dir))
+    try:
+        # Keep a few texts per worker in flight, not the whole level
+        submit(executor, queue, running, 2 * args.jobs)
+        while running:
+            finished, running = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                try:
+                    counts["size"] += future.result()
+                    counts["done"] += 1
+                except Exception as error:
+                    counts["failed"] += 1
+                    print(f'Clip of "{future.text}" not synthesized: {error!r}', file=sys.stderr)
+
+            if budget and cache_full(budget, counts, len(running) + 2 * args.jobs):
+                executor.shutdown(cancel_futures=True)
+                return False
+            submit(executor, queue, running, 2 * args.jobs)
+
+            if time.perf_counter() - last_report >= REPORT_INTERVAL:
+                last_report = time.perf_counter()
+                print(f"{counts['done'] + counts['failed']}/{len(texts)} clips, "
+                      f"{counts['done'] / (last_report - start):.1f} clips/s")
+    except KeyboardInterrupt:
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+
+    executor.shutdown()
+    return True
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Synthesize the clips of the numbers of the chosen levels, and report the throughput.
+
+    Args:
+        argv (Optional[List[str]]): The command line arguments. Defaults to sys.argv.
+
+    Returns:
+        int: The exit code, 1 if a clip could not be synthesized or the clip cache is full, 130 if interrupted.
+
+    Examples:
+        >>> main(["--levels", "100", "1000", "--jobs", "8"])
+        0
+        >>> main(["--levels", "100000", "--cache-dir", "clips", "--pack"])
+        0
+    """
+
+    args = parse_args(argv)
+
+    texts = pending_texts(args.levels, open_cache(args.cache_dir))
+    total = max(args.levels) + 1
+    print(f"{total - len(texts)}/{total} clips already cached, {len(texts)} to synthesize with {args.jobs} workers.")
+
+    counts = {"done": 0, "failed": 0, "size": 0}
+    start = time.perf_counter()
+    try:
+        complete = run_pool(texts, args, counts)
+    except KeyboardInterrupt:
+        print(f"Interrupted after {counts['done']} clips, run the command again to resume.", file=sys.stderr)
+        return 130
+
+    elapsed = time.perf_counter() - start
+    print(f"{counts['done']} clips synthesized ({counts['size'] / 1024 / 1024:.1f} MiB) in {elapsed:.1f} s: "
+          f"{counts['done'] / elapsed if elapsed else 0:.1f} clips/s, {counts['failed']} failed.")
+    if not complete:
+        print("The clip cache of the application is full: prerender the levels with --cache-dir and --pack "
+              "to bundle all their clips.", file=sys.stderr)
+        return 1
+
+    if args.pack:
+        write_pack(args.pack, args.levels, open_cache(args.cache_dir))
+    return 1 if counts["failed"] else 0
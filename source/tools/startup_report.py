@@ -0,0 +1,155 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Startup Report
+
+Measures the cold start of the application in fresh interpreters: the import time of each module
+(`python -X importtime`) and the time until the subject menu (MainCanvas) is painted.
+Fails when the first paint exceeds the time budget, or when a heavy subsystem is imported before it.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import List, Optional, Tuple
+
+from _constants import STARTUP_BUDGET
+from game_registry import playable_games
+
+SOURCE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Subsystems that must only be imported once a game is started, including the module of every game
+HEAVY_MODULES = ["pygame", "gtts", "PIL", "numpy", "num2words", "components.game_canvas"] + [
+    game.module for game in playable_games()]
+
+# Run in a fresh interpreter: build the window, paint the subject menu, then report as JSON
+PROBE = """
+import json, sys, time
+sys.path.insert(0, {source_dir!r})
+report = {{}}
+start = time.perf_counter()
+import tkinter as tk
+from main_application import MainApplication
+from components.main_canvas import MainCanvas
+report["import_ms"] = (time.perf_counter() - start) * 1000
+try:
+    app = MainApplication()
+    app.update()
+    report["painted"] = isinstance(app.screen_manager.current, MainCanvas) and \\
+        bool(app.screen_manager.current.winfo_ismapped())
+    report["paint_time"] = time.time()
+    report["window_ms"] = (time.perf_counter() - start) * 1000
+    app.destroy()
+except tk.TclError as error:
+    report["error"] = str(error)
+report["heavy_modules"] = [name for name in {heavy_modules!r} if name in sys.modules]
+print(json.dumps(report))
+"""
+
+
+def parse_import_times(log: str, count: int) -> List[Tuple[str, int]]:
+    """
+    Returns the slowest top-level imports of an `-X importtime` log.
+
+    Args:
+        log (str): The standard error of the interpreter.
+        count (int): The number of imports to return.
+
+    Returns:
+        List[Tuple[str, int]]: The module names and their cumulative import times, in microseconds.
+
+    Examples:
+        >>> parse_import_times("import time:       409 |      30321 | tkinter", 1)
+        [('tkinter', 30321)]
+    """
+
+    imports = []
+    for line in log.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not name.startswith("  "):  # Imported by the probe itself, not by another module
+            imports.append((name.strip(), int(cumulative)))
+
+    return sorted(imports, key=lambda item: -item[1])[:count]
+
+
+def probe() -> Tuple[dict, str]:
+    """
+    Start the application in a fresh interpreter, up to the first paint of the subject menu.
+
+    Returns:
+        Tuple[dict, str]: The report of the probe (with the time to first paint from the process start, in
+            milliseconds), and the import time log.
+    """
+
+    code = PROBE.format(source_dir=SOURCE_DIR, heavy_modules=HEAVY_MODULES)
+    spawn_time = time.time()
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True)
+
+    report = json.loads(process.stdout.strip().splitlines()[-1])
+    if "paint_time" in report:
+        report["first_paint_ms"] = (report.pop("paint_time") - spawn_time) * 1000
+    return report, process.stderr
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Report the cold start of the application, and check it against the time budget.
+
+    Args:
+        argv (Optional[List[str]]): The command line arguments. Defaults to sys.argv.
+
+    Returns:
+        int: The exit code, 1 if the budget is exceeded or a heavy subsystem is imported at startup.
+
+    Examples:
+        >>> main(["--budget", "1.5"])
+        0
+    """
+
+    parser = argparse.ArgumentParser(prog="startup-report", description="Measure the cold start of the application.")
+    parser.add_argument("--runs", type=int, default=3, help="number of cold starts, the median is kept (default: 3)")
+    parser.add_argument("--budget", type=float, default=STARTUP_BUDGET,
+                        help=f"largest time to first paint, in seconds (default: {STARTUP_BUDGET})")
+    parser.add_argument("--top", type=int, default=15, help="number of slowest imports listed (default: 15)")
+    args = parser.parse_args(argv)
+
+    reports = []
+    for _ in range(args.runs):
+        report, log = probe()
+        reports.append(report)
+
+    print("Slowest imports (last run, cumulative):")
+    for name, cumulative in parse_import_times(log, args.top):
+        print(f"  {cumulative / 1000:8.1f} ms  {name}")
+
+    failed = False
+    print(f"Application import: {statistics.median(r['import_ms'] for r in reports):.0f} ms")
+
+    heavy_modules = sorted({name for report in reports for name in report["heavy_modules"]})
+    if heavy_modules:
+        print(f"Imported before the first paint: {', '.join(heavy_modules)}")
+        failed = True
+
+    if any("error" in report for report in reports):
+        print(f"Window not created ({reports[-1].get('error')}): the time to first paint is not measured.")
+    else:
+        first_paint = statistics.median(report["first_paint_ms"] for report in reports)
+        print(f"Window built: {statistics.median(r['window_ms'] for r in reports):.0f} ms after the first import")
+        print(f"First paint of the subject menu: {first_paint:.0f} ms after the process start "
+              f"(budget: {args.budget * 1000:.0f} ms)")
+        if not all(report["painted"] for report in reports):
+            print("The subject menu was not shown after the first update.")
+            failed = True
+        if first_paint > args.budget * 1000:
+            failed = True
+
+    print("Startup check failed." if failed else "Startup check passed.")
+    return 1 if failed else 0
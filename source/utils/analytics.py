@@ -0,0 +1,489 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Learning Analytics
+"""
+
+import hashlib
+import os
+import sqlite3
+from datetime import date, datetime, timedelta
+from itertools import chain
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.request import pathname2url
+
+import numpy as np
+
+from _constants import (
+    ANALYTICS_CACHE_DIR_NAME,
+    ANALYTICS_HARDEST_COUNT,
+    ANALYTICS_MIN_ATTEMPTS,
+    ANALYTICS_PERCENTILES,
+    ANALYTICS_RANGES,
+)
+from game_registry import listening_game_types
+from utils import tracing
+from utils.attempt_log import default_path
+from utils.user_dirs import user_cache_dir
+
+# Numeric columns of the history, as stored in the snapshots
+COLUMNS: List[str] = ["time", "game_type", "difficulty", "target", "correct", "response_ms"]
+
+
+class AttemptHistory:
+    """
+    Represents the attempts of one or several players, as NumPy columns.
+
+    The AttemptHistory class keeps one array per column (the game types as codes into `game_types`),
+    so that the statistics are computed with vectorized group-bys (`np.bincount`) instead of loops over the attempts.
+    The statistics are returned as plain Python values, ready for the report screen or JSON.
+    """
+
+    def __init__(
+        self,
+        game_types: List[str],
+        time: np.ndarray,
+        game_type: np.ndarray,
+        difficulty: np.ndarray,
+        target: np.ndarray,
+        correct: np.ndarray,
+        response_ms: np.ndarray,
+    ):
+        """
+        Initialize the AttemptHistory.
+
+        Args:
+            game_types: The game types, indexed by the codes of `game_type`.
+            time: The time of each attempt (seconds since the epoch).
+            game_type: The code of the game type of each attempt.
+            difficulty: The difficulty of each attempt.
+            target: The number of each attempt.
+            correct: Whether each attempt is correct.
+            response_ms: The response time of each attempt in milliseconds (NaN if unknown).
+        """
+
+        self.game_types = list(game_types)
+        self.time = time.astype(np.float64, copy=False)
+        self.game_type = game_type.astype(np.int16, copy=False)
+        self.difficulty = difficulty.astype(np.int32, copy=False)
+        self.target = target.astype(np.int64, copy=False)
+        self.correct = correct.astype(bool, copy=False)
+        self.response_ms = response_ms.astype(np.float64, copy=False)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of attempts.
+
+        Returns:
+            int: The number of attempts.
+        """
+
+        return len(self.target)
+
+    @classmethod
+    def empty(cls) -> "AttemptHistory":
+        """
+        Returns a history without attempt.
+
+        Returns:
+            AttemptHistory: The empty history.
+        """
+
+        return cls([], *(np.empty(0) for _ in COLUMNS))
+
+    @classmethod
+    def concatenate(cls, histories: Iterable["AttemptHistory"]) -> "AttemptHistory":
+        """
+        Returns the attempts of several histories (players of a class, or new attempts of a player) as one history.
+
+        Args:
+            histories: The histories.
+
+        Returns:
+            AttemptHistory: The history of all the attempts, the game types being merged.
+        """
+
+        histories = list(histories)
+        game_types = []
+        for history in histories:
+            game_types += [game_type for game_type in history.game_types if game_type not in game_types]
+
+        codes = []
+        for history in histories:
+            mapping = np.array([game_types.index(game_type) for game_type in history.game_types] or [0], np.int16)
+            codes.append(mapping[history.game_type])
+
+        if not histories:
+            return cls.empty()
+        return cls(
+            game_types,
+            np.concatenate([history.time for history in histories]),
+            np.concatenate(codes),
+            np.concatenate([history.difficulty for history in histories]),
+            np.concatenate([history.target for history in histories]),
+            np.concatenate([history.correct for history in histories]),
+            np.concatenate([history.response_ms for history in histories]),
+        )
+
+    def select(self, mask: np.ndarray) -> "AttemptHistory":
+        """
+        Returns the attempts selected by a mask.
+
+        Args:
+            mask: A boolean array, True for the attempts to keep.
+
+        Returns:
+            AttemptHistory: The selected attempts.
+        """
+
+        return AttemptHistory(self.game_types, *(getattr(self, column)[mask] for column in COLUMNS))
+
+    def filter_game_types(self, game_types: Iterable[str]) -> "AttemptHistory":
+        """
+        Returns the attempts of several game types.
+
+        Args:
+            game_types: The game types.
+
+        Returns:
+            AttemptHistory: The selected attempts.
+        """
+
+        codes = [code for code, game_type in enumerate(self.game_types) if game_type in game_types]
+        return self.select(np.isin(self.game_type, codes))
+
+    def filter(self, game_type: Optional[str] = None, difficulty: Optional[int] = None) -> "AttemptHistory":
+        """
+        Returns the attempts of a game type and/or of a difficulty.
+
+        Args:
+            game_type: The game type, or None for every game type.
+            difficulty: The difficulty, or None for every difficulty.
+
+        Returns:
+            AttemptHistory: The selected attempts.
+        """
+
+        mask = np.ones(len(self), bool)
+        if game_type is not None:
+            code = self.game_types.index(game_type) if game_type in self.game_types else -1
+            mask &= self.game_type == code
+        if difficulty is not None:
+            mask &= self.difficulty == difficulty
+        return self.select(mask)
+
+    def accuracy(self) -> Optional[float]:
+        """
+        Returns the share of correct attempts.
+
+        Returns:
+            Optional[float]: The accuracy between 0 and 1, or None without attempt.
+        """
+
+        return float(self.correct.mean()) if len(self) else None
+
+    def number_stats(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the number of attempts and of errors of each number.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The attempts and the errors, indexed by the numbers.
+        """
+
+        attempts = np.bincount(self.target)
+        errors = np.bincount(self.target, weights=~self.correct, minlength=len(attempts))
+        return attempts, errors
+
+    def hardest_numbers(
+        self, count: int = ANALYTICS_HARDEST_COUNT, min_attempts: int = ANALYTICS_MIN_ATTEMPTS
+    ) -> List[Dict[str, float]]:
+        """
+        Returns the numbers with the highest error rates.
+
+        Args:
+            count: The number of numbers returned.
+            min_attempts: The attempts needed for a number to be ranked.
+
+        Returns:
+            List[Dict[str, float]]: The number, its attempts and its error rate, from the hardest number.
+        """
+
+        if not len(self):
+            return []
+
+        attempts, errors = self.number_stats()
+        numbers = np.flatnonzero(attempts >= max(min_attempts, 1))
+        rates = errors[numbers] / attempts[numbers]
+        order = np.lexsort((-attempts[numbers], -rates))[:count]  # Ties broken by the number of attempts
+        return [
+            {"number": int(numbers[index]), "attempts": int(attempts[numbers[index]]), "error_rate": float(rates[index])}
+            for index in order
+        ]
+
+    def range_stats(self, ranges: List[Tuple[str, int]] = ANALYTICS_RANGES) -> Dict[str, Dict[str, float]]:
+        """
+        Returns the error rates by range of the last two digits of the numbers (71 and 171 are both "soixante-onze").
+
+        Args:
+            ranges: The label and the first value of each range, in increasing order.
+
+        Returns:
+            Dict[str, Dict[str, float]]: The attempts and the error rate (None without attempt) of each range.
+        """
+
+        starts = [start for _, start in ranges]
+        rank_of = np.searchsorted(starts, np.arange(100), side="right") - 1  # Range of each value of the last digits
+        ranks = rank_of[self.target % 100]
+        attempts = np.bincount(ranks, minlength=len(ranges))
+        errors = np.bincount(ranks, weights=~self.correct, minlength=len(ranges))
+        return {
+            label: {
+                "attempts": int(attempts[rank]),
+                "error_rate": float(errors[rank] / attempts[rank]) if attempts[rank] else None,
+            }
+            for rank, (label, _) in enumerate(ranges)
+        }
+
+    def response_percentiles(self, percentiles: List[int] = ANALYTICS_PERCENTILES) -> Dict[str, Dict[str, float]]:
+        """
+        Returns the percentiles of the response times of each game type.
+
+        Args:
+            percentiles: The percentiles, between 0 and 100.
+
+        Returns:
+            Dict[str, Dict[str, float]]: The percentiles ("p50"...) of each game type, in milliseconds.
+        """
+
+        timed = ~np.isnan(self.response_ms)
+        result = {}
+        for code, game_type in enumerate(self.game_types):
+            values = self.response_ms[timed & (self.game_type == code)]
+            if len(values):
+                result[game_type] = {
+                    f"p{percentile}": float(value)
+                    for percentile, value in zip(percentiles, np.percentile(values, percentiles))
+                }
+        return result
+
+    def progress(self) -> List[Dict[str, float]]:
+        """
+        Returns the attempts and the accuracy of each day with attempts (local time).
+
+        Returns:
+            List[Dict[str, float]]: The day (ISO format), its attempts and its accuracy, from the first day.
+        """
+
+        if not len(self):
+            return []
+
+        offset = datetime.now().astimezone().utcoffset().total_seconds()
+        days = np.floor((self.time + offset) / 86400).astype(np.int64)
+        first_day = int(days.min())
+        attempts = np.bincount(days - first_day)
+        correct = np.bincount(days - first_day, weights=self.correct, minlength=len(attempts))
+        first_date = date(1970, 1, 1) + timedelta(days=first_day)
+        return [
+            {"day": (first_date + timedelta(days=int(day))).isoformat(), "attempts": int(attempts[day]),
+             "accuracy": float(correct[day] / attempts[day])}
+            for day in np.flatnonzero(attempts)
+        ]
+
+    def report(self) -> dict:
+        """
+        Returns every statistic of the history.
+
+        The statistics of the numbers (error rates by range and hardest numbers) only count the attempts
+        of the listening games: the target of the other games (the first operand of a comparison)
+        is not a number the player had to understand.
+
+        Returns:
+            dict: The attempts, the accuracy, the attempts of the listening games, the error rates by range,
+                the hardest numbers, the response time percentiles and the progress by day.
+        """
+
+        with tracing.span("compute report", "analytics", attempts=len(self)):
+            heard = self.filter_game_types(listening_game_types())
+            return {
+                "attempts": len(self),
+                "accuracy": self.accuracy(),
+                "listening_attempts": len(heard),
+                "ranges": heard.range_stats(),
+                "hardest": heard.hardest_numbers(),
+                "response_ms": self.response_percentiles(),
+                "progress": self.progress(),
+            }
+
+
+def snapshot_path(path: str) -> str:
+    """
+    Returns the path of the column snapshot of an attempt log.
+
+    Args:
+        path (str): The path of the attempt log.
+
+    Returns:
+        str: The path of the snapshot, in the cache directory.
+
+    Examples:
+        >>> snapshot_path(default_path())
+        '/home/user/.cache/Apprends_et_Joue/analytics/3f2a9c0d1b7e4a65.npz'
+    """
+
+    digest = hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(user_cache_dir(ANALYTICS_CACHE_DIR_NAME), f"{digest}.npz")
+
+
+def read_snapshot(path: str) -> Tuple[AttemptHistory, int]:
+    """
+    Read the column snapshot of an attempt log.
+
+    Args:
+        path (str): The path of the snapshot.
+
+    Returns:
+        Tuple[AttemptHistory, int]: The attempts, and the identifier of the last one (an empty history and 0
+            if there is no usable snapshot).
+
+    Examples:
+        >>> read_snapshot(snapshot_path(default_path()))
+        (<AttemptHistory>, 1234)
+    """
+
+    try:
+        with np.load(path) as snapshot:
+            game_types = [str(game_type) for game_type in snapshot["game_types"]]
+            history = AttemptHistory(game_types, *(snapshot[column] for column in COLUMNS))
+            return history, int(snapshot["last_id"])
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError, KeyError) as error:
+        tracing.error(f"Unreadable analytics snapshot ({error}), the attempt log is read again.", "analytics")
+    return AttemptHistory.empty(), 0
+
+
+def write_snapshot(path: str, history: AttemptHistory, last_id: int) -> None:
+    """
+    Write the column snapshot of an attempt log, atomically.
+
+    Args:
+        path (str): The path of the snapshot.
+        history (AttemptHistory): The attempts.
+        last_id (int): The identifier of the last attempt.
+
+    Returns:
+        None
+
+    Examples:
+        >>> write_snapshot(snapshot_path(default_path()), history, 1234)
+    """
+
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temporary_path, "wb") as file:
+            np.savez(file, last_id=last_id, game_types=np.array(history.game_types, dtype=str),
+                     **{column: getattr(history, column) for column in COLUMNS})
+        os.replace(temporary_path, path)
+    except OSError as error:
+        tracing.error(f"Analytics snapshot not saved ({error}).", "analytics")
+
+
+def read_attempts(connection: sqlite3.Connection, first_id: int, last_id: int, game_types: List[str]) -> AttemptHistory:
+    """
+    Read the attempts of a range of identifiers from an attempt log, in a single pass.
+
+    Args:
+        connection (sqlite3.Connection): The connection to the attempt log.
+        first_id (int): The identifier after which the attempts are read.
+        last_id (int): The identifier of the last attempt read.
+        game_types (List[str]): The game types already known, whose codes are kept.
+
+    Returns:
+        AttemptHistory: The attempts.
+
+    Examples:
+        >>> len(read_attempts(connection, 0, 1234, []))
+        1234
+    """
+
+    bounds = (first_id, last_id)
+    game_types = list(game_types)
+    for (game_type,) in connection.execute(
+            "SELECT DISTINCT game_type FROM attempts WHERE id > ? AND id <= ?", bounds):
+        if game_type not in game_types:
+            game_types.append(game_type)
+    (count,) = connection.execute("SELECT COUNT(*) FROM attempts WHERE id > ? AND id <= ?", bounds).fetchone()
+
+    # Every column is read as a float, straight from the cursor into a single array
+    codes = " ".join(f"WHEN ? THEN {code}" for code in range(len(game_types)))
+    cursor = connection.execute(
+        f"SELECT time, CASE game_type {codes} ELSE 0 END, difficulty, target, correct, IFNULL(response_ms, -1) "
+        "FROM attempts WHERE id > ? AND id <= ? ORDER BY id",
+        (*game_types, *bounds),
+    )
+    rows = np.fromiter(chain.from_iterable(cursor), np.float64, count * len(COLUMNS)).reshape(count, len(COLUMNS))
+
+    response_ms = rows[:, 5]
+    response_ms[response_ms < 0] = np.nan
+    return AttemptHistory(game_types, *(rows[:, index] for index in range(len(COLUMNS))))
+
+
+def load_history(path: Optional[str] = None) -> AttemptHistory:
+    """
+    Load the attempts of an attempt log.
+
+    Reading SQLite rows is by far the slowest step, so the columns are kept in a snapshot in the cache directory,
+    and only the attempts added since the snapshot are read from the log.
+
+    Args:
+        path (Optional[str]): The path of the attempt log. Defaults to the attempt log of the user.
+
+    Returns:
+        AttemptHistory: The attempts (an empty history if the log does not exist).
+
+    Examples:
+        >>> len(load_history())
+        1234
+    """
+
+    path = path or default_path()
+    if not os.path.exists(path):
+        return AttemptHistory.empty()
+
+    with tracing.span("load attempts", "analytics", path=path) as load_span:
+        snapshot = snapshot_path(path)
+        history, snapshot_id = read_snapshot(snapshot)
+
+        connection = sqlite3.connect(f"file:{pathname2url(os.path.abspath(path))}?mode=ro", uri=True)
+        try:
+            (last_id,) = connection.execute("SELECT IFNULL(MAX(id), 0) FROM attempts").fetchone()
+            if last_id < snapshot_id:  # The log was replaced since the snapshot
+                history, snapshot_id = AttemptHistory.empty(), 0
+            if last_id > snapshot_id:
+                history = AttemptHistory.concatenate(
+                    [history, read_attempts(connection, snapshot_id, last_id, history.game_types)])
+                write_snapshot(snapshot, history, last_id)
+        finally:
+            connection.close()
+
+        load_span.set(attempts=len(history), read=last_id - snapshot_id)
+    return history
+
+
+def load_histories(paths: Iterable[str]) -> AttemptHistory:
+    """
+    Load the attempts of several attempt logs, such as the logs of the players of a class.
+
+    Args:
+        paths (Iterable[str]): The paths of the attempt logs.
+
+    Returns:
+        AttemptHistory: The attempts of every log.
+
+    Examples:
+        >>> len(load_histories(["alice.sqlite3", "bob.sqlite3"]))
+        2468
+    """
+
+    return AttemptHistory.concatenate(load_history(path) for path in paths)
@@ -0,0 +1,225 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Answer Automaton
+"""
+
+import unicodedata
+from typing import Dict, Iterable, List
+
+from utils.french_numbers import number_to_words
+
+DEAD_STATE: int = -1
+START_STATE: int = 0
+
+# Words written with spaces around them in the 1990 reform spelling (they are nouns, not numerals)
+NOUN_WORDS = {"million", "millions", "milliard", "milliards"}
+
+
+def normalize_char(char: str) -> str:
+    """
+    Returns a character as compared by the automaton: lower case and without accent.
+
+    Args:
+        char (str): The character.
+
+    Returns:
+        str: The normalized character.
+
+    Examples:
+        >>> normalize_char("É")
+        'e'
+    """
+
+    return unicodedata.normalize("NFD", char.lower())[0]
+
+
+def digit_answers(number: int) -> List[str]:
+    """
+    Returns the accepted ways of writing a number in digits.
+
+    Args:
+        number (int): The number.
+
+    Returns:
+        List[str]: The number without separator, and with a space between the groups of three digits.
+
+    Examples:
+        >>> digit_answers(12000)
+        ['12000', '12 000']
+    """
+
+    return [str(number), f"{number:,}".replace(",", " ")]
+
+
+def word_answers(number: int) -> List[str]:
+    """
+    Returns the accepted ways of writing a number in words.
+
+    Args:
+        number (int): The number.
+
+    Returns:
+        List[str]: The traditional spelling, the same with "-et-", and the 1990 reform spelling (hyphens between
+            all the numerals), without duplicates.
+
+    Examples:
+        >>> word_answers(21)
+        ['vingt et un', 'vingt-et-un']
+    """
+
+    traditional = number_to_words(number)
+
+    words = traditional.split(" ")
+    reform = words[0]
+    for previous, word in zip(words, words[1:]):
+        reform += (" " if word in NOUN_WORDS or previous in NOUN_WORDS else "-") + word
+
+    return list(dict.fromkeys([traditional, traditional.replace(" et ", "-et-"), reform]))
+
+
+class AnswerAutomaton:
+    """
+    Represents the accepted answers of a round, compiled into a prefix automaton.
+
+    The AnswerAutomaton class is a trie over the accepted answers: each typed character moves from a state
+    to the next one with a single dictionary lookup. Characters are compared in lower case and without accent,
+    spaces at the start of the answer and repeated spaces are ignored, and a trailing space is accepted.
+    """
+
+    def __init__(self, answers: Iterable[str]):
+        """
+        Initialize the AnswerAutomaton.
+
+        Args:
+            answers: The accepted answers.
+        """
+
+        self.transitions: List[Dict[str, int]] = [{}]
+        self.accepting = set()
+
+        for answer in answers:
+            state = START_STATE
+            for char in " ".join(answer.split()):
+                char = normalize_char(char)
+                next_state = self.transitions[state].get(char)
+                if next_state is None:
+                    next_state = len(self.transitions)
+                    self.transitions[state][char] = next_state
+                    self.transitions.append({})
+                state = next_state
+            self.accepting.add(state)
+
+            # Accept a trailing space after a complete answer
+            trailing_state = self.transitions[state].setdefault(" ", len(self.transitions))
+            if trailing_state == len(self.transitions):
+                self.transitions.append({})
+            self.accepting.add(trailing_state)
+
+    def step(self, state: int, char: str) -> int:
+        """
+        Returns the state reached by typing a character.
+
+        Args:
+            state: The current state.
+            char: The typed character.
+
+        Returns:
+            int: The next state, or DEAD_STATE if no accepted answer starts with the typed text.
+        """
+
+        if state == DEAD_STATE:
+            return DEAD_STATE
+        return self.transitions[state].get(normalize_char(char), DEAD_STATE)
+
+
+class AnswerTracker:
+    """
+    Represents the progress of a typed answer through an AnswerAutomaton.
+
+    The AnswerTracker class keeps the state reached after each typed character, so that typing or erasing
+    the last character costs a single step, and only other edits (paste, edit in the middle) replay the text.
+    """
+
+    def __init__(self, automaton: AnswerAutomaton):
+        """
+        Initialize the AnswerTracker.
+
+        Args:
+            automaton: The automaton of the accepted answers.
+        """
+
+        self.automaton = automaton
+        self.text = ""
+        self.states = [START_STATE]  # The state after each typed character
+
+    def feed(self, char: str) -> None:
+        """
+        Advance the automaton with a typed character.
+
+        Args:
+            char: The typed character.
+
+        Returns:
+            None
+        """
+
+        state = self.states[-1]
+        if char.isspace() and (not self.text or self.text[-1].isspace()):
+            self.states.append(state)  # Leading and repeated spaces are ignored
+        else:
+            self.states.append(self.automaton.step(state, " " if char.isspace() else char))
+        self.text += char
+
+    def update(self, text: str) -> str:
+        """
+        Update the tracker with the new content of the entry.
+
+        Args:
+            text: The content of the entry.
+
+        Returns:
+            str: The status of the answer, "empty", "on-track", "wrong" or "complete".
+        """
+
+        if len(text) == len(self.text) + 1 and text.startswith(self.text):
+            self.feed(text[-1])
+        elif len(text) == len(self.text) - 1 and self.text.startswith(text):
+            self.states.pop()
+            self.text = text
+        elif text != self.text:
+            self.text = ""
+            self.states = [START_STATE]
+            for char in text:
+                self.feed(char)
+
+        return self.status()
+
+    def status(self) -> str:
+        """
+        Returns the status of the answer.
+
+        Returns:
+            str: "empty" if nothing meaningful has been typed, "wrong" if no accepted answer starts with the text,
+                "complete" if the text is an accepted answer, "on-track" otherwise.
+        """
+
+        state = self.states[-1]
+        if state == DEAD_STATE:
+            return "wrong"
+        if state in self.automaton.accepting:
+            return "complete"
+        if state == START_STATE:
+            return "empty"
+        return "on-track"
+
+    def accepts(self) -> bool:
+        """
+        Check whether the typed text is an accepted answer.
+
+        Returns:
+            bool: True if the text is accepted, False otherwise.
+        """
+
+        return self.states[-1] in self.automaton.accepting
@@ -0,0 +1,105 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Image Atlas
+"""
+
+import json
+import os
+import tkinter as tk
+from typing import Dict, List, Optional, Tuple
+
+from _constants import ATLAS_PATH, ATLAS_INDEX_PATH
+from utils import tracing
+
+
+def variant_name(path: str, size: Tuple[int, int], rotation: int = 0) -> str:
+    """
+    Returns the name of an image variant in the atlas index.
+
+    Args:
+        path (str): The path of the image file.
+        size (Tuple[int, int]): The size of the image (width, height), in pixels.
+        rotation (int): The counterclockwise rotation of the image, in degrees.
+
+    Returns:
+        str: The name of the variant.
+
+    Examples:
+        >>> variant_name(ARROW_IMAGE_PATH, (40, 40), 180)
+        'arrow.png@40x40r180'
+    """
+
+    return f"{os.path.basename(path)}@{size[0]}x{size[1]}r{rotation % 360}"
+
+
+class Atlas:
+    """
+    Represents the atlas of the image variants shown by the components.
+
+    The Atlas class reads the packed PNG in a single file read with the native PNG support of Tk,
+    and slices the variants out of it on demand, so that no image is decoded or resampled at runtime.
+    A missing or unreadable atlas is treated as empty.
+    """
+
+    def __init__(self, path: str = ATLAS_PATH, index_path: str = ATLAS_INDEX_PATH):
+        """
+        Initialize the Atlas.
+
+        Args:
+            path: The path of the atlas PNG.
+            index_path: The path of the atlas index (variant name -> [x, y, width, height]).
+        """
+
+        self.path = path
+        self.index_path = index_path
+        self.sheet: Optional[tk.PhotoImage] = None
+        self.index: Dict[str, List[int]] = {}
+        self.loaded = False
+
+    def load(self) -> bool:
+        """
+        Load the atlas, once the main window exists.
+
+        Returns:
+            bool: True if the atlas is available, False otherwise.
+        """
+
+        if not self.loaded:
+            self.loaded = True
+            try:
+                with open(self.index_path, encoding="utf-8") as file:
+                    self.index = json.load(file)["variants"]
+                self.sheet = tk.PhotoImage(file=self.path)
+            except (OSError, ValueError, KeyError, tk.TclError) as error:
+                tracing.error(f"Image atlas unavailable ({error}), the images are decoded at runtime.", "image")
+                self.index = {}
+                self.sheet = None
+
+        return self.sheet is not None
+
+    def get(self, path: str, size: Tuple[int, int], rotation: int = 0) -> Optional[tk.PhotoImage]:
+        """
+        Returns a variant sliced out of the atlas.
+
+        Args:
+            path: The path of the image file.
+            size: The size of the image (width, height), in pixels.
+            rotation: The counterclockwise rotation of the image, in degrees.
+
+        Returns:
+            Optional[tk.PhotoImage]: The variant, or None if it is not in the atlas.
+        """
+
+        if not self.load():
+            return None
+
+        box = self.index.get(variant_name(path, size, rotation))
+        if box is None:
+            return None
+
+        x, y, width, height = box
+        image = tk.PhotoImage(width=width, height=height)
+        image.tk.call(image, "copy", self.sheet, "-from", x, y, x + width, y + height)
+        return image
@@ -0,0 +1,287 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Attempt Log
+"""
+
+import os
+import queue
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from _constants import ATTEMPT_BATCH_SIZE, ATTEMPT_FLUSH_INTERVAL, ATTEMPT_LOG_NAME
+from utils import tracing
+from utils.user_dirs import user_data_dir
+
+# Columns of an attempt, in the order of the table
+COLUMNS: List[str] = ["time", "game_type", "difficulty", "target", "answer", "correct", "response_ms"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS attempts (
+    id INTEGER PRIMARY KEY,
+    time REAL NOT NULL,
+    game_type TEXT NOT NULL,
+    difficulty INTEGER NOT NULL,
+    target INTEGER NOT NULL,
+    answer TEXT NOT NULL,
+    correct INTEGER NOT NULL,
+    response_ms REAL
+)
+"""
+
+_STOP = object()  # Sentinel asking the writer thread to write the pending attempts and stop
+
+
+def default_path() -> str:
+    """
+    Returns the path of the attempt log of the user.
+
+    Returns:
+        str: The path of the SQLite database.
+
+    Examples:
+        >>> default_path()
+        '/home/user/.local/share/Apprends_et_Joue/attempts.sqlite3'
+    """
+
+    return os.path.join(user_data_dir(), ATTEMPT_LOG_NAME)
+
+
+def connect(path: str) -> sqlite3.Connection:
+    """
+    Open an attempt log, creating its table if needed.
+
+    The database is in write-ahead logging mode: a committed batch survives a crash of the application,
+    and readers (the analytics) never block the writer.
+
+    Args:
+        path (str): The path of the SQLite database.
+
+    Returns:
+        sqlite3.Connection: The connection.
+
+    Examples:
+        >>> connect(default_path()).execute("SELECT COUNT(*) FROM attempts").fetchone()
+        (1234,)
+    """
+
+    connection = sqlite3.connect(path, check_same_thread=False)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.execute(SCHEMA)
+    connection.commit()
+    return connection
+
+
+class AttemptLog:
+    """
+    Represents the log of the answers of the player.
+
+    The AttemptLog class only queues the recorded attempts, so that recording never blocks the Tk thread.
+    A writer thread owns the database connection: it collects the queued attempts for up to the flush interval
+    (or until a batch is full), and writes them in a single transaction. A crash loses at most the last batch.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        batch_size: int = ATTEMPT_BATCH_SIZE,
+        flush_interval: float = ATTEMPT_FLUSH_INTERVAL,
+    ):
+        """
+        Initialize the AttemptLog.
+
+        Args:
+            path: The path of the SQLite database. Defaults to the attempt log in the per-user data directory.
+            batch_size: The largest number of attempts written in one transaction.
+            flush_interval: The longest delay before a recorded attempt is written, in seconds.
+        """
+
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self.pending = queue.Queue()
+        self.thread = None
+        self.available = True  # False once the database cannot be opened: the attempts are then dropped
+        self.recorded = 0
+        self.written = 0
+        self.batches = 0
+        self.failures = 0
+
+    def start(self) -> None:
+        """
+        Start the writer thread.
+
+        Returns:
+            None
+        """
+
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run, name="attempt-log", daemon=True)
+            self.thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Write the pending attempts, and stop the writer thread.
+
+        Args:
+            timeout: The longest wait for the writer thread, in seconds, or None to wait until it is done.
+
+        Returns:
+            None
+        """
+
+        if self.thread is not None:
+            self.pending.put(_STOP)
+            self.thread.join(timeout)
+            self.thread = None
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Write the pending attempts now, before reading the log.
+
+        Args:
+            timeout: The longest wait for the writer thread, in seconds, or None to wait until it is done.
+
+        Returns:
+            bool: True if the pending attempts are written, False otherwise (at once if the log is unavailable).
+        """
+
+        if not self.available:
+            return False
+        if self.thread is None:
+            return self.pending.empty()
+
+        written = threading.Event()
+        self.pending.put(written)
+        return written.wait(timeout)
+
+    def record(
+        self,
+        game_type: str,
+        difficulty: int,
+        target: int,
+        answer: str,
+        correct: bool,
+        response_ms: Optional[float] = None,
+    ) -> None:
+        """
+        Record an attempt, written later by the writer thread (dropped if the log is unavailable).
+
+        Args:
+            game_type: The type of the game.
+            difficulty: The difficulty of the game.
+            target: The number of the round.
+            answer: The answer of the player.
+            correct: Whether the answer is correct.
+            response_ms: The time from the start of the round to the answer, in milliseconds.
+
+        Returns:
+            None
+        """
+
+        self.recorded += 1
+        if self.available:
+            self.pending.put((time.time(), game_type, difficulty, target, answer, int(correct), response_ms))
+
+    def next_batch(self) -> Tuple[List[tuple], object]:
+        """
+        Wait for the next batch of attempts (writer thread).
+
+        The batch ends when it is full, when the flush interval is elapsed since its first item,
+        or when a flush or a stop is requested.
+
+        Returns:
+            Tuple[List[tuple], object]: The attempts of the batch, and the last item taken from the queue
+                (an attempt, a flush Event, or the stop sentinel).
+        """
+
+        batch = []
+        item = self.pending.get()
+        deadline = time.monotonic() + self.flush_interval
+        while item is not _STOP and not isinstance(item, threading.Event):
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                break
+            try:
+                item = self.pending.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                break
+        return batch, item
+
+    def run(self) -> None:
+        """
+        Write the recorded attempts by batches, until stopped (writer thread).
+
+        If the database cannot be opened, the queue is still drained until stopped, so that no attempt piles up
+        and every flush request is answered.
+
+        Returns:
+            None
+        """
+
+        try:
+            connection = connect(self.path or default_path())
+        except (OSError, sqlite3.Error) as error:
+            tracing.error(f"Attempt log unavailable ({error}), the answers are not saved.", "attempts")
+            self.available = False
+            connection = None
+
+        stopping = False
+        while not stopping:
+            batch, item = self.next_batch()
+            stopping = item is _STOP
+
+            if batch and connection:
+                self.write(connection, batch)
+            if isinstance(item, threading.Event):  # Flush requested
+                item.set()
+
+        if connection:
+            connection.close()
+
+    def write(self, connection: sqlite3.Connection, batch: List[tuple]) -> None:
+        """
+        Write a batch of attempts in a single transaction.
+
+        Args:
+            connection: The connection to the attempt log.
+            batch: The attempts, as rows of the table.
+
+        Returns:
+            None
+        """
+
+        with tracing.span("write attempts", "attempts", count=len(batch)):
+            try:
+                with connection:
+                    connection.executemany(
+                        f"INSERT INTO attempts ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})",
+                        batch,
+                    )
+            except sqlite3.Error as error:
+                self.failures += 1
+                tracing.error(f"Attempts not saved ({error}).", "attempts", count=len(batch))
+                return
+
+        self.written += len(batch)
+        self.batches += 1
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the statistics of the attempt log.
+
+        Returns:
+            Dict[str, int]: The number of recorded and written attempts, of written batches and of failed batches.
+        """
+
+        return {
+            "recorded": self.recorded,
+            "written": self.written,
+            "batches": self.batches,
+            "failures": self.failures,
+        }
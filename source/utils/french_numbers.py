@@ -0,0 +1,164 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+French Numbers
+"""
+
+import functools
+from typing import List, Tuple
+
+from _constants import FRENCH_WORDS_CACHE_SIZE
+
+# Words of the numbers below one hundred, as written by num2words (traditional spelling)
+BELOW_TWENTY_WORDS: List[str] = [
+    "zéro", "un", "deux", "trois", "quatre", "cinq", "six", "sept", "huit", "neuf", "dix",
+    "onze", "douze", "treize", "quatorze", "quinze", "seize", "dix-sept", "dix-huit", "dix-neuf",
+]
+TEN_WORDS: List[str] = [
+    "", "dix", "vingt", "trente", "quarante", "cinquante", "soixante", "soixante", "quatre-vingt", "quatre-vingt",
+]
+
+# Scale words, from the largest
+SCALE_WORDS: List[Tuple[int, str]] = [(1_000_000_000, "milliard"), (1_000_000, "million")]
+MAX_WORDS_NUMBER: int = 999_999_999_999
+
+
+def below_hundred_words(number: int) -> str:
+    """
+    Returns the words of a number between 0 and 99.
+
+    Args:
+        number (int): The number, between 0 and 99.
+
+    Returns:
+        str: The words of the number.
+
+    Examples:
+        >>> below_hundred_words(71)
+        'soixante et onze'
+    """
+
+    if number < 20:
+        return BELOW_TWENTY_WORDS[number]
+
+    tens, units = divmod(number, 10)
+    if tens in (7, 9):  # soixante-dix, quatre-vingt-dix
+        units += 10
+    if units == 0:
+        return "quatre-vingts" if tens == 8 else TEN_WORDS[tens]
+    if units in (1, 11) and tens < 8:  # vingt et un, soixante et onze
+        return f"{TEN_WORDS[tens]} et {BELOW_TWENTY_WORDS[units]}"
+    return f"{TEN_WORDS[tens]}-{BELOW_TWENTY_WORDS[units]}"
+
+
+def below_thousand_words(number: int) -> str:
+    """
+    Returns the words of a number between 0 and 999, computed once for the tables.
+
+    Args:
+        number (int): The number, between 0 and 999.
+
+    Returns:
+        str: The words of the number.
+
+    Examples:
+        >>> below_thousand_words(200)
+        'deux cents'
+    """
+
+    hundreds, rest = divmod(number, 100)
+    if not hundreds:
+        return below_hundred_words(rest)
+
+    words = "cent" if hundreds == 1 else f"{BELOW_TWENTY_WORDS[hundreds]} cent"
+    if not rest:
+        return words if hundreds == 1 else words + "s"
+    return f"{words} {below_hundred_words(rest)}"
+
+
+# Words of the numbers between 0 and 999, standalone and before "mille" (where "cents" and "vingts" are invariable)
+BELOW_THOUSAND: List[str] = [below_thousand_words(number) for number in range(1000)]
+BELOW_THOUSAND_BEFORE_MILLE: List[str] = [
+    words[:-1] if words.endswith(("cents", "vingts")) else words for words in BELOW_THOUSAND
+]
+
+
+@functools.lru_cache(maxsize=FRENCH_WORDS_CACHE_SIZE)
+def number_to_words(number: int) -> str:
+    """
+    Returns the French words of a number, as written by num2words (`num2words(number, lang="fr")`).
+
+    The words are assembled from the tables of the numbers between 0 and 999 and the scale words,
+    and the most recent results are cached.
+
+    Args:
+        number (int): The number, between 0 and MAX_WORDS_NUMBER.
+
+    Returns:
+        str: The words of the number.
+
+    Raises:
+        ValueError: If the number is out of range.
+
+    Examples:
+        >>> number_to_words(80_021)
+        'quatre-vingt mille vingt et un'
+    """
+
+    if not 0 <= number <= MAX_WORDS_NUMBER:
+        raise ValueError(f"{number} is out of the written range.")
+    if number < 1000:
+        return BELOW_THOUSAND[number]
+
+    words = []
+    for scale, scale_word in SCALE_WORDS:
+        count, number = divmod(number, scale)
+        if count:
+            words.append(f"{BELOW_THOUSAND[count]} {scale_word}{'s' if count > 1 else ''}")
+
+    thousands, units = divmod(number, 1000)
+    if thousands == 1:
+        words.append("mille")
+    elif thousands:
+        words.append(f"{BELOW_THOUSAND_BEFORE_MILLE[thousands]} mille")
+    if units:
+        words.append(BELOW_THOUSAND[units])
+
+    return " ".join(words)
+
+
+# Smallest spoken units of the French numbers (the names of the voice clips)
+MORPHEMES: List[str] = [
+    "zero", "un", "deux", "trois", "quatre", "cinq", "six", "sept", "huit", "neuf", "dix", "onze", "douze",
+    "treize", "quatorze", "quinze", "seize", "vingt", "trente", "quarante", "cinquante", "soixante",
+    "cent", "mille", "million", "et",
+]
+# Written words spoken as another morpheme (accents and silent plural marks)
+SPOKEN_MORPHEMES = {"zéro": "zero", "vingts": "vingt", "cents": "cent", "millions": "million"}
+
+MAX_SPOKEN_NUMBER: int = 999_999_999
+
+
+def number_to_morphemes(number: int) -> List[str]:
+    """
+    Returns the spoken morphemes of a number, from the ones listed in MORPHEMES.
+
+    Args:
+        number (int): The number, between 0 and MAX_SPOKEN_NUMBER.
+
+    Returns:
+        List[str]: The spoken morphemes of the number.
+
+    Raises:
+        ValueError: If the number cannot be spoken with the morphemes.
+
+    Examples:
+        >>> number_to_morphemes(1081)
+        ['mille', 'quatre', 'vingt', 'un']
+    """
+
+    if not 0 <= number <= MAX_SPOKEN_NUMBER:
+        raise ValueError(f"{number} is out of the spoken range.")
+
+    return [SPOKEN_MORPHEMES.get(word, word) for word in number_to_words(number).replace("-", " ").split(" ")]
@@ -0,0 +1,118 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Image Cache
+"""
+
+import os
+import tkinter as tk
+from typing import Dict, Optional, Tuple
+
+from utils.atlas import Atlas
+from utils import tracing
+
+
+class ImageCache:
+    """
+    Represents a cache of the images shown by the components.
+
+    The ImageCache class slices each image out of the prebuilt atlas once, then returns the same PhotoImage
+    to every caller asking for the same path, size and rotation, so that building a screen again
+    does not load any image. The variants missing from the atlas are decoded, resized and rotated with Pillow,
+    which is only imported in that case. The images must be requested once the main window exists.
+    """
+
+    def __init__(self, atlas: Optional[Atlas] = None):
+        """
+        Initialize the ImageCache.
+
+        Args:
+            atlas: The atlas of the image variants. Defaults to the atlas of the assets.
+        """
+
+        self.atlas = atlas or Atlas()
+        self.images: Dict[Tuple[str, Tuple[int, int], int], tk.PhotoImage] = {}
+        self.hits = 0
+        self.misses = 0
+        self.decodes = 0  # Misses not found in the atlas
+
+    def get(self, path: str, size: Tuple[int, int], rotation: int = 0) -> tk.PhotoImage:
+        """
+        Returns an image, resized and rotated.
+
+        Args:
+            path: The path of the image file.
+            size: The size of the image (width, height), in pixels.
+            rotation: The counterclockwise rotation of the image, in degrees.
+
+        Returns:
+            tk.PhotoImage: The shared image.
+        """
+
+        key = (path, tuple(size), rotation % 360)
+        image = self.images.get(key)
+        if image is not None:
+            self.hits += 1
+            return image
+
+        self.misses += 1
+        decodes = self.decodes
+        with tracing.span("load image", "image", path=os.path.basename(path), size=key[1], rotation=key[2]) as load_span:
+            image = self.atlas.get(*key)
+            if image is None:
+                from PIL import ImageTk, Image
+
+                self.decodes += 1
+                resized = Image.open(path).resize(key[1])
+                if key[2]:
+                    resized = resized.rotate(key[2])
+                image = ImageTk.PhotoImage(resized)
+            load_span.set(source="atlas" if self.decodes == decodes else "pillow")
+
+        self.images[key] = image
+        return image
+
+    def clear(self) -> None:
+        """
+        Release all the cached images (the widgets still showing them keep their own reference).
+
+        Returns:
+            None
+        """
+
+        self.images.clear()
+
+    def stats(self) -> dict:
+        """
+        Returns the statistics of the cache.
+
+        Returns:
+            dict: The number of cached images, of hits, of misses and of misses decoded with Pillow.
+        """
+
+        return {"images": len(self.images), "hits": self.hits, "misses": self.misses, "decodes": self.decodes}
+
+
+# The cache shared by all the components
+image_cache = ImageCache()
+
+
+def get_image(path: str, size: Tuple[int, int], rotation: int = 0) -> tk.PhotoImage:
+    """
+    Returns an image from the shared cache, resized and rotated.
+
+    Args:
+        path (str): The path of the image file.
+        size (Tuple[int, int]): The size of the image (width, height), in pixels.
+        rotation (int): The counterclockwise rotation of the image, in degrees.
+
+    Returns:
+        tk.PhotoImage: The shared image.
+
+    Examples:
+        >>> get_image(ARROW_IMAGE_PATH, (40, 40), rotation=180) is get_image(ARROW_IMAGE_PATH, (40, 40), 180)
+        True
+    """
+
+    return image_cache.get(path, size, rotation)
@@ -0,0 +1,115 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Number Sampler
+"""
+
+import random
+from typing import Optional
+
+FEISTEL_ROUNDS: int = 4
+
+
+class NumberSampler:
+    """
+    Represents a non-repeating random sampler of the numbers between 0 and an upper bound.
+
+    The NumberSampler class walks through a pseudo-random permutation of the range, so a number is drawn again
+    only once every other number of the range has been drawn. The permutation is a seeded Feistel network over
+    the smallest power of four covering the range, restricted to the range by cycle walking: a draw takes O(1)
+    memory and O(1) expected time, whatever the size of the range.
+    """
+
+    def __init__(self, upper: int, seed: Optional[int] = None):
+        """
+        Initialize the NumberSampler.
+
+        Args:
+            upper: The largest number that can be drawn (included).
+            seed: The seed of the permutations. Defaults to a random seed.
+        """
+
+        self.size = upper + 1
+        self.half_bits = max(1, ((self.size - 1).bit_length() + 1) // 2)
+        self.mask = (1 << self.half_bits) - 1
+
+        self.random = random.Random(seed)
+        self.keys = []
+        self.index = 0
+        self.last = None
+        self.shuffle()
+
+    def shuffle(self) -> None:
+        """
+        Start a new permutation of the range.
+
+        Returns:
+            None
+        """
+
+        self.keys = [self.random.getrandbits(32) for _ in range(FEISTEL_ROUNDS)]
+        self.index = 0
+
+    def feistel(self, value: int) -> int:
+        """
+        Apply the Feistel network to a value of the power of four domain.
+
+        Args:
+            value: The value to permute.
+
+        Returns:
+            int: The permuted value.
+        """
+
+        left, right = value >> self.half_bits, value & self.mask
+        for key in self.keys:
+            mixed = ((right ^ key) * 0x9E3779B1) & 0xFFFFFFFF
+            left, right = right, left ^ ((mixed ^ (mixed >> 15)) & self.mask)
+        return (left << self.half_bits) | right
+
+    def permute(self, index: int) -> int:
+        """
+        Returns the number at a position of the current permutation.
+
+        Args:
+            index: The position, between 0 and the size of the range (excluded).
+
+        Returns:
+            int: The number at this position.
+        """
+
+        value = self.feistel(index)
+        while value >= self.size:  # Cycle walking: at most a few steps as the domain is less than 4 times the range
+            value = self.feistel(value)
+        return value
+
+    def draw(self) -> int:
+        """
+        Draw the next number of the permutation.
+
+        When the range is exhausted, a new permutation starts, and never with the last drawn number.
+
+        Returns:
+            int: The drawn number.
+        """
+
+        if self.index >= self.size:
+            self.shuffle()
+            while self.size > 1 and self.permute(0) == self.last:
+                self.shuffle()
+
+        self.last = self.permute(self.index)
+        self.index += 1
+        return self.last
+
+    @property
+    def remaining(self) -> int:
+        """
+        Returns the number of draws left before the range is exhausted.
+
+        Returns:
+            int: The number of numbers not drawn yet in the current permutation.
+        """
+
+        return self.size - self.index
@@ -0,0 +1,186 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Review Scheduler
+"""
+
+import heapq
+import time
+from array import array
+from typing import Callable, Optional
+
+from _constants import (
+    REVIEW_BASE_INTERVAL,
+    REVIEW_MAX_STREAK,
+    REVIEW_ERROR_WEIGHT,
+    SCHEDULER_DENSE_LIMIT,
+)
+from utils.sampler import NumberSampler
+
+
+class ItemStatistics:
+    """
+    Represents the answer statistics of the numbers of a level, stored in compact typed arrays.
+
+    Small levels get one slot per number, allocated up front. Large levels (10^5 and more) get a slot
+    only when a number is answered for the first time, through a dictionary from the number to its slot.
+    """
+
+    def __init__(self, size: int, dense_limit: int = SCHEDULER_DENSE_LIMIT):
+        """
+        Initialize the ItemStatistics.
+
+        Args:
+            size: The number of numbers of the level.
+            dense_limit: The largest level stored with one slot per number.
+        """
+
+        self.dense = size <= dense_limit
+        length = size if self.dense else 0
+        self.slots = None if self.dense else {}  # number -> slot (sparse levels only)
+
+        self.correct = array("I", [0]) * length
+        self.wrong = array("I", [0]) * length
+        self.streak = array("H", [0]) * length
+        self.last_seen = array("d", [0]) * length
+        self.version = array("I", [0]) * length  # Invalidates the outdated entries of the review queue
+
+    def slot(self, item: int) -> int:
+        """
+        Returns the slot of a number, allocating it for sparse levels.
+
+        Args:
+            item: The number.
+
+        Returns:
+            int: The index of the number in the arrays.
+        """
+
+        if self.dense:
+            return item
+
+        slot = self.slots.get(item)
+        if slot is None:
+            slot = self.slots[item] = len(self.correct)
+            for column in (self.correct, self.wrong, self.streak, self.last_seen, self.version):
+                column.append(0)
+        return slot
+
+    def __len__(self) -> int:
+        """
+        Returns the number of slots.
+
+        Returns:
+            int: The number of numbers with statistics.
+        """
+
+        return len(self.correct)
+
+
+class ReviewScheduler:
+    """
+    Represents an adaptive spaced-repetition scheduler of the numbers of a level.
+
+    Each answered number is given a due time: the more often it was answered wrong, the sooner it comes back,
+    and every correct answer in a row doubles its review interval. The due numbers are served from a priority
+    queue, the most overdue first. When no number is due, a new number is drawn from the non-repeating sampler.
+    """
+
+    def __init__(
+        self,
+        upper: int,
+        sampler: Optional[NumberSampler] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the ReviewScheduler.
+
+        Args:
+            upper: The largest number of the level (included).
+            sampler: The sampler of the new numbers. Defaults to a new NumberSampler.
+            clock: The clock of the review times, in seconds.
+        """
+
+        self.sampler = sampler or NumberSampler(upper)
+        self.clock = clock
+        self.statistics = ItemStatistics(upper + 1)
+        self.queue = []  # (due time, version, number), a heap
+        self.last = None
+
+    def next_item(self) -> int:
+        """
+        Returns the next number to ask: the most overdue number, or a new one when no number is due.
+
+        The same number is never asked twice in a row.
+
+        Returns:
+            int: The next number.
+        """
+
+        statistics = self.statistics
+        while self.queue:
+            due, version, item = self.queue[0]
+            if version != statistics.version[statistics.slot(item)]:
+                heapq.heappop(self.queue)  # Outdated by a later answer
+                continue
+            if due <= self.clock() and item != self.last:
+                heapq.heappop(self.queue)
+                self.last = item
+                return item
+            break
+
+        item = self.sampler.draw()
+        if item == self.last and self.sampler.size > 1:
+            item = self.sampler.draw()
+        self.last = item
+        return item
+
+    def record(self, item: int, correct: bool) -> None:
+        """
+        Record an answer and schedule the next review of the number.
+
+        Args:
+            item: The asked number.
+            correct: Whether the answer was correct.
+
+        Returns:
+            None
+        """
+
+        statistics = self.statistics
+        slot = statistics.slot(item)
+
+        if correct:
+            statistics.correct[slot] += 1
+            statistics.streak[slot] = min(
+                statistics.streak[slot] + 1, REVIEW_MAX_STREAK)
+        else:
+            statistics.wrong[slot] += 1
+            statistics.streak[slot] = 0
+
+        now = self.clock()
+        statistics.last_seen[slot] = now
+        statistics.version[slot] += 1
+
+        answers = statistics.correct[slot] + statistics.wrong[slot]
+        error_rate = statistics.wrong[slot] / answers
+        interval = REVIEW_BASE_INTERVAL * (2 ** statistics.streak[slot]) / \
+            (1 + REVIEW_ERROR_WEIGHT * error_rate)
+        heapq.heappush(self.queue, (now + interval,
+                       statistics.version[slot], item))
+
+    def stats(self) -> dict:
+        """
+        Returns the statistics of the scheduler.
+
+        Returns:
+            dict: The number of answered numbers, of pending reviews, and of correct and wrong answers.
+        """
+
+        return {
+            "items": sum(1 for version in self.statistics.version if version),
+            "queued": len(self.queue),
+            "correct": sum(self.statistics.correct),
+            "wrong": sum(self.statistics.wrong),
+        }
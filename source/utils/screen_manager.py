@@ -0,0 +1,160 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Screen Manager
+"""
+
+import tkinter as tk
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional
+
+from _constants import SCREEN_CACHE_SIZE
+
+
+class ScreenManager:
+    """
+    Represents the manager of the screens shown in the main area of the window.
+
+    The ScreenManager class keeps the most recently shown screens alive and switches between them
+    with `grid_remove` and `grid`, so that going back to a screen does not build it again. The least recently
+    shown screens are destroyed beyond the capacity. Screens holding the state of a session (the games)
+    are shown without caching, and destroyed as soon as another screen is shown.
+    """
+
+    def __init__(self, master: tk.Widget, row: int, column: int, capacity: int = SCREEN_CACHE_SIZE):
+        """
+        Initialize the ScreenManager.
+
+        Args:
+            master: The widget holding the screens.
+            row: The grid row of the screens in the master widget.
+            column: The grid column of the screens in the master widget.
+            capacity: The largest number of screens kept alive.
+        """
+
+        self.master = master
+        self.row = row
+        self.column = column
+        self.capacity = capacity
+
+        self.screens: "OrderedDict[Hashable, tk.Widget]" = OrderedDict()
+        self.current: Optional[tk.Widget] = None
+        self.prebuild_ids = {}  # key -> pending idle callback
+        self.hits = 0
+        self.builds = 0
+
+    def show(self, key: Hashable, build: Callable[[], tk.Widget], cache: bool = True) -> tk.Widget:
+        """
+        Show a screen, built only if it is not alive yet.
+
+        Args:
+            key: The identifier of the screen.
+            build: The function building the screen in the master widget.
+            cache: Whether the screen is kept alive once another screen is shown.
+
+        Returns:
+            tk.Widget: The shown screen.
+        """
+
+        self.hide_current()
+
+        screen = self.screens.get(key) if cache else None
+        if screen is not None:
+            self.hits += 1
+            self.screens.move_to_end(key)
+        else:
+            self.cancel_prebuild(key)
+            screen = self.build(key, build, cache)
+
+        screen.grid(row=self.row, column=self.column, sticky=tk.NSEW)
+        self.current = screen
+        return screen
+
+    def hide_current(self) -> None:
+        """
+        Hide the current screen, and destroy it if it is not cached.
+
+        Returns:
+            None
+        """
+
+        if self.current is None:
+            return
+
+        if self.current in self.screens.values():
+            self.current.grid_remove()
+        else:
+            self.current.destroy()
+        self.current = None
+
+    def build(self, key: Hashable, build: Callable[[], tk.Widget], cache: bool) -> tk.Widget:
+        """
+        Build a screen and keep it alive if it is cached, destroying the least recently shown screens.
+
+        Args:
+            key: The identifier of the screen.
+            build: The function building the screen in the master widget.
+            cache: Whether the screen is kept alive.
+
+        Returns:
+            tk.Widget: The built screen.
+        """
+
+        self.builds += 1
+        screen = build()
+        if cache:
+            self.screens[key] = screen
+            while len(self.screens) > self.capacity:
+                _, evicted = self.screens.popitem(last=False)
+                if evicted is not self.current:
+                    evicted.destroy()
+
+        return screen
+
+    def prebuild(self, key: Hashable, build: Callable[[], tk.Widget]) -> None:
+        """
+        Build a screen likely to be shown next once the window is idle, without showing it.
+
+        Args:
+            key: The identifier of the screen.
+            build: The function building the screen in the master widget.
+
+        Returns:
+            None
+        """
+
+        if key in self.screens or key in self.prebuild_ids:
+            return
+
+        def run():
+            del self.prebuild_ids[key]
+            if key not in self.screens:
+                self.build(key, build, cache=True)
+
+        self.prebuild_ids[key] = self.master.after_idle(run)
+
+    def cancel_prebuild(self, key: Hashable) -> None:
+        """
+        Cancel the pending prebuild of a screen.
+
+        Args:
+            key: The identifier of the screen.
+
+        Returns:
+            None
+        """
+
+        prebuild_id = self.prebuild_ids.pop(key, None)
+        if prebuild_id is not None:
+            self.master.after_cancel(prebuild_id)
+
+    def stats(self) -> dict:
+        """
+        Returns the statistics of the manager.
+
+        Returns:
+            dict: The number of screens alive, of screens shown again without building, and of builds.
+        """
+
+        return {"screens": len(self.screens), "hits": self.hits, "builds": self.builds}
@@ -0,0 +1,376 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tracing
+"""
+
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+import traceback
+from typing import Optional
+
+from _constants import TRACE_ENV_VAR, TRACE_OWNER_ENV_VAR
+
+
+class Tracer:
+    """
+    Represents a writer of trace events in the Chrome trace event format.
+
+    The Tracer class writes one event per line into a JSON array that is never closed, which the Chrome
+    trace viewer (chrome://tracing) and Perfetto (ui.perfetto.dev) read as is, even if the application
+    is killed. Timestamps are in microseconds since the tracer started.
+    The events are written with `allow_nan=False`: an infinite or NaN argument is written as a string,
+    since the JSON parsers of the viewers reject them.
+    """
+
+    def __init__(self, path: str, line_buffered: bool = False):
+        """
+        Initialize the Tracer.
+
+        Args:
+            path: The path of the trace file, overwritten.
+            line_buffered: Whether each event is written to the file at once, rather than when the buffer is full.
+        """
+
+        self.path = path
+        self.file = open(path, "w", buffering=1 if line_buffered else -1, encoding="utf-8")
+        self.file.write("[\n")
+        self.lock = threading.Lock()
+        self.start = time.perf_counter_ns()
+        self.pid = os.getpid()
+        self.threads = set()  # Threads whose name has been written
+
+    def now(self) -> int:
+        """
+        Returns the current timestamp.
+
+        Returns:
+            int: The time since the tracer started, in microseconds.
+        """
+
+        return (time.perf_counter_ns() - self.start) // 1000
+
+    def write(self, event: dict) -> None:
+        """
+        Write an event, named after the current thread.
+
+        Args:
+            event: The event, without its process and thread.
+
+        Returns:
+            None
+        """
+
+        thread = threading.current_thread()
+        event["pid"] = self.pid
+        event["tid"] = thread.ident
+        try:
+            line = json.dumps(event, default=str, allow_nan=False)
+        except ValueError:  # An infinite or NaN float argument
+            event["args"] = {key: str(value) for key, value in event.get("args", {}).items()}
+            line = json.dumps(event, default=str, allow_nan=False)
+
+        with self.lock:
+            if self.file.closed:
+                return
+            if thread.ident not in self.threads:
+                self.threads.add(thread.ident)
+                self.file.write(json.dumps({"name": "thread_name", "ph": "M", "pid": self.pid, "tid": thread.ident,
+                                            "args": {"name": thread.name}}) + ",\n")
+            self.file.write(line + ",\n")
+
+    def flush(self) -> None:
+        """
+        Flush the trace file, and hold the lock until `release` is called (before a fork).
+
+        Returns:
+            None
+        """
+
+        self.lock.acquire()
+        if not self.file.closed:
+            self.file.flush()
+
+    def release(self) -> None:
+        """
+        Release the lock held since `flush` (after a fork).
+
+        Returns:
+            None
+        """
+
+        self.lock.release()
+
+    def close(self) -> None:
+        """
+        Flush and close the trace file.
+
+        Returns:
+            None
+        """
+
+        with self.lock:
+            if not self.file.closed:
+                self.file.close()
+
+
+class Span:
+    """
+    Represents a timed operation, written as a complete event when it ends.
+    """
+
+    def __init__(self, tracer: Tracer, name: str, category: str, args: dict):
+        """
+        Initialize the Span.
+
+        Args:
+            tracer: The tracer writing the span.
+            name: The name of the operation.
+            category: The category of the operation (screen, image, tts, audio, game, ...).
+            args: The arguments of the operation.
+        """
+
+        self.tracer = tracer
+        self.event = {"name": name, "cat": category, "ph": "X", "args": args}
+
+    def __enter__(self) -> "Span":
+        """
+        Start the span.
+
+        Returns:
+            Span: The span.
+        """
+
+        self.event["ts"] = self.tracer.now()
+        return self
+
+    def __exit__(self, exc_type, exc_value, _traceback) -> None:
+        """
+        End the span and write it, with the error that ended it, if any.
+
+        Returns:
+            None
+        """
+
+        self.event["dur"] = self.tracer.now() - self.event["ts"]
+        if exc_type:
+            self.event["args"]["error"] = repr(exc_value)
+        self.tracer.write(self.event)
+
+    def set(self, **args) -> None:
+        """
+        Add arguments to the span, known once the operation is done.
+
+        Args:
+            **args: The arguments.
+
+        Returns:
+            None
+        """
+
+        self.event["args"].update(args)
+
+
+class NullSpan:
+    """
+    Represents a span that records nothing, used when tracing is disabled.
+    """
+
+    def __enter__(self) -> "NullSpan":
+        """
+        Returns the span itself.
+
+        Returns:
+            NullSpan: The span.
+        """
+
+        return self
+
+    def __exit__(self, *_exc_info) -> None:
+        """
+        Do nothing.
+
+        Returns:
+            None
+        """
+
+    def set(self, **args) -> None:
+        """
+        Ignore the arguments.
+
+        Args:
+            **args: The arguments.
+
+        Returns:
+            None
+        """
+
+
+NULL_SPAN = NullSpan()
+
+
+def trace_path(path: str) -> str:
+    """
+    Returns the trace file of the current process.
+
+    The first process tracing writes the trace file itself and records its pid in the environment:
+    the processes it starts (spawned or forked workers, tools) inherit the variable and each write
+    their own file next to it, instead of truncating the trace of the application.
+
+    Args:
+        path (str): The trace path, from the TRACE_ENV_VAR environment variable.
+
+    Returns:
+        str: The trace file of the process.
+
+    Examples:
+        >>> trace_path("trace.json")  # In a worker process of pid 4242
+        'trace.4242.json'
+    """
+
+    pid = str(os.getpid())
+    if os.environ.setdefault(TRACE_OWNER_ENV_VAR, pid) == pid:
+        return path
+
+    root, extension = os.path.splitext(path)
+    return f"{root}.{pid}{extension}"
+
+
+def create_tracer() -> Optional[Tracer]:
+    """
+    Create the tracer if tracing is enabled by the TRACE_ENV_VAR environment variable (set to the trace path).
+
+    Returns:
+        Optional[Tracer]: The tracer, or None if tracing is disabled or the trace file cannot be written.
+    """
+
+    path = os.environ.get(TRACE_ENV_VAR)
+    if not path:
+        return None
+    process_path = trace_path(path)
+
+    try:
+        # The workers of a process pool exit without running atexit: their events are written line by line
+        tracer = Tracer(process_path, line_buffered=process_path != path)
+    except OSError as error:
+        print(f"Tracing disabled: {error!r}", file=sys.stderr)
+        return None
+
+    atexit.register(tracer.close)
+    return tracer
+
+
+def flush_before_fork() -> None:
+    """
+    Flush the trace before a fork, so that the child does not inherit buffered events of the parent.
+
+    Returns:
+        None
+    """
+
+    if tracer is not None:
+        tracer.flush()
+
+
+def release_after_fork() -> None:
+    """
+    Release the trace after a fork, in the parent.
+
+    Returns:
+        None
+    """
+
+    if tracer is not None:
+        tracer.release()
+
+
+def reopen_after_fork() -> None:
+    """
+    Trace a forked child into its own file.
+
+    Returns:
+        None
+    """
+
+    global tracer
+    if tracer is not None:
+        tracer.release()
+        tracer = create_tracer()
+
+
+# The tracer of the process, None when tracing is disabled
+tracer = create_tracer()
+
+if hasattr(os, "register_at_fork"):  # Not on Windows, where the workers are spawned
+    os.register_at_fork(before=flush_before_fork, after_in_parent=release_after_fork,
+                        after_in_child=reopen_after_fork)
+
+
+def span(name: str, category: str, **args) -> Span:
+    """
+    Returns a context manager timing an operation.
+
+    Args:
+        name (str): The name of the operation.
+        category (str): The category of the operation.
+        **args: The arguments of the operation.
+
+    Returns:
+        Span: The span, or NULL_SPAN if tracing is disabled.
+
+    Examples:
+        >>> with span("show screen", "screen", key="main") as screen_span:
+        ...     screen_span.set(built=True)
+    """
+
+    if tracer is None:
+        return NULL_SPAN
+    return Span(tracer, name, category, args)
+
+
+def instant(name: str, category: str, **args) -> None:
+    """
+    Record an event without duration.
+
+    Args:
+        name (str): The name of the event.
+        category (str): The category of the event.
+        **args: The arguments of the event.
+
+    Returns:
+        None
+
+    Examples:
+        >>> instant("subject selected", "navigation", subject="mathematics")
+    """
+
+    if tracer is not None:
+        tracer.write({"name": name, "cat": category, "ph": "i", "s": "t", "ts": tracer.now(), "args": args})
+
+
+def error(message: str, category: str, **args) -> None:
+    """
+    Report an error: print it, and record it with the current traceback if tracing is enabled.
+
+    Args:
+        message (str): The message of the error.
+        category (str): The category of the error.
+        **args: The arguments of the error.
+
+    Returns:
+        None
+
+    Examples:
+        >>> error(f'Speech of "{text}" failed: {error!r}', "tts", text=text)
+    """
+
+    print(message, file=sys.stderr)
+    if tracer is not None:
+        if sys.exc_info()[0] is not None:
+            args["traceback"] = traceback.format_exc()
+        instant(message, category, **args)
@@ -0,0 +1,75 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+User Directories
+"""
+
+import os
+import sys
+
+from _constants import APP_DIR_NAME
+
+
+def user_cache_dir(name: str = "") -> str:
+    """
+    Returns the per-user cache directory of the application, creating it if needed.
+
+    Args:
+        name (str, optional): The name of a sub-directory. Defaults to "".
+
+    Returns:
+        str: The path of the cache directory.
+
+    Examples:
+        >>> user_cache_dir("tts")
+        '/home/user/.cache/Apprends_et_Joue/tts'
+    """
+
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser(
+            os.path.join("~", "AppData", "Local"))
+        path = os.path.join(base, APP_DIR_NAME, "Cache")
+    elif sys.platform == "darwin":
+        path = os.path.join(os.path.expanduser(
+            os.path.join("~", "Library", "Caches")), APP_DIR_NAME)
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser(
+            os.path.join("~", ".cache"))
+        path = os.path.join(base, APP_DIR_NAME)
+
+    path = os.path.join(path, name) if name else path
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def user_data_dir(name: str = "") -> str:
+    """
+    Returns the per-user data directory of the application (kept data, unlike the cache), creating it if needed.
+
+    Args:
+        name (str, optional): The name of a sub-directory. Defaults to "".
+
+    Returns:
+        str: The path of the data directory.
+
+    Examples:
+        >>> user_data_dir()
+        '/home/user/.local/share/Apprends_et_Joue'
+    """
+
+    if sys.platform == "win32":
+        base = os.environ.get("APPDATA") or os.path.expanduser(
+            os.path.join("~", "AppData", "Roaming"))
+        path = os.path.join(base, APP_DIR_NAME)
+    elif sys.platform == "darwin":
+        path = os.path.join(os.path.expanduser(
+            os.path.join("~", "Library", "Application Support")), APP_DIR_NAME)
+    else:
+        base = os.environ.get("XDG_DATA_HOME") or os.path.expanduser(
+            os.path.join("~", ".local", "share"))
+        path = os.path.join(base, APP_DIR_NAME)
+
+    path = os.path.join(path, name) if name else path
+    os.makedirs(path, exist_ok=True)
+    return path
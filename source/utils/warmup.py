@@ -0,0 +1,186 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Warm-up
+"""
+
+import queue
+import threading
+import tkinter as tk
+from collections import deque
+from typing import Callable, Optional
+
+from _constants import WARMUP_POLL_INTERVAL
+from utils import tracing
+
+
+class Warmup:
+    """
+    Represents the warm-up of the subsystems, run while the window is already shown.
+
+    The Warmup class runs background steps one after the other on a worker thread (speech backend, audio initialization,
+    synthesis), and steps that need the Tk thread (images) one per idle callback, so that the window stays
+    responsive. Progress is reported on the Tk thread, and the warm-up can be cancelled between two steps.
+    """
+
+    def __init__(self, master: tk.Tk, on_progress: Optional[Callable[[int, int, str], None]] = None):
+        """
+        Initialize the Warmup.
+
+        Args:
+            master: The main window, used to run the steps and report the progress on the Tk thread.
+            on_progress: The function called after each step with the number of finished steps,
+                the total number of steps and the label of the finished step.
+        """
+
+        self.master = master
+        self.on_progress = on_progress
+
+        self.foreground_steps = deque()  # (label, function), run on the Tk thread
+        self.background_steps = deque()  # (label, function), run on the worker thread
+        self.results = queue.Queue()  # Labels of the finished background steps
+        self.cancelled = threading.Event()
+
+        self.total = 0
+        self.done = 0
+        self.thread = None
+        self.idle_id = None
+        self.poll_id = None
+
+    def add(self, label: str, function: Callable[[], None], background: bool = False) -> None:
+        """
+        Add a step to the warm-up, before it is started.
+
+        Args:
+            label: The name of the step, reported with the progress.
+            function: The function of the step.
+            background: Whether the step runs on the worker thread (it must not use Tk).
+
+        Returns:
+            None
+        """
+
+        (self.background_steps if background else self.foreground_steps).append((label, function))
+        self.total += 1
+
+    def start(self) -> None:
+        """
+        Start the warm-up.
+
+        Returns:
+            None
+        """
+
+        self.thread = threading.Thread(target=self.run_background, name="warmup", daemon=True)
+        self.thread.start()
+        self.idle_id = self.master.after_idle(self.run_foreground)
+        self.poll_id = self.master.after(WARMUP_POLL_INTERVAL, self.poll)
+
+    def cancel(self) -> None:
+        """
+        Cancel the steps not started yet. The running background step, if any, is not interrupted.
+
+        Returns:
+            None
+        """
+
+        self.cancelled.set()
+        for after_id in (self.idle_id, self.poll_id):
+            if after_id:
+                self.master.after_cancel(after_id)
+        self.idle_id = self.poll_id = None
+
+    @property
+    def finished(self) -> bool:
+        """
+        Check whether every step is finished.
+
+        Returns:
+            bool: True if the warm-up is finished, False otherwise.
+        """
+
+        return self.done == self.total
+
+    @staticmethod
+    def run_step(label: str, function: Callable[[], None]) -> None:
+        """
+        Run a step, a failure only skipping this step.
+
+        Args:
+            label: The name of the step.
+            function: The function of the step.
+
+        Returns:
+            None
+        """
+
+        try:
+            with tracing.span(label, "warmup"):
+                function()
+        except Exception as error:  # The subsystem is initialized again when it is first needed
+            tracing.error(f'Warm-up step "{label}" failed: {error!r}', "warmup", step=label)
+
+    def run_background(self) -> None:
+        """
+        Run the background steps on the worker thread.
+
+        Returns:
+            None
+        """
+
+        while self.background_steps and not self.cancelled.is_set():
+            label, function = self.background_steps.popleft()
+            self.run_step(label, function)
+            self.results.put(label)
+
+    def run_foreground(self) -> None:
+        """
+        Run the next step needing the Tk thread, and schedule the following one on the next idle time.
+
+        Returns:
+            None
+        """
+
+        self.idle_id = None
+        if not self.foreground_steps or self.cancelled.is_set():
+            return
+
+        label, function = self.foreground_steps.popleft()
+        self.run_step(label, function)
+        self.step_done(label)
+        self.idle_id = self.master.after_idle(self.run_foreground)
+
+    def poll(self) -> None:
+        """
+        Report the progress of the background steps, until they are all finished.
+
+        Returns:
+            None
+        """
+
+        self.poll_id = None
+        while True:
+            try:
+                label = self.results.get_nowait()
+            except queue.Empty:
+                break
+            self.step_done(label)
+
+        if self.thread.is_alive() or not self.results.empty():
+            self.poll_id = self.master.after(WARMUP_POLL_INTERVAL, self.poll)
+
+    def step_done(self, label: str) -> None:
+        """
+        Report a finished step.
+
+        Args:
+            label: The name of the step.
+
+        Returns:
+            None
+        """
+
+        self.done += 1
+        if self.on_progress:
+            self.on_progress(self.done, self.total, label)
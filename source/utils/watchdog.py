@@ -0,0 +1,183 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Watchdog
+"""
+
+import bisect
+import sys
+import threading
+import time
+import tkinter as tk
+import traceback
+from typing import List, Optional
+
+from _constants import WATCHDOG_INTERVAL, WATCHDOG_THRESHOLD
+from utils import tracing
+
+# Upper bounds (ms) of the buckets of the lag histogram, the last bucket holds the larger lags
+LAG_BUCKETS: List[float] = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000]
+
+
+class Watchdog:
+    """
+    Represents a watchdog of the Tk event loop.
+
+    The Watchdog class schedules a heartbeat on the event loop and measures how late each beat fires,
+    in a histogram of the lags. A helper thread checks the heartbeat: when it is late by more than the threshold,
+    the event loop is blocked, and the stack of the main thread is captured while it is still blocked,
+    so that the freeze is reported with the code causing it.
+    """
+
+    def __init__(self, master: tk.Tk, interval: int = WATCHDOG_INTERVAL, threshold: int = WATCHDOG_THRESHOLD):
+        """
+        Initialize the Watchdog.
+
+        Args:
+            master: The main window, whose event loop is watched.
+            interval: The delay between two heartbeats, in milliseconds.
+            threshold: The lag from which the event loop is considered frozen, in milliseconds.
+        """
+
+        self.master = master
+        self.interval = interval
+        self.threshold = threshold
+
+        self.histogram = [0] * (len(LAG_BUCKETS) + 1)
+        self.max_lag = 0.0
+        self.freezes = 0
+
+        self.main_thread_id = threading.main_thread().ident
+        self.expected = 0.0  # When the next heartbeat is due (time.perf_counter)
+        self.frozen = False  # Whether the current freeze has been reported
+        self.after_id = None
+        self.stopped = threading.Event()
+        self.thread = None
+
+    def start(self) -> None:
+        """
+        Start the heartbeat and the helper thread.
+
+        Returns:
+            None
+        """
+
+        self.schedule()
+        self.thread = threading.Thread(target=self.watch, name="watchdog", daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop the heartbeat and the helper thread.
+
+        Returns:
+            None
+        """
+
+        self.stopped.set()
+        if self.after_id:
+            self.master.after_cancel(self.after_id)
+            self.after_id = None
+
+    def schedule(self) -> None:
+        """
+        Schedule the next heartbeat.
+
+        Returns:
+            None
+        """
+
+        self.expected = time.perf_counter() + self.interval / 1000
+        self.after_id = self.master.after(self.interval, self.beat)
+
+    def beat(self) -> None:
+        """
+        Record the lag of the heartbeat (Tk thread), and schedule the next one.
+
+        Returns:
+            None
+        """
+
+        lag = max((time.perf_counter() - self.expected) * 1000, 0.0)
+        self.histogram[bisect.bisect_left(LAG_BUCKETS, lag)] += 1
+        self.max_lag = max(self.max_lag, lag)
+
+        if self.frozen:
+            self.frozen = False
+            tracing.instant("event loop unfrozen", "watchdog", lag_ms=lag)
+
+        if not self.stopped.is_set():
+            self.schedule()
+
+    def watch(self) -> None:
+        """
+        Check the heartbeat, and report the freezes of the event loop (helper thread).
+
+        Returns:
+            None
+        """
+
+        while not self.stopped.wait(self.interval / 2000):
+            lag = (time.perf_counter() - self.expected) * 1000
+            if lag > self.threshold and not self.frozen:
+                self.frozen = True
+                self.freezes += 1
+                self.report(lag)
+
+    def report(self, lag: float) -> None:
+        """
+        Report a freeze with the current stack of the main thread.
+
+        Args:
+            lag: The lag of the heartbeat, in milliseconds.
+
+        Returns:
+            None
+        """
+
+        frame = sys._current_frames().get(self.main_thread_id)
+        stack = "".join(traceback.format_stack(frame)) if frame else ""
+        print(f"Event loop blocked for {lag:.0f} ms, in:\n{stack}", file=sys.stderr)
+        tracing.instant("event loop frozen", "watchdog", lag_ms=lag, stack=stack)
+
+    def stats(self) -> dict:
+        """
+        Returns the statistics of the watchdog.
+
+        Returns:
+            dict: The lag histogram (number of heartbeats by lag bucket), the median and 99th percentile buckets,
+                the maximum lag and the number of freezes.
+        """
+
+        bounds = [f"<={bound}ms" for bound in LAG_BUCKETS] + [f">{LAG_BUCKETS[-1]}ms"]
+        return {
+            "histogram": dict(zip(bounds, self.histogram)),
+            "p50_ms": self.percentile(0.5),
+            "p99_ms": self.percentile(0.99),
+            "max_lag_ms": self.max_lag,
+            "freezes": self.freezes,
+        }
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """
+        Returns the upper bound of the bucket holding a percentile of the lags.
+
+        Args:
+            fraction: The percentile, between 0 and 1.
+
+        Returns:
+            Optional[float]: The bound, in milliseconds (the maximum lag for the last bucket, which has no bound,
+                so that the statistics stay valid JSON), or None without heartbeat.
+        """
+
+        total = sum(self.histogram)
+        if not total:
+            return None
+
+        count = 0
+        for bound, bucket in zip(LAG_BUCKETS + [self.max_lag], self.histogram):
+            count += bucket
+            if count >= fraction * total:
+                return bound
+        return self.max_lag
@@ -0,0 +1,67 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests of the learning analytics
+"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "source"))
+
+from utils.analytics import AttemptHistory  # noqa: E402
+
+
+def mixed_history() -> AttemptHistory:
+    """
+    Returns a history mixing listening and comparison attempts.
+
+    The number 71 is heard 4 times and misheard once, 5 is heard 4 times without error,
+    and 5 is the first operand of 6 comparisons all answered wrong.
+
+    Returns:
+        AttemptHistory: The history.
+    """
+
+    game_types = ["sound-to-number", "compare", "sound-to-word"]
+    codes = [0, 0, 2, 2] + [0, 0, 2, 2] + [1] * 6
+    targets = [71] * 4 + [5] * 4 + [5] * 6
+    correct = [False, True, True, True] + [True] * 4 + [False] * 6
+    count = len(codes)
+    return AttemptHistory(
+        game_types,
+        np.arange(count, dtype=float) + 1_700_000_000,
+        np.array(codes),
+        np.full(count, 100),
+        np.array(targets),
+        np.array(correct),
+        np.full(count, 1000.0),
+    )
+
+
+def test_number_statistics_only_count_the_listening_games():
+    report = mixed_history().report()
+
+    assert report["attempts"] == 14
+    assert report["accuracy"] == 7 / 14
+    assert report["listening_attempts"] == 8
+
+    assert report["hardest"][0] == {"number": 71, "attempts": 4, "error_rate": 0.25}
+    assert {"number": 5, "attempts": 4, "error_rate": 0.0} in report["hardest"]
+
+    ranges = report["ranges"]
+    assert sum(stats["attempts"] for stats in ranges.values()) == 8
+    assert ranges["70-79"] == {"attempts": 4, "error_rate": 0.25}
+
+    assert set(report["response_ms"]) == {"sound-to-number", "sound-to-word", "compare"}
+
+
+def test_filter_game_types():
+    history = mixed_history()
+
+    assert len(history.filter_game_types(["compare"])) == 6
+    assert len(history.filter_game_types(["sound-to-word", "unknown"])) == 4
+    assert len(history.filter_game_types([])) == 0